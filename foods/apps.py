@@ -4,3 +4,11 @@ from django.apps import AppConfig
 class FoodsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'foods'
+
+    def ready(self):
+        # 인벤토리 캐시 무효화 시그널 등록
+        from foods import inventory  # noqa: F401
+        # 디폴트 음식 카탈로그 인덱스 재생성 시그널 등록
+        from foods import catalog  # noqa: F401
+        # 디폴트 음식 보관 기간 누락 검사 등록
+        from foods import checks  # noqa: F401
@@ -0,0 +1,183 @@
+"""
+디폴트 음식 카탈로그 캐시와 검색 인덱스 (프로세스 메모리)
+
+DefaultFood는 수십 건이고 거의 바뀌지 않으므로 처음 사용할 때 한 번 읽어 ID별 조회 테이블과 검색 인덱스를 만들고,
+목록/검색과 냉장고 음식 직렬화는 DB 조회 없이 메모리에서 처리합니다. DefaultFood가 변경되면 커밋 후 캐시의 카탈로그 버전을 올리고,
+각 프로세스는 버전이 바뀐 것을 확인하면 카탈로그를 다시 만듭니다.
+"""
+import logging
+import threading
+import time
+from collections import namedtuple
+
+from django.core.cache import cache
+from django.core.exceptions import SynchronousOnlyOperation
+from django.db import DatabaseError, transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from foods.models import DefaultFood
+from sigkihan.media_urls import absolute_url_prefix
+
+logger = logging.getLogger(__name__)
+
+CATALOG_VERSION_KEY = 'foods:catalog:version'
+# 다른 프로세스의 변경을 확인하는 주기(초). 요청마다 캐시를 조회하지 않도록 함
+CATALOG_VERSION_CHECK_INTERVAL = 5
+CATALOG_SEARCH_LIMIT = 20
+# 사용자 정의 음식에 연결하는 기본 식품("기타") ID
+CUSTOM_FOOD_DEFAULT_ID = 30
+# 디폴트 음식 목록 응답의 브라우저/클라이언트 캐시 시간(초). 이후에는 ETag로 재검증
+CATALOG_MAX_AGE = 300
+# 카탈로그 하나에 보관하는 호스트별 이미지 URL 목록 수 (Host 헤더가 다양해도 메모리가 늘어나지 않도록 제한)
+CATALOG_HOST_LIMIT = 16
+
+HANGUL_START = 0xAC00
+HANGUL_END = 0xD7A3
+# 한글 음절 하나당 중성(21) x 종성(28) 조합 수
+HANGUL_CHOSEONG_SPAN = 21 * 28
+CHOSEONG = 'ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ'
+CHOSEONG_SET = frozenset(CHOSEONG)
+
+
+def choseong(text):
+    """한글 음절을 초성으로 변환 (그 외 문자는 그대로)"""
+    return ''.join(
+        CHOSEONG[(ord(char) - HANGUL_START) // HANGUL_CHOSEONG_SPAN] if HANGUL_START <= ord(char) <= HANGUL_END else char
+        for char in text
+    )
+
+
+# 디폴트 음식 ID별 직렬화용 정보 (image는 MEDIA_URL 기준 상대 경로)
+CatalogEntry = namedtuple('CatalogEntry', ['name', 'image', 'comment'])
+
+
+class CatalogIndex:
+    """
+    디폴트 음식 카탈로그 (ID별 조회 테이블과 이름 검색 인덱스)
+    일반 문자는 글자 그대로, 초성(ㄱ~ㅎ)은 해당 초성으로 시작하는 음절과 비교하므로
+    "양파", "파", "ㅇㅍ", "양ㅍ" 모두 "양파"와 일치합니다.
+    순위는 완전 일치 → 접두어 일치 → 부분 일치 순이며, 같은 순위에서는 일치 위치가 앞설수록, 이름이 짧을수록 앞에 옵니다.
+    """
+
+    def __init__(self, foods, version=None):
+        self.version = version
+        # (이름 소문자, 이름 초성, 음식) 목록
+        self.entries = [(food.name.lower(), choseong(food.name.lower()), food) for food in foods]
+        self.foods = [food for _, _, food in self.entries]
+        self.by_id = {
+            food.id: CatalogEntry(food.name, food.image.url if food.image else None, food.comment)
+            for food in self.foods
+        }
+        # 호스트 접두어("scheme://host")별 디폴트 음식 ID → 이미지 절대 URL
+        self._image_urls = {}
+
+    def image_urls(self, prefix):
+        """호스트별 이미지 절대 URL 목록 (카탈로그 버전마다 호스트당 한 번만 생성)"""
+        urls = self._image_urls.get(prefix)
+        if urls is None:
+            if len(self._image_urls) >= CATALOG_HOST_LIMIT:
+                self._image_urls.clear()
+            urls = {food_id: prefix + entry.image for food_id, entry in self.by_id.items() if entry.image}
+            self._image_urls[prefix] = urls
+        return urls
+
+    @staticmethod
+    def _find(name, initials, query):
+        """초성이 섞인 검색어가 처음 일치하는 위치 (없으면 -1)"""
+        for start in range(len(name) - len(query) + 1):
+            for offset, char in enumerate(query):
+                target = initials if char in CHOSEONG_SET else name
+                if target[start + offset] != char:
+                    break
+            else:
+                return start
+        return -1
+
+    def search(self, query, limit=CATALOG_SEARCH_LIMIT):
+        query = query.strip().lower()
+        if not query:
+            return self.foods[:limit] if limit else list(self.foods)
+
+        has_choseong = not CHOSEONG_SET.isdisjoint(query)
+        query_initials = choseong(query)
+        ranked = []
+        for name, initials, food in self.entries:
+            if has_choseong:
+                # 초성 문자열에 포함되지 않으면 일치할 수 없으므로 음절 단위 비교 생략
+                position = self._find(name, initials, query) if query_initials in initials else -1
+            else:
+                position = name.find(query)
+            if position < 0:
+                continue
+            rank = 0 if len(name) == len(query) else 1 if position == 0 else 2
+            ranked.append((rank, position, len(name), name, food))
+        ranked.sort(key=lambda entry: entry[:4])
+        return [entry[4] for entry in ranked[:limit]]
+
+
+_lock = threading.Lock()
+_state = {'version': None, 'checked_at': 0.0, 'index': None}
+
+
+def get_catalog_version():
+    version = cache.get(CATALOG_VERSION_KEY)
+    if version is None:
+        # 버전 키가 만료/축출된 뒤에도 이전 버전과 겹치지 않도록 현재 시각(ms)에서 시작
+        cache.add(CATALOG_VERSION_KEY, int(time.time() * 1000), None)
+        version = cache.get(CATALOG_VERSION_KEY)
+    return version
+
+
+def bump_catalog_version():
+    """DefaultFood 변경 시 버전 증가 (모든 프로세스의 인덱스 재생성)"""
+    try:
+        cache.incr(CATALOG_VERSION_KEY)
+    except ValueError:
+        cache.add(CATALOG_VERSION_KEY, int(time.time() * 1000), None)
+    # 현재 프로세스는 확인 주기를 기다리지 않고 바로 다시 읽음
+    _state['checked_at'] = 0.0
+
+
+def get_catalog_index():
+    """현재 카탈로그 버전의 검색 인덱스 반환 (버전이 바뀌었으면 DB에서 다시 읽어 생성)"""
+    if _state['index'] is not None and time.monotonic() - _state['checked_at'] < CATALOG_VERSION_CHECK_INTERVAL:
+        return _state['index']
+
+    with _lock:
+        version = get_catalog_version()
+        if _state['index'] is None or _state['version'] != version:
+            _state['index'] = CatalogIndex(DefaultFood.objects.order_by('id'), version)
+            _state['version'] = version
+            logger.info("Built default food catalog index (version=%s, foods=%d)", version, len(_state['index'].foods))
+        _state['checked_at'] = time.monotonic()
+        return _state['index']
+
+
+def get_catalog_entry(default_food_id):
+    """디폴트 음식 ID로 (이름, 이미지 경로, 알림멘트) 조회 (없으면 None)"""
+    if default_food_id is None:
+        return None
+    return get_catalog_index().by_id.get(default_food_id)
+
+
+def get_catalog_image_url(request, default_food_id):
+    """디폴트 음식 이미지의 절대 URL (미리 계산한 호스트별 목록에서 조회)"""
+    return get_catalog_index().image_urls(absolute_url_prefix(request)).get(default_food_id)
+
+
+def warm_catalog():
+    """
+    WSGI 워커 시작 시 인덱스 미리 생성 (DB가 준비되지 않았으면 첫 요청 때 생성)
+    ASGI에서는 이벤트 루프 안에서 앱을 import하므로 호출하지 않고 첫 요청 때 생성합니다.
+    """
+    try:
+        get_catalog_index()
+    except (DatabaseError, SynchronousOnlyOperation):
+        logger.warning("Failed to preload the default food catalog; it will be built on first use.", exc_info=True)
+
+
+@receiver(post_save, sender=DefaultFood)
+@receiver(post_delete, sender=DefaultFood)
+def invalidate_catalog(sender, instance, **kwargs):
+    transaction.on_commit(bump_catalog_version)
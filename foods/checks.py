@@ -0,0 +1,39 @@
+from django.core.checks import Tags, Warning, register
+from django.db import DatabaseError
+
+from foods.models import DefaultFood, FridgeFood, ShelfLife
+from foods.shelf_life import normalize_food_name
+
+
+def missing_shelf_life():
+    """보관 기간이 저장되지 않은 (디폴트 음식 이름, 보관 방식) 목록"""
+    stored = set(ShelfLife.objects.values_list('name', 'storage_type'))
+    return [
+        (name, storage_type)
+        for name in DefaultFood.objects.order_by('id').values_list('name', flat=True)
+        for storage_type, _ in FridgeFood.STORAGE_TYPE_CHOICES
+        if (normalize_food_name(name), storage_type) not in stored
+    ]
+
+
+@register(Tags.database)
+def check_default_food_shelf_life(app_configs=None, databases=None, **kwargs):
+    """디폴트 음식마다 보관 기간이 저장되어 있는지 확인 (migrate, check --database 실행 시)"""
+    if not databases:
+        return []
+    try:
+        missing = missing_shelf_life()
+    except DatabaseError:
+        # 마이그레이션 전이라 테이블이 없는 경우
+        return []
+    if not missing:
+        return []
+    return [
+        Warning(
+            "Default foods without a stored shelf life: "
+            + ", ".join(f"{name} ({storage_type})" for name, storage_type in missing),
+            hint="Add them to the shelf_life table so expiration lookups do not fall back to the LLM.",
+            obj=ShelfLife,
+            id='foods.W001',
+        )
+    ]
@@ -0,0 +1,71 @@
+"""
+냉장고별 음식 목록(인벤토리) 캐시
+
+냉장고마다 버전 카운터를 두고, 직렬화된 음식 목록을 버전이 포함된 키로 캐시합니다.
+FridgeFood가 생성/수정/삭제(CASCADE 포함)되면 커밋 후 버전을 올리므로,
+이전 버전의 캐시는 삭제하지 않아도 더 이상 조회되지 않고 만료 시간이 지나면 사라집니다.
+"""
+import time
+from functools import partial
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from foods.catalog import get_catalog_index
+from foods.models import FridgeFood
+
+INVENTORY_VERSION_KEY = 'foods:inventory:version:{refrigerator_id}'
+INVENTORY_KEY = 'foods:inventory:{refrigerator_id}:{version}:{catalog_version}:{host}'
+INVENTORY_TIMEOUT = 60 * 60 * 24
+
+
+def _version_key(refrigerator_id):
+    return INVENTORY_VERSION_KEY.format(refrigerator_id=refrigerator_id)
+
+
+def _initial_version():
+    # 버전 키가 만료/축출된 뒤 다시 1부터 시작하면 이전 캐시와 겹칠 수 있으므로 현재 시각(ms)에서 시작
+    return int(time.time() * 1000)
+
+
+def get_inventory_version(refrigerator_id):
+    key = _version_key(refrigerator_id)
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, _initial_version(), None)
+        version = cache.get(key)
+    return version
+
+
+def bump_inventory_version(refrigerator_id):
+    """냉장고 음식 목록 변경 시 버전 증가 (이전 버전 캐시 무효화)"""
+    key = _version_key(refrigerator_id)
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.add(key, _initial_version(), None)
+
+
+def get_cached_inventory(refrigerator_id, host, build):
+    """
+    캐시된 음식 목록 반환 (없으면 build()로 만들어 현재 버전 키에 저장)
+    이미지 URL이 요청 호스트를 포함하므로 호스트별로, 디폴트 음식 이름/이미지가 바뀔 수 있으므로 카탈로그 버전별로 캐시합니다.
+    """
+    key = INVENTORY_KEY.format(
+        refrigerator_id=refrigerator_id, version=get_inventory_version(refrigerator_id),
+        catalog_version=get_catalog_index().version, host=host,
+    )
+    data = cache.get(key)
+    if data is None:
+        data = build()
+        cache.set(key, data, INVENTORY_TIMEOUT)
+    return data
+
+
+@receiver(post_save, sender=FridgeFood)
+@receiver(post_delete, sender=FridgeFood)
+def invalidate_inventory(sender, instance, **kwargs):
+    # 커밋 전에 버전을 올리면 다른 요청이 이전 데이터를 새 버전으로 캐시할 수 있으므로 커밋 후 처리
+    transaction.on_commit(partial(bump_inventory_version, instance.refrigerator_id))
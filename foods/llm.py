@@ -0,0 +1,66 @@
+"""
+비동기 OpenAI 클라이언트
+
+이벤트 루프마다 연결 풀을 공유하는 AsyncOpenAI 클라이언트와 동시 호출 수를 제한하는 세마포어를 하나씩 둡니다.
+ASGI 워커 하나가 수백 건의 LLM 호출을 동시에 기다릴 수 있고, 한도를 넘는 요청은 대기하다가 제한 시간이 지나면 거절됩니다.
+WSGI(async_to_sync)나 관리 명령처럼 호출마다 새 루프가 생기는 경우에는 루프가 끝날 때 클라이언트의 연결 풀을 닫습니다.
+"""
+import asyncio
+import weakref
+
+import httpx
+from decouple import config
+from django.conf import settings
+from openai import AsyncOpenAI
+
+
+class LLMBusyError(Exception):
+    """동시 호출 한도를 넘어 제한 시간 안에 호출하지 못함"""
+
+
+# 이벤트 루프 → (클라이언트, 세마포어, 종료 훅). 연결 풀과 세마포어는 생성된 루프에서만 사용할 수 있음
+_loop_state = weakref.WeakKeyDictionary()
+
+
+async def _close_on_loop_shutdown(client):
+    """
+    루프 종료 시 클라이언트를 닫는 비동기 제너레이터
+    asyncio.run(async_to_sync 포함)은 루프를 닫기 전에 shutdown_asyncgens()로 남아 있는 제너레이터를 정리합니다.
+    """
+    try:
+        yield
+    finally:
+        await client.close()
+
+
+async def _get_loop_state():
+    loop = asyncio.get_running_loop()
+    state = _loop_state.get(loop)
+    if state is None:
+        http_client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=settings.OPENAI_MAX_CONCURRENCY,
+                max_keepalive_connections=settings.OPENAI_MAX_CONCURRENCY,
+            ),
+            timeout=httpx.Timeout(settings.OPENAI_TIMEOUT, connect=settings.OPENAI_CONNECT_TIMEOUT),
+        )
+        client = AsyncOpenAI(api_key=config("OPENAI_API_KEY"), http_client=http_client, max_retries=1)
+        # 루프는 제너레이터를 약한 참조로만 추적하므로 상태에 함께 보관
+        closer = _close_on_loop_shutdown(client)
+        await closer.asend(None)
+        state = (client, asyncio.Semaphore(settings.OPENAI_MAX_CONCURRENCY), closer)
+        _loop_state[loop] = state
+    return state
+
+
+async def create_chat_completion(**kwargs):
+    """동시 호출 한도 안에서 chat.completions.create 호출"""
+    client, semaphore, _ = await _get_loop_state()
+    try:
+        await asyncio.wait_for(semaphore.acquire(), timeout=settings.OPENAI_QUEUE_TIMEOUT)
+    except asyncio.TimeoutError:
+        raise LLMBusyError("Too many concurrent LLM requests.")
+    try:
+        return await client.chat.completions.create(**kwargs)
+    finally:
+        semaphore.release()
@@ -0,0 +1,112 @@
+import statistics
+import time
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.utils.timezone import localdate
+
+from foods.models import FridgeFood
+from refriges.models import Refrigerator
+
+BENCH_PREFIX = 'bench'
+BATCH_SIZE = 10000
+INDEX_NAME = 'idx_fridge_food_expiration'
+
+
+def seed_fridge_foods(today, row_count, refrigerator_count):
+    """냉장고와 식품 시드 데이터 생성 (소비기한은 오늘부터 60일 사이에 분포). 냉장고 ID 목록을 반환"""
+    refrigerators = Refrigerator.objects.bulk_create(
+        [Refrigerator(name=f'{BENCH_PREFIX}-{i}') for i in range(refrigerator_count)], batch_size=BATCH_SIZE
+    )
+    refrigerator_ids = [refrigerator.id for refrigerator in refrigerators]
+
+    if connection.vendor == 'postgresql':
+        # 대량(수천만 건) 시드는 DB에서 직접 생성
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"INSERT INTO {FridgeFood._meta.db_table} "
+                "(refrigerator_id, name, storage_type, purchase_date, expiration_date, quantity) "
+                "SELECT ids[1 + i %% cardinality(ids)], %s, 'refrigerated', %s, %s + (i * 7919 %% 60)::int, 1 "
+                "FROM generate_series(0::bigint, %s - 1) AS i, (SELECT %s::int[] AS ids) AS r",
+                [f'{BENCH_PREFIX}-food', today - timedelta(days=7), today, row_count, refrigerator_ids],
+            )
+        return refrigerator_ids
+
+    batch = []
+    for i in range(row_count):
+        batch.append(FridgeFood(
+            refrigerator_id=refrigerator_ids[i % refrigerator_count],
+            name=f'{BENCH_PREFIX}-food',
+            storage_type='refrigerated',
+            purchase_date=today - timedelta(days=7),
+            expiration_date=today + timedelta(days=i * 7919 % 60),
+            quantity=1,
+        ))
+        if len(batch) >= BATCH_SIZE:
+            FridgeFood.objects.bulk_create(batch)
+            batch.clear()
+    FridgeFood.objects.bulk_create(batch)
+    return refrigerator_ids
+
+
+def access_paths(today, refrigerator_id):
+    """FridgeFood 조회 경로별 쿼리셋"""
+    foods = FridgeFood.objects.filter(refrigerator_id=refrigerator_id)
+    return [
+        ('FridgeFoodViewSet.list', foods.order_by('expiration_date')),
+        ('expiring within 3 days', foods.filter(expiration_date__lte=today + timedelta(days=3)).order_by('expiration_date')),
+    ]
+
+
+class Command(BaseCommand):
+    help = (
+        "시드 데이터에서 FridgeFood (냉장고, 소비기한) 복합 인덱스 유무에 따른 실행 계획(EXPLAIN)과 "
+        "조회 지연 시간을 비교합니다. 인덱스 삭제/재생성을 포함한 모든 변경은 롤백됩니다. "
+        "1,000만 건 이상은 PostgreSQL에서 실행하세요."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, nargs='+', default=[100_000], help='시드 식품 수 목록 (예: 100000 10000000)')
+        parser.add_argument('--foods-per-fridge', type=int, default=50, help='냉장고당 평균 식품 수')
+        parser.add_argument('--repeat', type=int, default=50, help='경로별 반복 실행 횟수')
+
+    def handle(self, *args, **options):
+        today = localdate()
+        for row_count in options['rows']:
+            self.stdout.write(self.style.MIGRATE_HEADING(f"== {row_count} rows =="))
+            with transaction.atomic():
+                refrigerator_count = max(1, row_count // options['foods_per_fridge'])
+                refrigerator_ids = seed_fridge_foods(today, row_count, refrigerator_count)
+                sample = refrigerator_ids[len(refrigerator_ids) // 2]
+
+                # 스키마 에디터 컨텍스트는 트랜잭션 안에서 사용할 수 없으므로 인덱스 DDL만 생성해 직접 실행
+                index = next(index for index in FridgeFood._meta.indexes if index.name == INDEX_NAME)
+                schema_editor = connection.SchemaEditorClass(connection)
+                with connection.cursor() as cursor:
+                    if connection.vendor == 'postgresql':
+                        # 지연된 외래 키 검사가 남아 있으면 인덱스 DDL을 실행할 수 없음
+                        cursor.execute('SET CONSTRAINTS ALL IMMEDIATE')
+                    cursor.execute(str(index.remove_sql(FridgeFood, schema_editor)))
+                self._measure('before', today, sample, options['repeat'])
+
+                with connection.cursor() as cursor:
+                    cursor.execute(str(index.create_sql(FridgeFood, schema_editor)))
+                self._measure('after', today, sample, options['repeat'])
+
+                transaction.set_rollback(True)
+
+    def _measure(self, label, today, refrigerator_id, repeat):
+        with connection.cursor() as cursor:
+            cursor.execute(f'ANALYZE {FridgeFood._meta.db_table}')
+
+        for path, queryset in access_paths(today, refrigerator_id):
+            timings = []
+            for _ in range(repeat):
+                started = time.perf_counter()
+                list(queryset.all())
+                timings.append((time.perf_counter() - started) * 1000)
+            self.stdout.write(self.style.SUCCESS(
+                f"[{label}] {path}: median={statistics.median(timings):.3f}ms max={max(timings):.3f}ms"
+            ))
+            self.stdout.write(queryset.explain())
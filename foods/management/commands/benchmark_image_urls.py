@@ -0,0 +1,84 @@
+import statistics
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.test import RequestFactory
+from django.utils.timezone import localdate
+from rest_framework.request import Request
+
+from foods.catalog import get_catalog_index
+from foods.models import DefaultFood, FridgeFood
+from foods.serializers import FridgeFoodSerializer
+
+
+def legacy_image_url(request, obj):
+    """기존 FridgeFoodSerializer.get_image_url (행마다 스토리지 URL과 build_absolute_uri 계산)"""
+    if obj.default_food and obj.default_food.image:
+        return request.build_absolute_uri(obj.default_food.image.url)
+    return None
+
+
+class Command(BaseCommand):
+    help = (
+        "냉장고 음식 목록(기본 500건) 직렬화 시 이미지 URL 계산 방식별 소요 시간을 비교합니다. "
+        "DB에 저장하지 않은 메모리 객체를 사용하며, 기존 방식의 지연 로딩 쿼리는 제외하고 측정합니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--items', type=int, default=500, help='목록 크기')
+        parser.add_argument('--repeat', type=int, default=200, help='반복 횟수')
+
+    def handle(self, *args, **options):
+        default_foods = list(DefaultFood.objects.order_by('id'))
+        if not default_foods:
+            raise CommandError("DefaultFood 데이터가 없습니다.")
+
+        today = localdate()
+        foods = [
+            FridgeFood(
+                id=i + 1,
+                refrigerator_id=1,
+                # 기존 방식도 DB 조회 없이 비교하도록 디폴트 음식 객체를 미리 연결
+                default_food=default_foods[i % len(default_foods)],
+                storage_type='refrigerated',
+                purchase_date=today,
+                expiration_date=today,
+                quantity=1,
+            )
+            for i in range(options['items'])
+        ]
+        get_catalog_index()
+        # 호스트 헤더 검증을 통과하도록 허용된 호스트 사용
+        host = next((host for host in settings.ALLOWED_HOSTS if host != '*' and not host.startswith('.')), 'localhost')
+
+        def new_request():
+            # 요청마다 접두어를 새로 계산하므로 매 반복 새 요청 사용
+            return Request(RequestFactory().get('/api/refrigerators/1/foods', HTTP_HOST=host))
+
+        paths = [
+            ('build_absolute_uri per row', lambda request: [legacy_image_url(request, food) for food in foods]),
+            ('host url map', lambda request: [
+                serializer.get_image_url(food)
+                for serializer in [FridgeFoodSerializer(context={'request': request})] for food in foods
+            ]),
+            ('FridgeFoodSerializer(many=True)', lambda request: FridgeFoodSerializer(
+                foods, many=True, context={'request': request}
+            ).data),
+        ]
+
+        legacy = paths[0][1](new_request())
+        if legacy != paths[1][1](new_request()):
+            raise CommandError("이미지 URL 결과가 기존 방식과 다릅니다.")
+
+        for label, run in paths:
+            timings = []
+            for _ in range(options['repeat']):
+                request = new_request()
+                started = time.perf_counter()
+                run(request)
+                timings.append((time.perf_counter() - started) * 1000)
+            self.stdout.write(self.style.SUCCESS(
+                f"{label} ({options['items']} items): median={statistics.median(timings):.3f}ms "
+                f"max={max(timings):.3f}ms"
+            ))
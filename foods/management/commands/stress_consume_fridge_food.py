@@ -0,0 +1,115 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.utils.timezone import localdate
+
+from foods.models import FoodHistory, FridgeFood
+from foods.services import consume_fridge_food
+from refriges.models import Refrigerator
+from users.models import CustomUser
+
+STRESS_PREFIX = 'stress'
+
+
+def naive_consume(user, refrigerator_id, fridge_food_id, action, quantity):
+    """기존 FoodHistoryView 방식 (조회 → 파이썬에서 확인/차감 → 저장) 비교용"""
+    with transaction.atomic():
+        fridge_food = FridgeFood.objects.filter(id=fridge_food_id, refrigerator_id=refrigerator_id).first()
+        if fridge_food is None or fridge_food.quantity < quantity:
+            return None
+        FoodHistory.objects.create(
+            food_name=fridge_food.name,
+            user=user,
+            refrigerator_id=refrigerator_id,
+            fridge_food=fridge_food,
+            action=action,
+            quantity=quantity
+        )
+        fridge_food.quantity -= quantity
+        if fridge_food.quantity == 0:
+            fridge_food.delete()
+        else:
+            fridge_food.save()
+        return fridge_food.quantity
+
+
+MODES = {
+    'atomic': consume_fridge_food,
+    'naive': naive_consume,
+}
+
+
+class Command(BaseCommand):
+    help = (
+        "여러 스레드에서 같은 냉장고 음식을 동시에 소비해 수량 차감 유실 여부를 검사합니다. "
+        "스레드마다 별도 DB 연결을 사용하므로 데이터가 실제로 커밋되며, 실행 후 생성한 데이터를 삭제합니다. "
+        "행 잠금 동작을 확인하려면 PostgreSQL에서 실행하세요."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--threads', type=int, default=16, help='동시 실행 스레드 수')
+        parser.add_argument('--requests', type=int, default=200, help='전체 소비 요청 수')
+        parser.add_argument('--quantity', type=int, default=150, help='음식 초기 수량 (요청 수보다 작으면 일부 요청은 실패해야 함)')
+        parser.add_argument('--mode', choices=sorted(MODES), nargs='+', default=['atomic'], help='검사할 차감 방식')
+
+    def handle(self, *args, **options):
+        today = localdate()
+        user = CustomUser.objects.create(email=f'{STRESS_PREFIX}-{time.time_ns()}@sigkihan.local', name=STRESS_PREFIX, image=None)
+        refrigerator = Refrigerator.objects.create(name=STRESS_PREFIX)
+        failed = False
+        try:
+            for mode in options['mode']:
+                fridge_food = FridgeFood.objects.create(
+                    refrigerator=refrigerator,
+                    name=f'{STRESS_PREFIX}-food',
+                    storage_type='refrigerated',
+                    purchase_date=today,
+                    expiration_date=today,
+                    quantity=options['quantity'],
+                )
+                failed |= not self._run(mode, user, refrigerator.id, fridge_food.id, options)
+        finally:
+            refrigerator.delete()
+            user.delete()
+
+        if failed:
+            self.stderr.write(self.style.ERROR("Lost updates detected."))
+
+    def _run(self, mode, user, refrigerator_id, fridge_food_id, options):
+        consume = MODES[mode]
+        errors = []
+        lock = threading.Lock()
+
+        def worker(_):
+            try:
+                return consume(user, refrigerator_id, fridge_food_id, 'consumed', 1)
+            except Exception as e:
+                with lock:
+                    errors.append(e)
+                return None
+            finally:
+                connection.close()
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=options['threads']) as executor:
+            results = list(executor.map(worker, range(options['requests'])))
+        elapsed = time.perf_counter() - started
+
+        succeeded = sum(result is not None for result in results)
+        remaining = FridgeFood.objects.filter(id=fridge_food_id).values_list('quantity', flat=True).first() or 0
+        histories = FoodHistory.objects.filter(refrigerator_id=refrigerator_id, food_name=f'{STRESS_PREFIX}-food').count()
+        FoodHistory.objects.filter(refrigerator_id=refrigerator_id).delete()
+
+        # 성공한 요청 수 = 기록 수 = 감소한 수량이어야 함
+        consistent = succeeded == histories == options['quantity'] - remaining
+        style = self.style.SUCCESS if consistent else self.style.ERROR
+        self.stdout.write(style(
+            f"[{mode}] requests={options['requests']} succeeded={succeeded} histories={histories} "
+            f"remaining={remaining} errors={len(errors)} elapsed={elapsed:.2f}s"
+        ))
+        for error in errors[:5]:
+            self.stdout.write(f"  {type(error).__name__}: {error}")
+        return consistent
@@ -0,0 +1,18 @@
+# Generated by Django 5.0.3 on 2026-10-17 18:06
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('foods', '0005_foodhistory_idx_refrigerator_foodhistory_idx_user_and_more'),
+        ('refriges', '0004_alter_refrigeratorinvitation_code'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='fridgefood',
+            index=models.Index(fields=['refrigerator', 'expiration_date'], name='idx_fridge_food_expiration'),
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 5.0.3 on 2026-10-17 18:18
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('foods', '0006_fridge_food_expiration_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ShelfLife',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(help_text='공백 제거, 소문자로 정규화한 이름', max_length=100, verbose_name='식품 이름')),
+                ('storage_type', models.CharField(choices=[('refrigerated', '냉장'), ('frozen', '냉동'), ('room_temp', '실온')], max_length=20, verbose_name='보관 방식')),
+                ('days', models.PositiveIntegerField(help_text='구매(제조)일로부터 소비기한까지 일수', verbose_name='소비기한(일)')),
+                ('source', models.CharField(choices=[('seed', 'Seed'), ('llm', 'LLM')], default='llm', max_length=10, verbose_name='출처')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='생성 시간')),
+            ],
+            options={
+                'verbose_name': '식품 보관 기간',
+                'verbose_name_plural': '식품 보관 기간',
+                'db_table': 'shelf_life',
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='shelflife',
+            constraint=models.UniqueConstraint(fields=('name', 'storage_type'), name='unique_shelf_life'),
+        ),
+    ]
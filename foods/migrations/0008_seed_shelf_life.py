@@ -0,0 +1,75 @@
+# Generated by Django 5.0.3 on 2026-10-17 18:20
+
+from django.db import migrations
+
+# 디폴트 음식별 (냉장, 냉동, 실온) 보관 기간(일). 실온 보관이 권장되지 않는 식품은 0(당일)
+SHELF_LIFE_DAYS = {
+    '양파': (30, 180, 30),
+    '감자': (30, 180, 30),
+    '양배추': (14, 60, 3),
+    '김치류': (90, 180, 2),
+    '우유': (10, 30, 0),
+    '돼지고기': (3, 180, 0),
+    '소고기': (4, 180, 0),
+    '닭고기': (2, 180, 0),
+    '고등어': (2, 90, 0),
+    '청경채': (7, 30, 1),
+    '계란': (30, 90, 14),
+    '소시지': (14, 60, 1),
+    '밥': (3, 30, 1),
+    '두부': (7, 30, 0),
+    '오징어': (2, 90, 0),
+    '조개': (2, 90, 0),
+    '배추': (14, 60, 3),
+    '무': (14, 60, 7),
+    '마늘': (30, 180, 14),
+    '대파': (14, 60, 3),
+    '고추': (14, 180, 3),
+    '된장': (365, 730, 180),
+    '간장': (730, 730, 365),
+    '고추장': (365, 730, 180),
+    '참기름': (180, 365, 180),
+    '들기름': (90, 180, 30),
+    '고구마': (7, 180, 30),
+    '사과': (30, 180, 7),
+    '오렌지': (21, 180, 7),
+    '피망': (10, 60, 3),
+    '바나나': (5, 90, 5),
+    '빵': (5, 90, 3),
+    '브로콜리': (7, 180, 2),
+    '옥수수': (3, 180, 1),
+    '가지': (7, 90, 3),
+    '오이': (7, 30, 2),
+    '당근': (21, 180, 5),
+    '딸기': (5, 180, 1),
+    '토마토': (10, 60, 5),
+}
+STORAGE_TYPES = ('refrigerated', 'frozen', 'room_temp')
+
+
+def seed_shelf_life(apps, schema_editor):
+    ShelfLife = apps.get_model('foods', 'ShelfLife')
+    ShelfLife.objects.bulk_create(
+        [
+            ShelfLife(name=name, storage_type=storage_type, days=days, source='seed')
+            for name, durations in SHELF_LIFE_DAYS.items()
+            for storage_type, days in zip(STORAGE_TYPES, durations)
+        ],
+        ignore_conflicts=True,
+    )
+
+
+def unseed_shelf_life(apps, schema_editor):
+    ShelfLife = apps.get_model('foods', 'ShelfLife')
+    ShelfLife.objects.filter(source='seed').delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('foods', '0007_shelf_life'),
+    ]
+
+    operations = [
+        migrations.RunPython(seed_shelf_life, unseed_shelf_life),
+    ]
@@ -0,0 +1,72 @@
+# Generated by Django 5.0.3 on 2026-10-17 18:21
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def backfill_food_history_snapshot(apps, schema_editor):
+    """아직 식품이 남아 있는 기존 기록에 식품 정보 복사"""
+    FoodHistory = apps.get_model('foods', 'FoodHistory')
+    FridgeFood = apps.get_model('foods', 'FridgeFood')
+    food = FridgeFood.objects.filter(id=OuterRef('fridge_food_id'))
+    FoodHistory.objects.filter(fridge_food__isnull=False).update(
+        default_food_id=Subquery(food.values('default_food_id')[:1]),
+        storage_type=Subquery(food.values('storage_type')[:1]),
+        purchase_date=Subquery(food.values('purchase_date')[:1]),
+        expiration_date=Subquery(food.values('expiration_date')[:1]),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('foods', '0008_seed_shelf_life'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='foodhistory',
+            name='default_food',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='food_histories', to='foods.defaultfood', verbose_name='기본 식품'),
+        ),
+        migrations.AddField(
+            model_name='foodhistory',
+            name='expiration_date',
+            field=models.DateField(blank=True, null=True, verbose_name='소비기한'),
+        ),
+        migrations.AddField(
+            model_name='foodhistory',
+            name='purchase_date',
+            field=models.DateField(blank=True, null=True, verbose_name='구매 날짜'),
+        ),
+        migrations.AddField(
+            model_name='foodhistory',
+            name='storage_type',
+            field=models.CharField(blank=True, choices=[('refrigerated', '냉장'), ('frozen', '냉동'), ('room_temp', '실온')], max_length=20, null=True, verbose_name='보관 방식'),
+        ),
+        migrations.CreateModel(
+            name='ShelfLifeStat',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('storage_type', models.CharField(choices=[('refrigerated', '냉장'), ('frozen', '냉동'), ('room_temp', '실온')], max_length=20, verbose_name='보관 방식')),
+                ('sample_count', models.PositiveIntegerField(verbose_name='표본 수')),
+                ('median_days', models.FloatField(verbose_name='폐기까지 일수 중앙값')),
+                ('p25_days', models.FloatField(verbose_name='폐기까지 일수 25백분위')),
+                ('p75_days', models.FloatField(verbose_name='폐기까지 일수 75백분위')),
+                ('p90_days', models.FloatField(verbose_name='폐기까지 일수 90백분위')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='집계 시간')),
+                ('default_food', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='shelf_life_stats', to='foods.defaultfood', verbose_name='기본 식품')),
+            ],
+            options={
+                'verbose_name': '식품 보관 기간 통계',
+                'verbose_name_plural': '식품 보관 기간 통계',
+                'db_table': 'shelf_life_stat',
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='shelflifestat',
+            constraint=models.UniqueConstraint(fields=('default_food', 'storage_type'), name='unique_shelf_life_stat'),
+        ),
+        migrations.RunPython(backfill_food_history_snapshot, migrations.RunPython.noop),
+    ]
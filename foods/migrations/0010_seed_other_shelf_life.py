@@ -0,0 +1,37 @@
+# Generated by Django 5.0.3 on 2026-10-17 20:55
+
+from django.db import migrations
+
+# 0008에서 빠진 디폴트 음식. "기타"는 종류를 알 수 없는 식품이므로 가장 짧은 보관 기간 기준 (냉장, 냉동, 실온)
+SHELF_LIFE_DAYS = {
+    '기타': (3, 30, 1),
+}
+STORAGE_TYPES = ('refrigerated', 'frozen', 'room_temp')
+
+
+def seed_shelf_life(apps, schema_editor):
+    ShelfLife = apps.get_model('foods', 'ShelfLife')
+    ShelfLife.objects.bulk_create(
+        [
+            ShelfLife(name=name, storage_type=storage_type, days=days, source='seed')
+            for name, durations in SHELF_LIFE_DAYS.items()
+            for storage_type, days in zip(STORAGE_TYPES, durations)
+        ],
+        ignore_conflicts=True,
+    )
+
+
+def unseed_shelf_life(apps, schema_editor):
+    ShelfLife = apps.get_model('foods', 'ShelfLife')
+    ShelfLife.objects.filter(name__in=SHELF_LIFE_DAYS, source='seed').delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('foods', '0009_food_history_snapshot_shelf_life_stat'),
+    ]
+
+    operations = [
+        migrations.RunPython(seed_shelf_life, unseed_shelf_life),
+    ]
@@ -46,6 +46,10 @@ class FridgeFood(models.Model):
         db_table = 'fridge_food'
         verbose_name = '냉장고 식품'
         verbose_name_plural = '냉장고 식품'
+        indexes = [
+            # 냉장고별 식품 목록 (소비기한순 정렬, 소비기한 범위 조회)
+            models.Index(fields=['refrigerator', 'expiration_date'], name='idx_fridge_food_expiration'),
+        ]
 
 
 class FoodHistory(models.Model):
@@ -70,6 +74,15 @@ class FoodHistory(models.Model):
     action = models.CharField(max_length=10, choices=ACTION_CHOICES, verbose_name='행동 유형')
     quantity = models.PositiveIntegerField(verbose_name='수량', help_text='소비하거나 폐기한 수량')
     timestamp = models.DateTimeField(auto_now_add=True, verbose_name='기록 시간')
+    # 기록 시점의 식품 정보 (식품이 삭제되어도 보관 기간 통계에 사용)
+    default_food = models.ForeignKey(
+        DefaultFood, on_delete=models.SET_NULL, null=True, blank=True, related_name='food_histories', verbose_name='기본 식품'
+    )
+    storage_type = models.CharField(
+        max_length=20, choices=FridgeFood.STORAGE_TYPE_CHOICES, null=True, blank=True, verbose_name='보관 방식'
+    )
+    purchase_date = models.DateField(null=True, blank=True, verbose_name='구매 날짜')
+    expiration_date = models.DateField(null=True, blank=True, verbose_name='소비기한')
 
     def __str__(self):
         return f"{self.user.name} - {self.get_action_display()} {self.quantity} ({self.timestamp})"
@@ -92,6 +105,56 @@ class FoodHistory(models.Model):
         ]
         # 단일 및 복합 인덱스 추가
 
+
+class ShelfLife(models.Model):
+    SOURCE_CHOICES = [
+        ('seed', 'Seed'),  # 마이그레이션 기본 데이터
+        ('llm', 'LLM'),  # ChatGPT 응답
+    ]
+
+    name = models.CharField(max_length=100, verbose_name='식품 이름', help_text='공백 제거, 소문자로 정규화한 이름')
+    storage_type = models.CharField(max_length=20, choices=FridgeFood.STORAGE_TYPE_CHOICES, verbose_name='보관 방식')
+    days = models.PositiveIntegerField(verbose_name='소비기한(일)', help_text='구매(제조)일로부터 소비기한까지 일수')
+    source = models.CharField(max_length=10, choices=SOURCE_CHOICES, default='llm', verbose_name='출처')
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name='생성 시간')
+
+    def __str__(self):
+        return f"{self.name} ({self.get_storage_type_display()}) - {self.days}일"
+
+    class Meta:
+        db_table = 'shelf_life'
+        verbose_name = '식품 보관 기간'
+        verbose_name_plural = '식품 보관 기간'
+        constraints = [
+            models.UniqueConstraint(fields=['name', 'storage_type'], name='unique_shelf_life'),
+        ]
+
+
+class ShelfLifeStat(models.Model):
+    """식품 기록에서 집계한 (기본 식품, 보관 방식)별 구매일부터 폐기까지 일수 통계"""
+    default_food = models.ForeignKey(
+        DefaultFood, on_delete=models.CASCADE, related_name='shelf_life_stats', verbose_name='기본 식품'
+    )
+    storage_type = models.CharField(max_length=20, choices=FridgeFood.STORAGE_TYPE_CHOICES, verbose_name='보관 방식')
+    sample_count = models.PositiveIntegerField(verbose_name='표본 수')
+    median_days = models.FloatField(verbose_name='폐기까지 일수 중앙값')
+    p25_days = models.FloatField(verbose_name='폐기까지 일수 25백분위')
+    p75_days = models.FloatField(verbose_name='폐기까지 일수 75백분위')
+    p90_days = models.FloatField(verbose_name='폐기까지 일수 90백분위')
+    updated_at = models.DateTimeField(auto_now=True, verbose_name='집계 시간')
+
+    def __str__(self):
+        return f"{self.default_food_id} ({self.get_storage_type_display()}) - {self.median_days}일"
+
+    class Meta:
+        db_table = 'shelf_life_stat'
+        verbose_name = '식품 보관 기간 통계'
+        verbose_name_plural = '식품 보관 기간 통계'
+        constraints = [
+            models.UniqueConstraint(fields=['default_food', 'storage_type'], name='unique_shelf_life_stat'),
+        ]
+
+
 # class CustomFood(models.Model):
 #     name = models.CharField(max_length=100, unique=True, verbose_name='사용자 정의 식품 이름')
 #     image = models.ImageField(default='default_food_images/custom_food.jpg', verbose_name='사용자 정의 식품 이미지')
@@ -0,0 +1,160 @@
+"""
+식품 기록 기반 보관 기간 예측
+
+매일 밤 식품 기록(FoodHistory)의 폐기 기록에서 (기본 식품, 보관 방식)별 구매일부터 폐기까지 일수의
+중앙값/백분위를 NumPy로 한 번에 집계해 shelf_life_stat 테이블에 저장합니다.
+각 프로세스는 통계를 메모리에 올려 두고 DB 조회 없이 보관 기간을 예측하며,
+통계가 다시 집계되거나 디폴트 음식이 바뀌면(버전 변경) 다시 불러옵니다.
+"""
+import logging
+import threading
+import time
+
+import numpy as np
+from asgiref.sync import sync_to_async
+from django.core.cache import cache
+from django.db.models.functions import TruncDate
+
+from foods.catalog import CATALOG_VERSION_CHECK_INTERVAL, CUSTOM_FOOD_DEFAULT_ID, get_catalog_version
+from foods.models import DefaultFood, FoodHistory, FridgeFood, ShelfLifeStat
+from foods.shelf_life import normalize_food_name
+
+logger = logging.getLogger(__name__)
+
+STATS_VERSION_KEY = 'foods:shelf_life_stats:version'
+# 예측에 사용할 최소 표본 수 (이보다 적으면 보관 기간 테이블/LLM 사용)
+SHELF_LIFE_MIN_SAMPLES = 5
+
+STORAGE_TYPES = [value for value, _ in FridgeFood.STORAGE_TYPE_CHOICES]
+STORAGE_INDEX = {value: index for index, value in enumerate(STORAGE_TYPES)}
+PERCENTILES = (0.25, 0.5, 0.75, 0.9)
+
+
+def compute_shelf_life_stats(since=None):
+    """
+    폐기 기록의 구매일부터 폐기일까지 일수를 (기본 식품, 보관 방식)별로 집계해 ShelfLifeStat 목록 반환 (저장하지 않음)
+    그룹별 반복 없이 (그룹 키, 일수)로 정렬한 배열에서 그룹 시작 위치와 크기로 백분위를 한 번에 계산합니다.
+    """
+    histories = (
+        FoodHistory.objects.filter(
+            action='discarded', default_food__isnull=False, storage_type__isnull=False, purchase_date__isnull=False
+        )
+        .exclude(default_food_id=CUSTOM_FOOD_DEFAULT_ID)
+    )
+    if since is not None:
+        histories = histories.filter(timestamp__gte=since)
+    rows = list(
+        histories.annotate(discard_date=TruncDate('timestamp'))
+        .values_list('default_food_id', 'storage_type', 'purchase_date', 'discard_date')
+    )
+    if not rows:
+        return []
+
+    food_ids, storage_types, purchase_dates, discard_dates = zip(*rows)
+    days = (
+        np.array(discard_dates, dtype='datetime64[D]') - np.array(purchase_dates, dtype='datetime64[D]')
+    ).astype(np.int64)
+    keys = np.array(food_ids, dtype=np.int64) * len(STORAGE_TYPES) + np.array(
+        [STORAGE_INDEX[storage_type] for storage_type in storage_types], dtype=np.int64
+    )
+
+    # 구매일 이전 폐기 등 잘못된 기록 제외
+    valid = days >= 0
+    keys, days = keys[valid], days[valid]
+    if not len(keys):
+        return []
+
+    order = np.lexsort((days, keys))
+    keys, days = keys[order], days[order]
+    group_keys, starts, counts = np.unique(keys, return_index=True, return_counts=True)
+
+    def percentile(q):
+        # 그룹별 선형 보간 백분위 (np.percentile 기본 방식과 동일)
+        position = starts + q * (counts - 1)
+        lower = np.floor(position).astype(np.int64)
+        upper = np.ceil(position).astype(np.int64)
+        return days[lower] + (days[upper] - days[lower]) * (position - lower)
+
+    p25, median, p75, p90 = (percentile(q) for q in PERCENTILES)
+    return [
+        ShelfLifeStat(
+            default_food_id=int(key) // len(STORAGE_TYPES),
+            storage_type=STORAGE_TYPES[int(key) % len(STORAGE_TYPES)],
+            sample_count=int(count),
+            median_days=float(median[i]),
+            p25_days=float(p25[i]),
+            p75_days=float(p75[i]),
+            p90_days=float(p90[i]),
+        )
+        for i, (key, count) in enumerate(zip(group_keys, counts))
+    ]
+
+
+class ShelfLifePredictor:
+    """(정규화한 기본 식품 이름, 보관 방식) → 예상 보관 기간(일)"""
+
+    def __init__(self, default_foods, stats, version=None):
+        self.version = version
+        self.food_ids = {
+            normalize_food_name(name): food_id for food_id, name in default_foods if food_id != CUSTOM_FOOD_DEFAULT_ID
+        }
+        self.days = {
+            (stat.default_food_id, stat.storage_type): round(stat.median_days)
+            for stat in stats if stat.sample_count >= SHELF_LIFE_MIN_SAMPLES
+        }
+
+    def predict_days(self, name, storage_type):
+        """통계가 충분한 기본 식품이면 중앙값 일수, 아니면 None (name은 normalize_food_name 결과)"""
+        food_id = self.food_ids.get(name)
+        if food_id is None:
+            return None
+        return self.days.get((food_id, storage_type))
+
+
+_lock = threading.Lock()
+_state = {'version': None, 'checked_at': 0.0, 'predictor': None}
+
+
+def get_stats_version():
+    version = cache.get(STATS_VERSION_KEY)
+    if version is None:
+        cache.add(STATS_VERSION_KEY, int(time.time() * 1000), None)
+        version = cache.get(STATS_VERSION_KEY)
+    return version
+
+
+def bump_stats_version():
+    """통계 재집계 후 버전 증가 (모든 프로세스의 예측기 재생성)"""
+    try:
+        cache.incr(STATS_VERSION_KEY)
+    except ValueError:
+        cache.add(STATS_VERSION_KEY, int(time.time() * 1000), None)
+    _state['checked_at'] = 0.0
+
+
+def _is_fresh():
+    return _state['predictor'] is not None and time.monotonic() - _state['checked_at'] < CATALOG_VERSION_CHECK_INTERVAL
+
+
+def get_shelf_life_predictor():
+    """현재 통계/카탈로그 버전의 예측기 반환 (버전이 바뀌었으면 DB에서 다시 읽어 생성)"""
+    if _is_fresh():
+        return _state['predictor']
+
+    with _lock:
+        version = (get_stats_version(), get_catalog_version())
+        if _state['predictor'] is None or _state['version'] != version:
+            _state['predictor'] = ShelfLifePredictor(
+                DefaultFood.objects.values_list('id', 'name'), ShelfLifeStat.objects.all(), version
+            )
+            _state['version'] = version
+            logger.info("Built shelf life predictor (version=%s, stats=%d)", version, len(_state['predictor'].days))
+        _state['checked_at'] = time.monotonic()
+        return _state['predictor']
+
+
+async def aget_shelf_life_predictor():
+    """비동기 뷰용 (다시 읽어야 할 때만 스레드에서 DB 조회)"""
+    if _is_fresh():
+        return _state['predictor']
+    return await sync_to_async(get_shelf_life_predictor)()
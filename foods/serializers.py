@@ -1,5 +1,6 @@
 from drf_spectacular.utils import extend_schema_field
 from rest_framework import serializers
+from foods.catalog import get_catalog_entry, get_catalog_image_url
 from .models import DefaultFood, FridgeFood, FoodHistory
 
 
@@ -11,7 +12,8 @@ class DefaultFoodSerializer(serializers.ModelSerializer):
 
 class FridgeFoodSerializer(serializers.ModelSerializer):
     # name = serializers.SerializerMethodField()
-    default_food_name = serializers.CharField(source="default_food.name", read_only=True)
+    # 디폴트 음식 정보는 JOIN/지연 로딩 대신 프로세스 카탈로그에서 조회
+    default_food_name = serializers.SerializerMethodField()
     image_url = serializers.SerializerMethodField()
     storage_type_display = serializers.CharField(
         source='get_storage_type_display',
@@ -26,11 +28,34 @@ class FridgeFoodSerializer(serializers.ModelSerializer):
     # def get_name(self, obj) -> str:
     #     return obj.default_food.name if obj.default_food else obj.name
 
+    def get_default_food_name(self, obj) -> str:
+        entry = get_catalog_entry(obj.default_food_id)
+        return entry.name if entry else None
+
     def get_image_url(self, obj) -> str:
-        if obj.default_food and obj.default_food.image:
-            request = self.context.get('request')
-            return request.build_absolute_uri(obj.default_food.image.url)
-        return None
+        return get_catalog_image_url(self.context.get('request'), obj.default_food_id)
+
+
+class FridgeFoodBulkItemSerializer(serializers.Serializer):
+    """음식 일괄 추가 항목"""
+    default_food_id = serializers.IntegerField(required=False, allow_null=True, help_text="디폴트 음식 ID (없으면 사용자 정의 음식)")
+    name = serializers.CharField(required=False, allow_null=True, allow_blank=True, max_length=100)
+    storage_type = serializers.ChoiceField(choices=FridgeFood.STORAGE_TYPE_CHOICES, default='refrigerated')
+    purchase_date = serializers.DateField()
+    expiration_date = serializers.DateField()
+    quantity = serializers.IntegerField(min_value=1)
+
+    def validate(self, attrs):
+        if not attrs.get('default_food_id') and not attrs.get('name'):
+            raise serializers.ValidationError("Name is required for custom foods.")
+        return attrs
+
+
+class FoodHistoryBatchItemSerializer(serializers.Serializer):
+    """음식 일괄 소비/폐기 항목"""
+    food_id = serializers.IntegerField(help_text="냉장고 음식 ID")
+    action = serializers.ChoiceField(choices=FoodHistory.ACTION_CHOICES)
+    quantity = serializers.IntegerField(min_value=1)
 
 
 class FoodHistorySerializer(serializers.ModelSerializer):
@@ -0,0 +1,49 @@
+from functools import partial
+
+from django.db import connection, transaction
+
+from foods.inventory import bump_inventory_version
+from foods.models import DefaultFood, FoodHistory, FridgeFood
+
+
+def consume_fridge_food(user, refrigerator_id, fridge_food_id, action, quantity):
+    """
+    냉장고 음식 수량을 조건부 UPDATE ... RETURNING 한 번으로 차감하고 소비/폐기 기록 추가
+    남은 수량이 차감량 이상일 때만 차감하므로 동시에 요청해도 수량이 음수가 되거나 차감이 유실되지 않으며,
+    수량이 0이 되면 음식을 삭제합니다. 남은 수량을 반환하고, 음식이 없거나 수량이 부족하면 None을 반환합니다.
+    """
+    sql = (
+        f"UPDATE {FridgeFood._meta.db_table} SET quantity = quantity - %s "
+        "WHERE id = %s AND refrigerator_id = %s AND quantity >= %s "
+        "RETURNING quantity, COALESCE(NULLIF(name, ''), "
+        f"(SELECT name FROM {DefaultFood._meta.db_table} WHERE id = default_food_id)), "
+        "default_food_id, storage_type, purchase_date, expiration_date"
+    )
+    with transaction.atomic():
+        with connection.cursor() as cursor:
+            cursor.execute(sql, [quantity, fridge_food_id, refrigerator_id, quantity])
+            row = cursor.fetchone()
+        if row is None:
+            return None
+
+        remaining, food_name, default_food_id, storage_type, purchase_date, expiration_date = row
+        FoodHistory.objects.create(
+            food_name=food_name,
+            user=user,
+            refrigerator_id=refrigerator_id,
+            fridge_food_id=fridge_food_id,
+            action=action,
+            quantity=quantity,
+            default_food_id=default_food_id,
+            storage_type=storage_type,
+            purchase_date=purchase_date,
+            expiration_date=expiration_date
+        )
+
+        if remaining == 0:
+            # 알림 예약은 CASCADE로 함께 삭제됨
+            FridgeFood.objects.filter(id=fridge_food_id, quantity=0).delete()
+        else:
+            # UPDATE는 post_save 시그널을 보내지 않으므로 인벤토리 버전을 직접 갱신
+            transaction.on_commit(partial(bump_inventory_version, refrigerator_id))
+    return remaining
@@ -0,0 +1,49 @@
+"""
+식품 보관 기간(소비기한 일수) 조회
+
+(정규화한 식품 이름, 보관 방식)별 보관 기간을 shelf_life 테이블에 저장해 두고,
+구매일과 관계없이 DB에서 바로 소비기한을 계산합니다. 테이블에 없는 식품만 LLM에 묻고 응답을 저장합니다.
+"""
+import re
+import unicodedata
+
+from foods.models import FridgeFood, ShelfLife
+
+# 보관 방식 코드와 한글 표기를 모두 허용
+STORAGE_TYPE_ALIASES = {
+    **{value: value for value, _ in FridgeFood.STORAGE_TYPE_CHOICES},
+    **{label: value for value, label in FridgeFood.STORAGE_TYPE_CHOICES},
+}
+STORAGE_TYPE_LABELS = dict(FridgeFood.STORAGE_TYPE_CHOICES)
+
+DAYS_PATTERN = re.compile(r'\d+')
+
+
+def normalize_food_name(name):
+    """전각/반각 통일, 공백 제거, 소문자 변환 ("방울 토마토" → "방울토마토")"""
+    return re.sub(r'\s+', '', unicodedata.normalize('NFKC', name)).lower()
+
+
+def normalize_storage_type(storage_type):
+    """보관 방식 코드 반환 (알 수 없는 값이면 None)"""
+    return STORAGE_TYPE_ALIASES.get(storage_type.strip())
+
+
+def parse_shelf_life_days(text):
+    """LLM 응답에서 일수 추출 (숫자가 없으면 ValueError)"""
+    match = DAYS_PATTERN.search(text)
+    if not match:
+        raise ValueError(f"Invalid shelf life answer: {text!r}")
+    return int(match.group())
+
+
+async def aget_shelf_life_days(name, storage_type):
+    return await ShelfLife.objects.filter(name=name, storage_type=storage_type).values_list('days', flat=True).afirst()
+
+
+async def asave_shelf_life_days(name, storage_type, days):
+    """LLM 응답 저장 (동시에 같은 식품을 저장하면 먼저 저장된 값 사용)"""
+    shelf_life, _ = await ShelfLife.objects.aget_or_create(
+        name=name, storage_type=storage_type, defaults={'days': days, 'source': 'llm'}
+    )
+    return shelf_life.days
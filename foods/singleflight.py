@@ -0,0 +1,189 @@
+"""
+동일한 LLM 요청 병합 (single-flight)
+
+같은 프롬프트의 요청이 동시에 들어오면 한 요청만 실제로 LLM을 호출하고 나머지는 그 결과를 함께 사용합니다.
+- 프로세스 안: 먼저 들어온 요청(리더)의 호출이 끝날 때까지 나머지 요청이 기다림 (이벤트 루프별)
+- 워커 사이: 캐시에 짧은 잠금 키를 두고, 잠금을 얻지 못한 워커는 리더가 캐시에 남긴 결과를 기다림
+  Redis 캐시면 리더가 끝날 때 보내는 Pub/Sub 알림으로 바로 깨어나고, 알림을 놓치거나 다른 캐시 백엔드면
+  간격을 늘려 가며(최대 SINGLEFLIGHT_MAX_POLL_INTERVAL) 캐시를 다시 확인
+리더가 실패하면 잠금이 풀리고 기다리던 워커 중 하나가 다시 호출합니다. 결과는 캐시에 저장되므로 직렬화 가능해야 합니다.
+기다리는 동안 스레드를 점유하지 않도록 비동기 뷰에서만 사용합니다.
+"""
+import asyncio
+import hashlib
+import json
+import re
+import time
+import weakref
+
+import redis.asyncio
+from django.core.cache import cache
+from django.core.cache.backends.redis import RedisCache
+from redis.exceptions import RedisError
+
+# 잠금 유지 시간(초). 리더 워커가 비정상 종료해도 이 시간이 지나면 다른 워커가 호출
+SINGLEFLIGHT_LOCK_TIMEOUT = 60
+# 기다리던 워커가 가져갈 수 있도록 결과를 보관하는 시간(초)
+SINGLEFLIGHT_RESULT_TIMEOUT = 30
+# 결과 확인 간격(초). 확인할 때마다 두 배로 늘리되 최대 간격을 넘지 않음
+SINGLEFLIGHT_POLL_INTERVAL = 0.1
+SINGLEFLIGHT_MAX_POLL_INTERVAL = 2
+
+LOCK_KEY = 'llm:singleflight:lock:{key}'
+RESULT_KEY = 'llm:singleflight:result:{key}'
+DONE_CHANNEL = 'llm:singleflight:done:{key}'
+
+_MISSING = object()
+
+
+class _LeaderCancelled(Exception):
+    """리더 요청이 취소됨 (기다리던 요청 중 하나가 다시 호출)"""
+
+
+def prompt_key(**request):
+    """LLM 요청 인자(모델, 메시지, 옵션)를 정규화한 해시 (공백 차이, 인자 순서 무시)"""
+    normalized = re.sub(r'\s+', ' ', json.dumps(request, sort_keys=True, ensure_ascii=False, separators=(',', ':')))
+    return hashlib.sha256(normalized.encode()).hexdigest()
+
+
+# 이벤트 루프 → {key: Future}. Future는 생성된 루프에서만 기다릴 수 있음
+_calls = weakref.WeakKeyDictionary()
+
+
+async def ado(key, fn):
+    """같은 key의 호출이 진행 중이면 그 결과를 기다려 반환하고, 아니면 fn()을 호출 (fn은 코루틴 함수)"""
+    loop = asyncio.get_running_loop()
+    calls = _calls.setdefault(loop, {})
+    while True:
+        future = calls.get(key)
+        if future is None:
+            break
+        try:
+            # 기다리던 요청이 취소되어도 리더의 호출은 계속되도록 shield
+            return await asyncio.shield(future)
+        except _LeaderCancelled:
+            # 리더 요청이 취소되면 기다리던 요청 중 먼저 깨어난 요청이 새 리더가 됨
+            continue
+
+    future = calls[key] = loop.create_future()
+    try:
+        result = await _shared_call(key, fn)
+    except asyncio.CancelledError:
+        # 취소를 그대로 전달하면 기다리던 다른 요청까지 취소되므로 다시 호출하도록 알림
+        future.set_exception(_LeaderCancelled())
+        future.exception()
+        raise
+    except Exception as e:
+        future.set_exception(e)
+        # 기다리는 요청이 없어도 "예외를 확인하지 않음" 경고가 남지 않도록 처리
+        future.exception()
+        raise
+    else:
+        future.set_result(result)
+        return result
+    finally:
+        calls.pop(key, None)
+
+
+# 이벤트 루프 → 비동기 Redis 클라이언트. 연결은 생성된 루프에서만 사용할 수 있음
+_redis_clients = weakref.WeakKeyDictionary()
+
+
+def _redis_client():
+    """캐시와 같은 Redis 서버의 비동기 클라이언트 (Redis 캐시가 아니면 None)"""
+    if not isinstance(cache, RedisCache):
+        return None
+    loop = asyncio.get_running_loop()
+    client = _redis_clients.get(loop)
+    if client is None:
+        # 쓰기는 첫 번째 서버로 가므로 알림도 첫 번째 서버에서 주고받음
+        client = _redis_clients[loop] = redis.asyncio.Redis.from_url(cache._servers[0])
+    return client
+
+
+def _done_channel(key):
+    return cache.make_key(DONE_CHANNEL.format(key=key))
+
+
+async def _notify_done(key):
+    """기다리는 워커를 깨움 (실패해도 워커가 간격을 두고 다시 확인하므로 무시)"""
+    client = _redis_client()
+    if client is None:
+        return
+    try:
+        await client.publish(_done_channel(key), 1)
+    except RedisError:
+        pass
+
+
+class _DoneWaiter:
+    """리더의 완료 알림을 기다림. 구독할 수 없으면 주어진 시간만큼 대기"""
+
+    def __init__(self, key):
+        self.key = key
+        self.pubsub = None
+        self.started = False
+
+    async def start(self):
+        """처음 호출될 때만 구독하고 True 반환"""
+        if self.started:
+            return False
+        self.started = True
+        client = _redis_client()
+        if client is not None:
+            try:
+                self.pubsub = client.pubsub(ignore_subscribe_messages=True)
+                await self.pubsub.subscribe(_done_channel(self.key))
+            except RedisError:
+                await self.close()
+        return True
+
+    async def wait(self, timeout):
+        if self.pubsub is None:
+            await asyncio.sleep(timeout)
+            return
+        end = time.monotonic() + timeout
+        try:
+            while (remaining := end - time.monotonic()) > 0:
+                if await self.pubsub.get_message(timeout=remaining):
+                    return
+        except RedisError:
+            await self.close()
+
+    async def close(self):
+        if self.pubsub is not None:
+            pubsub, self.pubsub = self.pubsub, None
+            await pubsub.aclose()
+
+
+async def _shared_call(key, fn):
+    """워커 사이 병합: 잠금을 얻으면 호출해 결과를 캐시에 저장하고, 못 얻으면 결과를 기다림"""
+    lock_key, result_key = LOCK_KEY.format(key=key), RESULT_KEY.format(key=key)
+    deadline = time.monotonic() + SINGLEFLIGHT_LOCK_TIMEOUT
+    interval = SINGLEFLIGHT_POLL_INTERVAL
+    waiter = _DoneWaiter(key)
+    try:
+        while True:
+            result = await cache.aget(result_key, _MISSING)
+            if result is not _MISSING:
+                return result
+            if await cache.aadd(lock_key, 1, SINGLEFLIGHT_LOCK_TIMEOUT):
+                try:
+                    result = await fn()
+                    await cache.aset(result_key, result, SINGLEFLIGHT_RESULT_TIMEOUT)
+                    return result
+                finally:
+                    await cache.adelete(lock_key)
+                    # 성공하면 결과를 가져가고, 실패하면 기다리던 워커 중 하나가 잠금을 얻어 다시 호출
+                    await _notify_done(key)
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                # 리더가 제한 시간 안에 끝나지 않으면 직접 호출
+                return await fn()
+            if await waiter.start():
+                # 구독하기 전에 리더가 끝났을 수 있으므로 기다리기 전에 결과를 한 번 더 확인
+                continue
+            await waiter.wait(min(interval, remaining))
+            interval = min(interval * 2, SINGLEFLIGHT_MAX_POLL_INTERVAL)
+    finally:
+        await waiter.close()
@@ -0,0 +1,24 @@
+import logging
+from datetime import timedelta
+
+from celery.app import shared_task
+from django.conf import settings
+from django.db import transaction
+from django.utils.timezone import now
+
+from .models import ShelfLifeStat
+from .predictor import bump_stats_version, compute_shelf_life_stats
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task
+def refresh_shelf_life_stats():
+    """식품 기록에서 보관 기간 통계를 다시 집계해 교체 (매일 새벽 실행)"""
+    stats = compute_shelf_life_stats(since=now() - timedelta(days=settings.SHELF_LIFE_STATS_WINDOW_DAYS))
+    with transaction.atomic():
+        ShelfLifeStat.objects.all().delete()
+        ShelfLifeStat.objects.bulk_create(stats)
+        transaction.on_commit(bump_stats_version)
+    logger.info("Refreshed shelf life stats: %d groups", len(stats))
+    return len(stats)
@@ -1,3 +1,186 @@
-from django.test import TestCase
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock, skipUnless
 
-# Create your tests here.
+from django.core.cache import cache
+from django.db import connection
+from django.db.models import Sum
+from django.test import TestCase, TransactionTestCase
+from django.utils.timezone import localdate
+
+from foods import singleflight
+from foods.checks import check_default_food_shelf_life
+from foods.models import DefaultFood, FoodHistory, FridgeFood
+from foods.services import consume_fridge_food
+from refriges.models import Refrigerator
+from users.models import CustomUser
+
+
+@skipUnless(connection.vendor == 'postgresql', "행 잠금 동시성 검사는 PostgreSQL 전용 (SQLite 테스트 DB는 테이블 단위로 잠김)")
+class ConsumeFridgeFoodConcurrencyTests(TransactionTestCase):
+    """여러 스레드에서 같은 음식을 동시에 소비해도 수량이 음수가 되거나 차감이 유실되지 않는지 확인"""
+
+    THREADS = 8
+    QUANTITY = 20
+    REQUESTS = 40
+
+    def setUp(self):
+        today = localdate()
+        self.user = CustomUser.objects.create(email='consume@sigkihan.test', name='consume', image=None)
+        self.refrigerator = Refrigerator.objects.create(name='consume')
+        self.fridge_food = FridgeFood.objects.create(
+            refrigerator=self.refrigerator,
+            name='우유',
+            storage_type='refrigerated',
+            purchase_date=today,
+            expiration_date=today,
+            quantity=self.QUANTITY,
+        )
+
+    def test_concurrent_consumption(self):
+        errors = []
+        lock = threading.Lock()
+        start = threading.Barrier(self.THREADS)
+
+        def worker(index):
+            # 모든 스레드가 준비된 뒤 동시에 차감 시작
+            if index < self.THREADS:
+                start.wait()
+            try:
+                return consume_fridge_food(self.user, self.refrigerator.id, self.fridge_food.id, 'consumed', 1)
+            except Exception as e:
+                with lock:
+                    errors.append(e)
+                return None
+            finally:
+                connection.close()
+
+        with ThreadPoolExecutor(max_workers=self.THREADS) as executor:
+            results = list(executor.map(worker, range(self.REQUESTS)))
+
+        self.assertEqual(errors, [])
+        remaining = [result for result in results if result is not None]
+        # 남은 수량은 음수가 될 수 없고, 성공한 요청마다 서로 다른 남은 수량을 받아야 함
+        self.assertEqual(len(remaining), self.QUANTITY)
+        self.assertTrue(all(result >= 0 for result in remaining))
+        self.assertEqual(sorted(remaining), list(range(self.QUANTITY)))
+
+        # 소비한 수량 1개당 기록 1건, 수량이 0이 된 음식은 삭제
+        histories = FoodHistory.objects.filter(refrigerator=self.refrigerator, action='consumed')
+        self.assertEqual(histories.count(), self.QUANTITY)
+        self.assertEqual(histories.aggregate(total=Sum('quantity'))['total'], self.QUANTITY)
+        self.assertFalse(FridgeFood.objects.filter(id=self.fridge_food.id).exists())
+
+
+class ConsumeFridgeFoodTests(TestCase):
+    """단일 요청의 수량 차감, 초과 소비 거절, 0개가 된 음식 삭제 확인"""
+
+    @classmethod
+    def setUpTestData(cls):
+        today = localdate()
+        cls.user = CustomUser.objects.create(email='consume@sigkihan.test', name='consume', image=None)
+        cls.refrigerator = Refrigerator.objects.create(name='consume')
+        cls.fridge_food = FridgeFood.objects.create(
+            refrigerator=cls.refrigerator,
+            name='우유',
+            storage_type='refrigerated',
+            purchase_date=today,
+            expiration_date=today,
+            quantity=3,
+        )
+
+    def consume(self, quantity, action='consumed'):
+        return consume_fridge_food(self.user, self.refrigerator.id, self.fridge_food.id, action, quantity)
+
+    def test_consume_decrements_quantity(self):
+        self.assertEqual(self.consume(2), 1)
+
+        self.fridge_food.refresh_from_db()
+        self.assertEqual(self.fridge_food.quantity, 1)
+        history = FoodHistory.objects.get(fridge_food_id=self.fridge_food.id)
+        self.assertEqual((history.action, history.quantity, history.food_name), ('consumed', 2, '우유'))
+
+    def test_over_consume_is_rejected(self):
+        self.assertIsNone(self.consume(4, action='discarded'))
+
+        self.fridge_food.refresh_from_db()
+        self.assertEqual(self.fridge_food.quantity, 3)
+        self.assertFalse(FoodHistory.objects.filter(fridge_food_id=self.fridge_food.id).exists())
+
+    def test_consume_to_zero_deletes_food(self):
+        self.assertEqual(self.consume(3), 0)
+
+        self.assertFalse(FridgeFood.objects.filter(id=self.fridge_food.id).exists())
+        self.assertEqual(FoodHistory.objects.filter(refrigerator=self.refrigerator, quantity=3).count(), 1)
+
+    def test_other_refrigerator_is_rejected(self):
+        other = Refrigerator.objects.create(name='other')
+        self.assertIsNone(consume_fridge_food(self.user, other.id, self.fridge_food.id, 'consumed', 1))
+
+        self.fridge_food.refresh_from_db()
+        self.assertEqual(self.fridge_food.quantity, 3)
+
+
+class DefaultFoodShelfLifeCheckTests(TestCase):
+    """디폴트 음식마다 보관 기간이 저장되어 있는지 검사"""
+
+    def test_seeded_default_foods_pass(self):
+        for name in ('양파', '기타'):
+            DefaultFood.objects.create(name=name, image='food_images/other.svg', comment=name)
+        self.assertEqual(check_default_food_shelf_life(databases=['default']), [])
+
+    def test_missing_shelf_life_warns(self):
+        DefaultFood.objects.create(name='두리안', image='food_images/other.svg', comment='두리안')
+        warnings = check_default_food_shelf_life(databases=['default'])
+        self.assertEqual([warning.id for warning in warnings], ['foods.W001'])
+        self.assertIn('두리안 (refrigerated)', warnings[0].msg)
+
+
+class SingleflightSharedCallTests(TestCase):
+    """워커 사이 병합: 잠금을 얻지 못한 워커가 리더의 결과를 받거나, 리더가 실패하면 다시 호출하는지 확인"""
+
+    def setUp(self):
+        cache.clear()
+
+    def run_workers(self, *fns):
+        async def main():
+            # 서로 다른 워커처럼 프로세스 안 병합(ado)을 거치지 않고 캐시 잠금으로만 병합
+            return await asyncio.gather(*(singleflight._shared_call('key', fn) for fn in fns), return_exceptions=True)
+        return asyncio.run(main())
+
+    def test_follower_receives_leader_result(self):
+        calls = []
+
+        async def ask():
+            calls.append(1)
+            await asyncio.sleep(0.3)
+            return {'days': 7}
+
+        self.assertEqual(self.run_workers(ask, ask), [{'days': 7}, {'days': 7}])
+        self.assertEqual(len(calls), 1)
+
+    def test_follower_retries_after_leader_failure(self):
+        async def fail():
+            await asyncio.sleep(0.2)
+            raise ValueError('LLM error')
+
+        async def ask():
+            return {'days': 3}
+
+        failed, result = self.run_workers(fail, ask)
+        self.assertIsInstance(failed, ValueError)
+        self.assertEqual(result, {'days': 3})
+
+    def test_poll_interval_backs_off_to_cap(self):
+        waits = []
+        cache.add(singleflight.LOCK_KEY.format(key='key'), 1)
+
+        async def record(self, timeout):
+            waits.append(timeout)
+            if len(waits) == 8:
+                cache.set(singleflight.RESULT_KEY.format(key='key'), 'done')
+
+        with mock.patch.object(singleflight._DoneWaiter, 'wait', record):
+            self.assertEqual(self.run_workers(lambda: None), ['done'])
+        self.assertEqual(waits, [0.1, 0.2, 0.4, 0.8, 1.6, 2, 2, 2])
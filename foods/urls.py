@@ -1,7 +1,7 @@
 from rest_framework.routers import DefaultRouter
 from django.urls import path
 
-from foods.views import DefaultFoodListView, FridgeFoodViewSet, FoodHistoryView, FoodExpirationQueryView, \
+from foods.views import DefaultFoodListView, FridgeFoodViewSet, FoodHistoryView, FoodHistoryBatchView, FoodExpirationQueryView, \
     MonthlyTopConsumedFoodView, MonthlyConsumptionRankingView, RecipeRecommendationView
 
 
@@ -21,8 +21,10 @@ router.register(r'refrigerators/<int:refrigerator_id>/foods', FridgeFoodViewSet,
 urlpatterns = [
     path('default-foods', DefaultFoodListView.as_view(), name='default-food-list'),
     path('refrigerators/<int:refrigerator_id>/foods', FridgeFoodViewSet.as_view({'get': 'list', 'post': 'create'}), name='fridge-food-list'),
+    path('refrigerators/<int:refrigerator_id>/foods/bulk', FridgeFoodViewSet.as_view({'post': 'bulk_create'}), name='fridge-food-bulk'),
     path('refrigerators/<int:refrigerator_id>/foods/<int:id>', FridgeFoodViewSet.as_view({'patch': 'partial_update', 'delete': 'destroy'}), name='fridge-food-detail'),
     path('refrigerators/<int:refrigerator_id>/foods/<int:id>/history', FoodHistoryView.as_view(), name='food-history'),
+    path('refrigerators/<int:refrigerator_id>/foods/history/batch', FoodHistoryBatchView.as_view(), name='food-history-batch'),
     path('foods/expiration',
         FoodExpirationQueryView.as_view(), 
         name='food-expiration'
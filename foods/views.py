@@ -1,11 +1,15 @@
-from datetime import datetime, timedelta
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from datetime import date, datetime, timedelta
+from functools import partial
+import binascii
+import hashlib
 import json
 
 from dateutil.relativedelta import relativedelta
-from django.db.models import Sum
-from django.utils.timezone import make_aware, now, is_naive
-from openai import OpenAI
-from decouple import config
+from django.db import transaction
+from django.db.models import Case, Count, F, PositiveIntegerField, Q, Sum, When
+from django.utils.cache import patch_cache_control
+from django.utils.timezone import localdate, make_aware, now, is_naive
 from django.http import Http404
 from django.shortcuts import get_object_or_404
 from drf_spectacular.utils import extend_schema, OpenApiExample, OpenApiParameter, OpenApiResponse
@@ -13,21 +17,44 @@ from rest_framework.generics import ListAPIView
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
+from adrf.views import APIView as AsyncAPIView
 from rest_framework import viewsets
 from django.core.cache import cache
 
+from foods import singleflight
+from foods.catalog import (
+    CATALOG_MAX_AGE, CATALOG_SEARCH_LIMIT, CUSTOM_FOOD_DEFAULT_ID, get_catalog_entry, get_catalog_index,
+)
+from foods.inventory import bump_inventory_version, get_cached_inventory, get_inventory_version
+from foods.llm import LLMBusyError, create_chat_completion
+from foods.predictor import aget_shelf_life_predictor
+from foods.services import consume_fridge_food
+from foods.shelf_life import (
+    STORAGE_TYPE_LABELS, aget_shelf_life_days, asave_shelf_life_days, normalize_food_name, normalize_storage_type,
+    parse_shelf_life_days,
+)
+from notifications.services import schedule_expiry_notifications
 from refriges.models import Refrigerator, RefrigeratorAccess
 from sigkihan import settings
+from sigkihan.conditional import make_etag, not_modified, with_etag
+from sigkihan.media_urls import absolute_media_url, absolute_url_prefix
 from .models import DefaultFood, FridgeFood, FoodHistory
-from .serializers import DefaultFoodSerializer, FridgeFoodSerializer
+from .serializers import DefaultFoodSerializer, FoodHistoryBatchItemSerializer, FridgeFoodBulkItemSerializer, FridgeFoodSerializer
 
 
 today = datetime.today().strftime('%Y-%m-%d')
 
 @extend_schema(
     summary="디폴트 음식 조회",
-    description="디폴트 음식 목록을 조회하거나 검색합니다. 검색어를 포함하지 않으면 모든 음식을 반환합니다.",
+    description=(
+        "디폴트 음식 목록을 조회하거나 검색합니다. 검색어를 포함하지 않으면 모든 음식을 반환합니다. "
+        "검색어는 접두어, 부분 문자열, 초성(예: ㅇㅍ → 양파)으로 일치하며 일치 순위가 높은 순으로 최대 limit건을 반환합니다."
+    ),
     tags=["Foods"],
+    parameters=[
+        OpenApiParameter(name="q", type=str, required=False, description="검색어 (초성 검색 지원)"),
+        OpenApiParameter(name="limit", type=int, required=False, description=f"검색 결과 최대 개수 (기본값 {CATALOG_SEARCH_LIMIT})"),
+    ],
     responses={
         200: {
             "description": "디폴트 음식 목록과 직접 추가하기 이미지 경로",
@@ -53,23 +80,65 @@ class DefaultFoodListView(ListAPIView):
     def get(self, request, *args, **kwargs):
         query = self.request.GET.get('q', '').strip()
 
+        # 카탈로그 버전이 같으면 검색/직렬화 없이 304 응답
+        index = get_catalog_index()
+        etag = make_etag('default-foods', index.version, request.get_host(), request.GET.urlencode())
+        response = not_modified(request, etag)
+        if response:
+            patch_cache_control(response, private=True, max_age=CATALOG_MAX_AGE)
+            return response
+
+        # DB 대신 프로세스 메모리의 검색 인덱스에서 조회 (접두어/부분/초성 일치, 순위 상위 limit건)
         if len(query) >= 1:
-            default_foods = DefaultFood.objects.filter(name__icontains=query)
+            try:
+                limit = max(int(request.GET.get('limit', CATALOG_SEARCH_LIMIT)), 1)
+            except ValueError:
+                return Response({"error": "limit must be an integer."}, status=400)
+            default_foods = index.search(query, limit)
         else:
-            default_foods = DefaultFood.objects.all()
+            default_foods = index.foods
 
-        serializer = self.get_serializer(default_foods, many=True)
+        # 카탈로그에 미리 만든 이름/호스트별 이미지 URL로 응답 구성 (DefaultFoodSerializer와 같은 형식)
+        image_urls = index.image_urls(absolute_url_prefix(request))
+        data = [
+            {"id": food.id, "name": index.by_id[food.id].name, "image": image_urls.get(food.id)}
+            for food in default_foods
+        ]
 
         # "직접 추가하기" 이미지 URL 생성
-        direct_add_image = request.build_absolute_uri('/media/food_images/other.svg')
+        direct_add_image = absolute_media_url(request, '/media/food_images/other.svg')
 
         # 응답 데이터 구성
         response_data = {
-            "default_foods": serializer.data,
+            "default_foods": data,
             "direct_add_image": direct_add_image
         }
 
-        return Response(response_data, status=200)
+        response = with_etag(Response(response_data, status=200), etag)
+        patch_cache_control(response, private=True, max_age=CATALOG_MAX_AGE)
+        return response
+
+
+# 냉장고 음식 목록 페이지 최대 크기
+FRIDGE_FOOD_PAGE_MAX = 100
+# 음식 일괄 추가 최대 항목 수
+FRIDGE_FOOD_BULK_MAX = 50
+# 음식 일괄 소비/폐기 최대 항목 수
+FOOD_HISTORY_BATCH_MAX = 50
+
+
+def _encode_cursor(food):
+    """키셋 페이지네이션 커서 (소비기한, ID)"""
+    return urlsafe_b64encode(f"{food.expiration_date.isoformat()}|{food.id}".encode()).decode()
+
+
+def _decode_cursor(cursor):
+    """커서를 (소비기한, ID)로 변환. 형식이 잘못되면 ValueError"""
+    try:
+        expiration_date, last_id = urlsafe_b64decode(cursor.encode()).decode().split('|')
+    except (binascii.Error, UnicodeDecodeError) as e:
+        raise ValueError(cursor) from e
+    return date.fromisoformat(expiration_date), int(last_id)
 
 
 class FridgeFoodViewSet(viewsets.ViewSet):
@@ -81,7 +150,19 @@ class FridgeFoodViewSet(viewsets.ViewSet):
 
     @extend_schema(
         summary="내 냉장고 음식 리스트",
-        description="사용자의 냉장고에 추가된 모든 음식을 조회합니다.",
+        description=(
+            "사용자의 냉장고에 추가된 음식을 소비기한순으로 조회합니다. "
+            "limit을 지정하면 {results, next_cursor} 형태로 페이지 단위(키셋 페이지네이션) 응답을 반환하며, "
+            "다음 페이지는 next_cursor 값을 cursor로 전달해 조회합니다. "
+            "group_by=storage_type이면 보관 방식별 그룹과 DB에서 집계한 개수를 반환합니다."
+        ),
+        parameters=[
+            OpenApiParameter(name="storage_type", description="보관 방식 (refrigerated, frozen, room_temp)", required=False, type=str),
+            OpenApiParameter(name="expiring_within", description="오늘부터 N일 이내에 소비기한이 끝나는 음식만 조회", required=False, type=int),
+            OpenApiParameter(name="limit", description=f"페이지 크기 (최대 {FRIDGE_FOOD_PAGE_MAX})", required=False, type=int),
+            OpenApiParameter(name="cursor", description="이전 응답의 next_cursor", required=False, type=str),
+            OpenApiParameter(name="group_by", description="storage_type 지정 시 보관 방식별 그룹 응답", required=False, type=str),
+        ],
         responses={200: FridgeFoodSerializer(many=True)},
         tags = ["Foods"],
     )
@@ -93,17 +174,91 @@ class FridgeFoodViewSet(viewsets.ViewSet):
             return Response({"error": "Refrigerator ID is required."}, status=400)
 
         # 사용자가 접근 가능한 냉장고 확인
-        refrigerator_access = RefrigeratorAccess.objects.filter(user=request.user, refrigerator_id=refrigerator_id).first()
-        if not refrigerator_access:
+        if not RefrigeratorAccess.objects.filter(user=request.user, refrigerator_id=refrigerator_id).exists():
             return Response({"error": "You do not have access to this refrigerator."}, status=403)
 
-        # 냉장고 음식 조회
-        fridge_foods = FridgeFood.objects.filter(refrigerator_id=refrigerator_id).order_by('expiration_date')
-        if not fridge_foods.exists():
-            return Response({"message": "No foods found in this refrigerator."}, status=404)
+        params = request.query_params
+        # 음식 변경 시 인벤토리 버전이 올라가므로 변경이 없으면 목록 조회와 직렬화 없이 304 응답
+        # (이미지 URL의 요청 호스트, 필터/페이지, 소비기한 필터 기준일도 함께 반영)
+        etag = make_etag(
+            'fridge-foods', refrigerator_id, get_inventory_version(refrigerator_id), get_catalog_index().version,
+            request.get_host(), params.urlencode(), localdate().isoformat(),
+        )
+        response = not_modified(request, etag)
+        if response:
+            return response
+
+        # 기본 식품 정보(이름, 이미지)는 JOIN 없이 프로세스 카탈로그에서 조회
+        fridge_foods = FridgeFood.objects.filter(refrigerator_id=refrigerator_id)
+
+        storage_type = params.get('storage_type')
+        if storage_type:
+            if storage_type not in dict(FridgeFood.STORAGE_TYPE_CHOICES):
+                return Response({"error": "Invalid storage type."}, status=400)
+            fridge_foods = fridge_foods.filter(storage_type=storage_type)
+
+        expiring_within = params.get('expiring_within')
+        if expiring_within is not None:
+            if not expiring_within.isdigit():
+                return Response({"error": "expiring_within must be a non-negative integer."}, status=400)
+            fridge_foods = fridge_foods.filter(expiration_date__lte=localdate() + timedelta(days=int(expiring_within)))
+
+        group_by = params.get('group_by')
+        if group_by not in (None, 'storage_type'):
+            return Response({"error": "group_by only supports storage_type."}, status=400)
+        # 그룹별 개수는 페이지와 관계없이 필터 조건 전체에 대해 DB에서 집계
+        counts = (
+            dict(fridge_foods.order_by().values_list('storage_type').annotate(count=Count('id')))
+            if group_by else None
+        )
 
-        serializer = FridgeFoodSerializer(fridge_foods, many=True, context={'request': request})
-        return Response(serializer.data, status=200)
+        fridge_foods = fridge_foods.order_by('expiration_date', 'id')
+        limit = params.get('limit')
+        cursor = params.get('cursor')
+        next_cursor = None
+        if limit is not None or cursor is not None:
+            try:
+                limit = min(int(limit or FRIDGE_FOOD_PAGE_MAX), FRIDGE_FOOD_PAGE_MAX)
+                if limit < 1:
+                    raise ValueError
+                if cursor:
+                    expiration_date, last_id = _decode_cursor(cursor)
+                    fridge_foods = fridge_foods.filter(
+                        Q(expiration_date__gt=expiration_date) | Q(expiration_date=expiration_date, id__gt=last_id)
+                    )
+            except ValueError:
+                return Response({"error": "Invalid limit or cursor."}, status=400)
+
+            # 한 건 더 조회해 다음 페이지 존재 여부 판단
+            fridge_foods = list(fridge_foods[:limit + 1])
+            if len(fridge_foods) > limit:
+                fridge_foods = fridge_foods[:limit]
+                next_cursor = _encode_cursor(fridge_foods[-1])
+        elif not group_by and not storage_type and expiring_within is None:
+            # 조건 없는 전체 조회는 버전 캐시 사용, 기존처럼 빈 냉장고에 404 응답 (별도 exists() 없이 결과로 판단)
+            data = get_cached_inventory(
+                refrigerator_id,
+                request.get_host(),
+                lambda: list(FridgeFoodSerializer(fridge_foods, many=True, context={'request': request}).data),
+            )
+            if not data:
+                return Response({"message": "No foods found in this refrigerator."}, status=404)
+            return with_etag(Response(data, status=200), etag)
+
+        data = FridgeFoodSerializer(fridge_foods, many=True, context={'request': request}).data
+        if group_by:
+            data = [
+                {
+                    "storage_type": value,
+                    "storage_type_display": label,
+                    "count": counts.get(value, 0),
+                    "foods": [food for food in data if food['storage_type'] == value],
+                }
+                for value, label in FridgeFood.STORAGE_TYPE_CHOICES
+            ]
+        if limit is not None or cursor is not None:
+            data = {"results": data, "next_cursor": next_cursor}
+        return with_etag(Response(data, status=200), etag)
 
     @extend_schema(
         summary="음식 추가",
@@ -226,16 +381,103 @@ class FridgeFoodViewSet(viewsets.ViewSet):
             food = FridgeFood.objects.create(
                 refrigerator=refrigerator,
                 name=name,
-                default_food_id=30,
+                default_food_id=CUSTOM_FOOD_DEFAULT_ID,
                 storage_type=storage_type,
                 purchase_date=purchase_date,
                 expiration_date=expiration_date,
                 quantity=quantity
             )
 
+        schedule_expiry_notifications([food])
+
         serializer = FridgeFoodSerializer(food, context={'request': request})
         return Response(serializer.data, status=201)
 
+    @extend_schema(
+        summary="음식 일괄 추가",
+        description=(
+            f"장보기 후 여러 음식을 한 번에 추가합니다 (최대 {FRIDGE_FOOD_BULK_MAX}개). "
+            "항목별로 검증해 유효한 항목만 하나의 트랜잭션으로 추가하고, 항목별 결과를 반환합니다. "
+            "모두 성공하면 201, 일부만 성공하면 207, 모두 실패하면 400을 반환합니다."
+        ),
+        tags=["Foods"],
+        request={
+            "application/json": {
+                "type": "object",
+                "properties": {"items": {"type": "array", "items": {"type": "object"}}},
+                "example": {
+                    "items": [
+                        {"default_food_id": 1, "purchase_date": "2024-12-01", "expiration_date": "2024-12-10", "quantity": 2},
+                        {"name": "수박", "storage_type": "room_temp", "purchase_date": "2024-12-01", "expiration_date": "2024-12-05", "quantity": 1},
+                    ]
+                },
+                "required": ["items"],
+            }
+        },
+        responses={
+            201: OpenApiResponse(description="모든 항목 추가 성공"),
+            207: OpenApiResponse(description="일부 항목 추가 실패 (results의 항목별 status/errors 참고)"),
+            400: OpenApiResponse(description="잘못된 요청 또는 모든 항목 실패"),
+            403: OpenApiResponse(description="냉장고 접근 권한 없음"),
+        },
+    )
+    def bulk_create(self, request, refrigerator_id):
+        """
+        음식 일괄 추가
+        """
+        items = request.data.get('items')
+        if not isinstance(items, list) or not items:
+            return Response({"error": "Items are required."}, status=400)
+        if len(items) > FRIDGE_FOOD_BULK_MAX:
+            return Response({"error": f"Up to {FRIDGE_FOOD_BULK_MAX} items can be added at once."}, status=400)
+
+        if not RefrigeratorAccess.objects.filter(user=request.user, refrigerator_id=refrigerator_id).exists():
+            return Response({"error": "You do not have access to this refrigerator."}, status=403)
+
+        results = [None] * len(items)
+        valid = []
+        for index, item in enumerate(items):
+            serializer = FridgeFoodBulkItemSerializer(data=item)
+            if serializer.is_valid():
+                valid.append((index, serializer.validated_data))
+            else:
+                results[index] = {"index": index, "status": 400, "errors": serializer.errors}
+
+        # 모든 디폴트 음식을 한 번의 쿼리로 조회
+        default_foods = DefaultFood.objects.in_bulk(
+            {data.get('default_food_id') or CUSTOM_FOOD_DEFAULT_ID for _, data in valid}
+        )
+        foods = []
+        for index, data in valid:
+            default_food = default_foods.get(data.get('default_food_id') or CUSTOM_FOOD_DEFAULT_ID)
+            if default_food is None:
+                results[index] = {"index": index, "status": 404, "errors": {"default_food_id": ["Default food not found."]}}
+                continue
+            foods.append((index, FridgeFood(
+                refrigerator_id=refrigerator_id,
+                name=data.get('name'),
+                default_food=default_food,
+                storage_type=data['storage_type'],
+                purchase_date=data['purchase_date'],
+                expiration_date=data['expiration_date'],
+                quantity=data['quantity'],
+            )))
+
+        if foods:
+            with transaction.atomic():
+                created = FridgeFood.objects.bulk_create([food for _, food in foods])
+                schedule_expiry_notifications(created)
+                # bulk_create는 post_save 시그널을 보내지 않으므로 인벤토리 버전을 직접 갱신
+                transaction.on_commit(partial(bump_inventory_version, refrigerator_id))
+
+            data = FridgeFoodSerializer(created, many=True, context={'request': request}).data
+            for (index, _), food in zip(foods, data):
+                results[index] = {"index": index, "status": 201, "food": food}
+
+        failed = len(items) - len(foods)
+        status_code = 201 if not failed else 207 if foods else 400
+        return Response({"created": len(foods), "failed": failed, "results": results}, status=status_code)
+
     @extend_schema(
         summary="냉장고 음식 수정",
         description="냉장고에 있는 음식을 수정합니다. 디폴트 푸드인 경우 구매일자, 소비기한, 수량만 수정 가능하며, 사용자 정의 푸드인 경우 이름도 수정 가능합니다.",
@@ -267,7 +509,7 @@ class FridgeFoodViewSet(viewsets.ViewSet):
         if not food:
             return Response({"error": "Food not found."}, status=404)
 
-        if food.default_food.id == 30:
+        if food.default_food_id == CUSTOM_FOOD_DEFAULT_ID:
             food.name = request.data.get('name', food.name)
             food.storage_type = request.data.get('storage_type')
             food.purchase_date = request.data.get('purchase_date', food.purchase_date)
@@ -280,6 +522,8 @@ class FridgeFoodViewSet(viewsets.ViewSet):
             food.quantity = request.data.get('quantity', food.quantity)
 
         food.save()
+        schedule_expiry_notifications([food])
+
         serializer = FridgeFoodSerializer(food, context={'request': request})
         return Response(serializer.data, status=200)
 
@@ -304,6 +548,7 @@ class FridgeFoodViewSet(viewsets.ViewSet):
         food = FridgeFood.objects.filter(refrigerator_id=refrigerator_id, id=id).first()
         if not food:
             return Response({"error": "Food not found."}, status=404)
+        # 알림 예약은 CASCADE로 함께 삭제됨
         food.delete()
         return Response({"message": "Food deleted successfully."}, status=204)
 
@@ -345,40 +590,164 @@ class FoodHistoryView(APIView):
         if not action or not quantity:
             return Response({"error": "Action and quantity are required."}, status=400)
 
-            # 특정 냉장고에 속하는지 확인
-        try:
-            fridge_food = FridgeFood.objects.get(id=id, refrigerator_id=refrigerator_id)
-        except FridgeFood.DoesNotExist:
-            raise Http404("Food not found in the specified refrigerator.")
-
         if action in ['consumed', 'discarded']:
-            if fridge_food.quantity < quantity:
+            if not isinstance(quantity, int) or quantity < 1:
+                return Response({"error": "Quantity must be a positive integer."}, status=400)
+
+            # 조회 없이 조건부 UPDATE 한 번으로 차감 (동시 요청 시 차감 유실 방지)
+            remaining_quantity = consume_fridge_food(request.user, refrigerator_id, id, action, quantity)
+            if remaining_quantity is None:
+                # 특정 냉장고에 속하는지 확인
+                if not FridgeFood.objects.filter(id=id, refrigerator_id=refrigerator_id).exists():
+                    raise Http404("Food not found in the specified refrigerator.")
                 return Response({"error": "Not enough quantity to perform this action."}, status=400)
 
-            FoodHistory.objects.create(
-                food_name=fridge_food.name or fridge_food.default_food,
-                user=request.user,
-                refrigerator=fridge_food.refrigerator,
-                fridge_food=fridge_food,
-                action=action,
-                quantity=quantity
-            )
-
-            fridge_food.quantity -= quantity
-
-            if fridge_food.quantity == 0:
-                fridge_food.delete()
-            else:
-                fridge_food.save()
-
             return Response({
                 "message": f"{action.capitalize()} recorded successfully.",
-                "remaining_quantity": fridge_food.quantity
+                "remaining_quantity": remaining_quantity
             }, status=201)
 
         return Response({"error": "Invalid action."}, status=400)
 
 
+class FoodHistoryBatchView(APIView):
+    """
+    음식 일괄 소비/폐기
+    """
+    permission_classes = [IsAuthenticated]
+
+    @extend_schema(
+        summary="음식 일괄 소비 또는 폐기 기록 추가",
+        description=(
+            "냉장고의 여러 음식을 한 번에 소비하거나 폐기합니다. 항목별로 결과를 반환하며, "
+            "일부 항목만 실패한 경우 207, 모두 실패한 경우 400을 반환합니다. "
+            "같은 음식이 여러 번 포함되면 순서대로 차감합니다."
+        ),
+        tags=["Foods"],
+        request={
+            "application/json": {
+                "type": "object",
+                "properties": {
+                    "items": {
+                        "type": "array",
+                        "maxItems": FOOD_HISTORY_BATCH_MAX,
+                        "items": {
+                            "type": "object",
+                            "properties": {
+                                "food_id": {"type": "integer", "example": 12, "description": "냉장고 음식 ID"},
+                                "action": {"type": "string", "enum": ["consumed", "discarded"], "example": "consumed", "description": "행동 유형 (consumed: 먹었어요, discarded: 폐기했어요)"},
+                                "quantity": {"type": "integer", "example": 2, "description": "소비 또는 폐기한 수량"},
+                            },
+                            "required": ["food_id", "action", "quantity"]
+                        }
+                    }
+                },
+                "required": ["items"]
+            }
+        },
+        responses={
+            201: OpenApiResponse(
+                description="모든 항목 처리 성공",
+                examples=[
+                    OpenApiExample(
+                        "일괄 처리 결과",
+                        value={
+                            "recorded": 2,
+                            "failed": 0,
+                            "results": [
+                                {"index": 0, "status": 201, "food_id": 12, "remaining_quantity": 1},
+                                {"index": 1, "status": 201, "food_id": 15, "remaining_quantity": 0}
+                            ]
+                        }
+                    )
+                ]
+            ),
+            207: {"description": "일부 항목 처리 실패"},
+            400: {"description": "잘못된 요청"},
+            403: {"description": "냉장고 접근 권한이 없습니다."}
+        },
+    )
+    def post(self, request, refrigerator_id):
+        items = request.data.get('items')
+        if not isinstance(items, list) or not items:
+            return Response({"error": "Items are required."}, status=400)
+        if len(items) > FOOD_HISTORY_BATCH_MAX:
+            return Response({"error": f"Up to {FOOD_HISTORY_BATCH_MAX} items can be recorded at once."}, status=400)
+
+        if not RefrigeratorAccess.objects.filter(user=request.user, refrigerator_id=refrigerator_id).exists():
+            return Response({"error": "You do not have access to this refrigerator."}, status=403)
+
+        results = [None] * len(items)
+        valid = []
+        for index, item in enumerate(items):
+            serializer = FoodHistoryBatchItemSerializer(data=item)
+            if serializer.is_valid():
+                valid.append((index, serializer.validated_data))
+            else:
+                results[index] = {"index": index, "status": 400, "errors": serializer.errors}
+
+        recorded = 0
+        if valid:
+            with transaction.atomic():
+                # 대상 음식 행을 한 번에 잠가 동시 차감으로 수량이 음수가 되지 않도록 함
+                foods = {
+                    food.id: food
+                    for food in FridgeFood.objects.select_for_update().filter(
+                        refrigerator_id=refrigerator_id, id__in={data['food_id'] for _, data in valid}
+                    )
+                }
+
+                histories = []
+                remaining = {}
+                for index, data in valid:
+                    food = foods.get(data['food_id'])
+                    if food is None:
+                        results[index] = {"index": index, "status": 404, "error": "Food not found in the specified refrigerator."}
+                        continue
+                    quantity = remaining.get(food.id, food.quantity)
+                    if quantity < data['quantity']:
+                        results[index] = {"index": index, "status": 400, "error": "Not enough quantity to perform this action."}
+                        continue
+
+                    remaining[food.id] = quantity - data['quantity']
+                    histories.append(FoodHistory(
+                        food_name=food.name or getattr(get_catalog_entry(food.default_food_id), 'name', None),
+                        user=request.user,
+                        refrigerator_id=refrigerator_id,
+                        fridge_food=food,
+                        action=data['action'],
+                        quantity=data['quantity'],
+                        default_food_id=food.default_food_id,
+                        storage_type=food.storage_type,
+                        purchase_date=food.purchase_date,
+                        expiration_date=food.expiration_date
+                    ))
+                    results[index] = {"index": index, "status": 201, "food_id": food.id, "remaining_quantity": remaining[food.id]}
+
+                if histories:
+                    FoodHistory.objects.bulk_create(histories)
+
+                    # 남은 수량은 하나의 UPDATE로 반영
+                    decremented = {food_id: quantity for food_id, quantity in remaining.items() if quantity > 0}
+                    if decremented:
+                        FridgeFood.objects.filter(id__in=decremented).update(quantity=Case(
+                            *[When(id=food_id, then=quantity) for food_id, quantity in decremented.items()],
+                            default=F('quantity'),
+                            output_field=PositiveIntegerField()
+                        ))
+                    # 수량이 0이 된 음식은 한 번에 삭제 (기록의 fridge_food는 NULL, 알림 예약은 CASCADE로 함께 삭제됨)
+                    emptied = [food_id for food_id, quantity in remaining.items() if quantity == 0]
+                    if emptied:
+                        FridgeFood.objects.filter(id__in=emptied).delete()
+                    # update()는 post_save 시그널을 보내지 않으므로 인벤토리 버전을 직접 갱신
+                    transaction.on_commit(partial(bump_inventory_version, refrigerator_id))
+                    recorded = len(histories)
+
+        failed = len(items) - recorded
+        status_code = 201 if not failed else 207 if recorded else 400
+        return Response({"recorded": recorded, "failed": failed, "results": results}, status=status_code)
+
+
 class MonthlyTopConsumedFoodView(APIView):
     """
     월간 소비 식품 Top5
@@ -589,18 +958,20 @@ class MonthlyConsumptionRankingView(APIView):
         return Response(data, status=200)
 
 
-class FoodExpirationQueryView(APIView):
+class FoodExpirationQueryView(AsyncAPIView):
+    """
+    식품 소비기한 조회 (비동기 뷰)
+    LLM 응답을 기다리는 동안 워커를 점유하지 않도록 비동기 클라이언트로 호출합니다.
+    """
     permission_classes = [IsAuthenticated]
-    client = OpenAI(api_key=config("OPENAI_API_KEY"))
-    CACHE_TIMEOUT = 60 * 5  # 5분간 캐시 유지
-
-    def get_cache_key(self, food_name, purchase_date, storage_type):
-        """캐시 키 생성"""
-        return f"food_expiration:{food_name}:{purchase_date}:{storage_type}"
 
     @extend_schema(
         summary="식품 소비기한 조회",
-        description="ChatGPT를 사용하여 특정 식품의 소비기한 정보를 YYYY-MM-DD 형식으로 반환합니다.",
+        description=(
+            "특정 식품의 소비기한 정보를 YYYY-MM-DD 형식으로 반환합니다. "
+            "기본 식품은 식품 기록으로 집계한 보관 기간 통계(폐기까지 일수 중앙값)로 예측하고, "
+            "통계가 없으면 저장된 보관 기간(일)으로 계산하며, 둘 다 없을 때만 ChatGPT에 물어 저장합니다."
+        ),
         tags=["Openai"],
         parameters=[
             OpenApiParameter(
@@ -634,7 +1005,7 @@ class FoodExpirationQueryView(APIView):
             OpenApiParameter(
                 name="storage_type",
                 location=OpenApiParameter.QUERY,
-                description="보관 방법 (냉장/냉동/실온)",
+                description="보관 방법 (냉장/냉동/실온 또는 refrigerated/frozen/room_temp)",
                 required=True,
                 type=str,
                 examples=[
@@ -664,10 +1035,14 @@ class FoodExpirationQueryView(APIView):
             500: OpenApiResponse(
                 description="서버 오류",
                 examples={"error": "Failed to fetch expiration info: API error"}
+            ),
+            503: OpenApiResponse(
+                description="동시 요청 한도 초과",
+                examples={"error": "Too many concurrent LLM requests."}
             )
         }
     )
-    def get(self, request):
+    async def get(self, request):
         food_name = request.query_params.get('name')
         purchase_date = request.query_params.get('purchase_date')
         storage_type = request.query_params.get('storage_type')
@@ -678,53 +1053,63 @@ class FoodExpirationQueryView(APIView):
                 status=400
             )
 
-        # 캐시 키 생성
-        cache_key = self.get_cache_key(food_name, purchase_date, storage_type)
-        
-        # 캐시에서 데이터 조회
-        cached_data = cache.get(cache_key)
-        if cached_data:
-            return Response(cached_data, status=200)
+        try:
+            purchased = date.fromisoformat(purchase_date)
+        except ValueError:
+            return Response({"error": "purchase_date must be YYYY-MM-DD."}, status=400)
+        storage = normalize_storage_type(storage_type)
+        if storage is None:
+            return Response({"error": "Invalid storage type."}, status=400)
+        name = normalize_food_name(food_name)
 
         try:
-            completion = self.client.chat.completions.create(
-                model="gpt-3.5-turbo",
-                messages=[
-                    {
-                        "role": "system",
-                        "content": (
-                            "당신은 식품 소비기한 전문가입니다. "
-                            "식품의 이름, 제조일자, 보관 방법을 고려하여 소비기한을 계산해주세요. "
-                            "반드시 'YYYY-MM-DD' 형식으로만 답변하고, "
-                            "어떠한 추가적인 문장이나 설명 없이 날짜만 출력하세요."
-                        ),
-                    },
-                    {
-                        "role": "user",
-                        "content": (
-                            f"다음 식품의 소비기한을 'YYYY-MM-DD' 형식으로만 답변해주세요.\n"
-                            f"제품명: {food_name}\n"
-                            f"제조일자: {purchase_date}\n"
-                            f"보관방법: {storage_type}"
-                        )
-                    }
-                ],
-                temperature=0.0  # 일관된 응답을 위해 0으로 설정
-            )
+            # 기본 식품은 식품 기록 통계로 예측하고, 없으면 저장된 보관 기간, 둘 다 없을 때만 LLM 호출
+            predictor = await aget_shelf_life_predictor()
+            days = predictor.predict_days(name, storage)
+            if days is None:
+                days = await aget_shelf_life_days(name, storage)
+            if days is None:
+                llm_request = dict(
+                    model="gpt-3.5-turbo",
+                    messages=[
+                        {
+                            "role": "system",
+                            "content": (
+                                "당신은 식품 소비기한 전문가입니다. "
+                                "식품의 이름과 보관 방법을 고려하여 구매(제조)일로부터 소비기한까지의 일수를 계산해주세요. "
+                                "반드시 정수 하나로만 답변하고, "
+                                "어떠한 추가적인 문장이나 설명 없이 숫자만 출력하세요."
+                            ),
+                        },
+                        {
+                            "role": "user",
+                            "content": (
+                                f"다음 식품의 소비기한까지 일수를 숫자로만 답변해주세요.\n"
+                                f"제품명: {food_name}\n"
+                                f"보관방법: {STORAGE_TYPE_LABELS[storage]}"
+                            )
+                        }
+                    ],
+                    temperature=0.0  # 일관된 응답을 위해 0으로 설정
+                )
+
+                async def ask_shelf_life_days():
+                    completion = await create_chat_completion(**llm_request)
+                    days = parse_shelf_life_days(completion.choices[0].message.content)
+                    return await asave_shelf_life_days(name, storage, days)
 
-            expiration = completion.choices[0].message.content.strip()
+                # 같은 식품을 동시에 조회하는 요청은 LLM 호출 하나의 결과를 함께 사용
+                days = await singleflight.ado(singleflight.prompt_key(**llm_request), ask_shelf_life_days)
 
             response_data = {
                 "food_name": food_name,
                 "storage_type": storage_type,
-                "expiration": expiration
+                "expiration": (purchased + timedelta(days=days)).isoformat()
             }
-
-            # 응답 데이터를 캐시에 저장
-            cache.set(cache_key, response_data, self.CACHE_TIMEOUT)
-
             return Response(response_data, status=200)
 
+        except LLMBusyError as e:
+            return Response({"error": str(e)}, status=503)
         except Exception as e:
             return Response(
                 {"error": f"Failed to fetch expiration info: {str(e)}"}, 
@@ -732,19 +1117,27 @@ class FoodExpirationQueryView(APIView):
             )
 
 
-class RecipeRecommendationView(APIView):
-    """레시피 추천 API"""
+class RecipeRecommendationView(AsyncAPIView):
+    """
+    레시피 추천 API (비동기 뷰)
+    같은 재료의 추천을 기다리는 요청이 다른 동기 뷰의 스레드를 막지 않도록 비동기로 처리합니다.
+    """
     permission_classes = [IsAuthenticated]
-    client = OpenAI(api_key=config("OPENAI_API_KEY"))
+    CACHE_TIMEOUT = 60 * 60 * 6  # 6시간 캐시 유지
 
-    def get_ingredients_info(self, refrigerator):
+    def get_cache_key(self, ingredients):
+        """정렬한 재료 목록의 해시로 캐시 키 생성 (재료 구성이 같은 냉장고끼리 공유)"""
+        digest = hashlib.sha256(json.dumps(sorted(ingredients), ensure_ascii=False).encode()).hexdigest()
+        return f"recipe_recommendation:{digest}"
+
+    async def get_ingredients_info(self, refrigerator):
         """냉장고의 재료 정보 조회"""
         fridge_foods = (
             FridgeFood.objects.filter(refrigerator=refrigerator)
             .values_list('name', flat=True)
             .distinct()
         )
-        return {food for food in fridge_foods if food}
+        return {food async for food in fridge_foods if food}
 
     def check_available_ingredients(self, recipe_ingredients, available_ingredients):
         """레시피 재료와 냉장고 재료를 매칭하여 있는/없는 재료 구분"""
@@ -755,7 +1148,10 @@ class RecipeRecommendationView(APIView):
 
     @extend_schema(
         summary="냉장고 재료 기반 레시피 추천",
-        description="냉장고에 있는 재료들로 만들 수 있는 요리를 추천합니다.",
+        description=(
+            "냉장고에 있는 재료들로 만들 수 있는 요리를 추천합니다. "
+            "재료 구성이 같으면 6시간 동안 캐시된 추천을 반환합니다 (재료가 같은 다른 냉장고와 공유)."
+        ),
         tags=["Openai"],
         parameters=[
             OpenApiParameter(
@@ -795,23 +1191,29 @@ class RecipeRecommendationView(APIView):
             404: OpenApiResponse(
                 description="재료 없음",
                 examples={"error": "No ingredients found in refrigerator."}
+            ),
+            503: OpenApiResponse(
+                description="LLM 동시 호출 한도 초과",
+                examples={"error": "Too many concurrent LLM requests."}
             )
         }
     )
-    def get(self, request, refrigerator_id):
+    async def get(self, request, refrigerator_id):
         """냉장고 재료 기반 레시피 추천"""
         # 냉장고 접근 권한 확인
-        refrigerator = get_object_or_404(Refrigerator, id=refrigerator_id)
-        if not refrigerator.access_list.filter(user=request.user).exists():
+        refrigerator = await Refrigerator.objects.filter(id=refrigerator_id).afirst()
+        if refrigerator is None:
+            raise Http404("No Refrigerator matches the given query.")
+        if not await refrigerator.access_list.filter(user=request.user).aexists():
             return Response({"error": "You do not have access to this refrigerator."}, status=403)
 
         # 냉장고 재료 조회
-        available_ingredients = self.get_ingredients_info(refrigerator)
+        available_ingredients = await self.get_ingredients_info(refrigerator)
         if not available_ingredients:
             return Response({"error": "No ingredients found in refrigerator."}, status=404)
 
         try:
-            completion = self.client.chat.completions.create(
+            llm_request = dict(
                 model="gpt-3.5-turbo",
                 messages=[
                     {
@@ -864,22 +1266,39 @@ class RecipeRecommendationView(APIView):
                 response_format={ "type": "json_object" }
             )
 
-            recipes_data = json.loads(completion.choices[0].message.content)
-            
-            # 각 레시피에 대해 있는/없는 재료 구분
+            async def ask_recipes():
+                completion = await create_chat_completion(**llm_request)
+                recipes_data = json.loads(completion.choices[0].message.content)
+                await cache.aset(cache_key, recipes_data, self.CACHE_TIMEOUT)
+                return recipes_data
+
+            # 재료 구성이 바뀌지 않았으면(다른 냉장고 포함) LLM 호출 없이 캐시된 추천 사용
+            cache_key = self.get_cache_key(available_ingredients)
+            recipes_data = await cache.aget(cache_key)
+            if recipes_data is None:
+                # 같은 재료 목록으로 동시에 요청하면 LLM 호출 하나의 결과를 함께 사용
+                recipes_data = await singleflight.ado(singleflight.prompt_key(**llm_request), ask_recipes)
+
+            # 각 레시피에 대해 있는/없는 재료 구분 (공유된 결과를 변경하지 않도록 복사)
+            recipes = []
             for recipe in recipes_data['recipes']:
                 available, missing = self.check_available_ingredients(
                     recipe['ingredients'],
                     available_ingredients
                 )
-                recipe['available_ingredients'] = sorted(available)
-                recipe['missing_ingredients'] = sorted(missing)
+                recipes.append({
+                    **recipe,
+                    'available_ingredients': sorted(available),
+                    'missing_ingredients': sorted(missing),
+                })
 
             return Response({
                 "refrigerator_ingredients": sorted(available_ingredients),
-                "recipes": recipes_data['recipes']
+                "recipes": recipes
             }, status=200)
 
+        except LLMBusyError as e:
+            return Response({"error": str(e)}, status=503)
         except Exception as e:
             return Response(
                 {"error": f"Failed to get recipe recommendations: {str(e)}"}, 
@@ -0,0 +1,40 @@
+import json
+
+from channels.db import database_sync_to_async
+from channels.generic.websocket import AsyncWebsocketConsumer
+
+from notifications.push import notification_snapshot, user_group
+
+
+class NotificationConsumer(AsyncWebsocketConsumer):
+    """
+    사용자별 알림 실시간 수신
+    접속 시 현재 알림 스냅샷을 보내고, 이후 새로 생성된 알림을 전송합니다.
+    """
+    async def connect(self):
+        self.user = self.scope['user']
+        if not self.user.is_authenticated:
+            await self.close()
+            return
+
+        # 스냅샷 조회 중 생성된 알림을 놓치지 않도록 그룹에 먼저 참여
+        self.group_name = user_group(self.user.id)
+        await self.channel_layer.group_add(self.group_name, self.channel_name)
+        await self.accept()
+
+        notifications = await database_sync_to_async(notification_snapshot)(self.user.id, self.user.timezone)
+        await self.send(text_data=json.dumps({
+            'type': 'snapshot',
+            'notifications': notifications,
+        }, ensure_ascii=False))
+
+    async def disconnect(self, close_code):
+        if hasattr(self, 'group_name'):
+            await self.channel_layer.group_discard(self.group_name, self.channel_name)
+
+    # 새 알림 수신
+    async def notification_created(self, event):
+        await self.send(text_data=json.dumps({
+            'type': 'notifications',
+            'notifications': event['notifications'],
+        }, ensure_ascii=False))
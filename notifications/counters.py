@@ -0,0 +1,90 @@
+"""
+읽지 않은 알림 수 카운터
+
+(사용자, 냉장고, 디데이)별 카운터를 캐시(Redis)에 보관합니다.
+카운터는 사용자 현지 시간대의 자정에 만료되며, 없는 카운터는 조회 시 DB에서 다시 계산합니다(자가 복구).
+"""
+from datetime import timedelta
+
+from django.core.cache import cache
+from django.utils.timezone import localtime, now
+
+from notifications.models import Notification
+
+COUNTER_KEY = 'notifications:unread:{user_id}:{refrigerator_id}:{d_day}'
+D_DAYS = ('D-3', 'D-0')
+
+
+def _counter_key(user_id, refrigerator_id, d_day):
+    return COUNTER_KEY.format(user_id=user_id, refrigerator_id=refrigerator_id, d_day=d_day)
+
+
+def _seconds_until_midnight(user_timezone=None):
+    current = localtime(timezone=user_timezone)
+    midnight = (current + timedelta(days=1)).replace(hour=0, minute=0, second=0, microsecond=0)
+    return max(1, int((midnight - current).total_seconds()))
+
+
+def counter_window(d_day, user_timezone=None):
+    """
+    카운터 집계 범위 (created_at 시작, 끝). D-0은 오늘, D-3은 최근 7일(끝 없음)
+    오늘은 사용자 시간대(user_timezone, 없으면 서버 시간대) 기준입니다.
+    """
+    if d_day == 'D-0':
+        start_of_today = localtime(timezone=user_timezone).replace(hour=0, minute=0, second=0, microsecond=0)
+        return start_of_today, start_of_today + timedelta(days=1)
+    return now() - timedelta(days=7), None
+
+
+def _unread_notifications(user_id, refrigerator_id, d_day, user_timezone=None):
+    """알림 목록/팝업 API와 같은 조회 범위의 읽지 않은 알림"""
+    notifications = Notification.objects.filter(
+        user_id=user_id, refrigerator_id=refrigerator_id, d_day=d_day, is_read=False
+    )
+    start, end = counter_window(d_day, user_timezone)
+    notifications = notifications.filter(created_at__gte=start)
+    if end is not None:
+        notifications = notifications.filter(created_at__lt=end)
+    return notifications
+
+
+def reconcile_unread(user_id, refrigerator_id, d_day, user_timezone=None):
+    """DB에서 읽지 않은 알림 수를 다시 계산해 사용자 현지 자정까지 카운터에 저장"""
+    count = _unread_notifications(user_id, refrigerator_id, d_day, user_timezone).count()
+    cache.set(_counter_key(user_id, refrigerator_id, d_day), count, _seconds_until_midnight(user_timezone))
+    return count
+
+
+def get_unread_counts(user_id, refrigerator_id, user_timezone=None):
+    """디데이별 읽지 않은 알림 수 (캐시 미스인 카운터만 DB에서 재계산)"""
+    keys = {d_day: _counter_key(user_id, refrigerator_id, d_day) for d_day in D_DAYS}
+    cached = cache.get_many(keys.values())
+    return {
+        d_day: cached[key] if key in cached else reconcile_unread(user_id, refrigerator_id, d_day, user_timezone)
+        for d_day, key in keys.items()
+    }
+
+
+def invalidate_unread(groups):
+    """
+    새 알림이 생성된 카운터 삭제 (다음 조회 시 DB에서 다시 계산)
+    groups: (user_id, refrigerator_id, d_day) 목록
+    ignore_conflicts로 건너뛴 행(재시도, 동시 실행)은 생성 건수를 알 수 없으므로 증가시키지 않고 다시 계산합니다.
+    """
+    cache.delete_many([_counter_key(*group) for group in set(groups)])
+
+
+def decrement_unread(counts):
+    """
+    읽음 처리된 알림 수만큼 카운터 감소
+    counts: {(user_id, refrigerator_id, d_day): 감소량}
+    카운터가 DB와 어긋나 음수가 되면 삭제해 다음 조회 시 다시 계산합니다.
+    """
+    keys = {_counter_key(*group): amount for group, amount in counts.items()}
+    for key in cache.get_many(keys.keys()):
+        try:
+            if cache.decr(key, keys[key]) < 0:
+                cache.delete(key)
+        except ValueError:
+            # 조회와 감소 사이에 만료된 경우
+            pass
@@ -0,0 +1,72 @@
+"""
+벤치마크용 시드 데이터 생성 도우미
+"""
+from datetime import timedelta
+
+from foods.models import DefaultFood, FridgeFood
+from notifications.services import schedule_expiry_notifications
+from refriges.models import Refrigerator, RefrigeratorAccess
+from users.models import CustomUser
+
+BENCH_PREFIX = 'bench'
+BATCH_SIZE = 10000
+
+
+def seed_expiring_foods(today, food_count, refrigerator_count, members_per_fridge=2, stdout=None):
+    """
+    냉장고, 구성원, 식품을 bulk_create로 생성
+    식품의 소비기한은 D-3 / D-0 / 그 외 날짜에 고르게 분포하며, 알림 예약도 함께 등록합니다.
+    """
+    default_food, _ = DefaultFood.objects.get_or_create(
+        name=f'{BENCH_PREFIX}-food', defaults={'image': 'food_images/other.svg', 'comment': '벤치마크 알림멘트'}
+    )
+
+    refrigerators = Refrigerator.objects.bulk_create(
+        [Refrigerator(name=f'{BENCH_PREFIX}-{i}') for i in range(refrigerator_count)], batch_size=BATCH_SIZE
+    )
+    users = CustomUser.objects.bulk_create(
+        [
+            CustomUser(email=f'{BENCH_PREFIX}-{i}@sigkihan.test', name=f'{BENCH_PREFIX}-{i}', image=None)
+            for i in range(refrigerator_count * members_per_fridge)
+        ],
+        batch_size=BATCH_SIZE,
+    )
+    RefrigeratorAccess.objects.bulk_create(
+        [
+            RefrigeratorAccess(
+                user=user,
+                refrigerator=refrigerators[i // members_per_fridge],
+                role='owner' if i % members_per_fridge == 0 else 'member',
+            )
+            for i, user in enumerate(users)
+        ],
+        batch_size=BATCH_SIZE,
+    )
+
+    expiration_dates = [today, today + timedelta(days=3), today + timedelta(days=10)]
+    batch = []
+    for i in range(food_count):
+        batch.append(FridgeFood(
+            refrigerator=refrigerators[i % refrigerator_count],
+            default_food=default_food,
+            storage_type='refrigerated',
+            purchase_date=today - timedelta(days=7),
+            expiration_date=expiration_dates[i % len(expiration_dates)],
+            quantity=1,
+        ))
+        if len(batch) >= BATCH_SIZE:
+            schedule_expiry_notifications(FridgeFood.objects.bulk_create(batch), today)
+            batch.clear()
+            if stdout:
+                stdout.write(f'  seeded {i + 1}/{food_count} foods')
+    if batch:
+        schedule_expiry_notifications(FridgeFood.objects.bulk_create(batch), today)
+
+    return refrigerators
+
+
+def cleanup_seed():
+    """시드 데이터 삭제 (CASCADE로 식품, 권한, 알림까지 함께 삭제)"""
+    Refrigerator.objects.filter(name__startswith=f'{BENCH_PREFIX}-').delete()
+    CustomUser.objects.filter(email__endswith='@sigkihan.test', name__startswith=f'{BENCH_PREFIX}-').delete()
+    DefaultFood.objects.filter(name=f'{BENCH_PREFIX}-food').delete()
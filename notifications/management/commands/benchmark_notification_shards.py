@@ -0,0 +1,59 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core.management.base import BaseCommand
+from django.db import connections
+from django.utils.timezone import localdate
+
+from notifications.models import Notification
+from notifications.services import split_refrigerator_ranges
+from notifications.tasks import generate_notification_shard
+from ._seed import BENCH_PREFIX, cleanup_seed, seed_expiring_foods
+
+
+def _run_shard(today, start, end):
+    # 각 스레드가 하나의 워커 역할 (Celery eager 실행, 자체 DB 커넥션 사용)
+    try:
+        return generate_notification_shard.apply(args=(today.isoformat(), start, end)).get()
+    finally:
+        connections.close_all()
+
+
+class Command(BaseCommand):
+    help = (
+        "시드 데이터로 샤드 병렬 알림 생성 성능을 워커 수별(기본 1, 4, 8)로 비교합니다. "
+        "샤드는 eager 모드 Celery 태스크로 스레드 풀에서 동시에 실행되며, 시드 데이터는 종료 시 삭제됩니다. "
+        "동시 쓰기가 필요하므로 PostgreSQL에서 실행해야 합니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--workers', type=int, nargs='+', default=[1, 4, 8], help='비교할 워커 수 목록')
+        parser.add_argument('--foods', type=int, default=200_000, help='생성할 냉장고 식품 수')
+        parser.add_argument('--refrigerators', type=int, default=20_000, help='생성할 냉장고 수')
+        parser.add_argument('--members', type=int, default=2, help='냉장고당 구성원 수')
+
+    def handle(self, *args, **options):
+        today = localdate()
+        self.stdout.write(f"Seeding {options['foods']} foods into {options['refrigerators']} refrigerators...")
+        seed_expiring_foods(today, options['foods'], options['refrigerators'], options['members'], self.stdout)
+
+        try:
+            for workers in options['workers']:
+                Notification.objects.filter(refrigerator__name__startswith=f'{BENCH_PREFIX}-').delete()
+                ranges = split_refrigerator_ranges(today, workers)
+
+                started = time.perf_counter()
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    results = list(executor.map(lambda bounds: _run_shard(today, *bounds), ranges))
+                elapsed = time.perf_counter() - started
+
+                created = {}
+                for result in results:
+                    for d_day, count in result['created'].items():
+                        created[d_day] = created.get(d_day, 0) + count
+                shard_times = ', '.join(f"{result['elapsed']:.2f}s" for result in results)
+                self.stdout.write(self.style.SUCCESS(
+                    f"[workers={workers}] created={created} wall_time={elapsed:.2f}s shard_times=[{shard_times}]"
+                ))
+        finally:
+            cleanup_seed()
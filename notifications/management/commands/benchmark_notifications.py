@@ -0,0 +1,36 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+from django.utils.timezone import localdate
+
+from notifications.services import generate_expiry_notifications
+from ._seed import seed_expiring_foods
+
+
+class Command(BaseCommand):
+    help = "시드 데이터로 소비기한 알림 생성 성능(소요 시간, 쿼리 수)을 측정합니다. 모든 데이터는 롤백됩니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--foods', type=int, default=1_000_000, help='생성할 냉장고 식품 수')
+        parser.add_argument('--refrigerators', type=int, default=100_000, help='생성할 냉장고 수')
+        parser.add_argument('--members', type=int, default=2, help='냉장고당 구성원 수')
+
+    def handle(self, *args, **options):
+        today = localdate()
+
+        with transaction.atomic():
+            self.stdout.write(f"Seeding {options['foods']} foods into {options['refrigerators']} refrigerators...")
+            seed_expiring_foods(today, options['foods'], options['refrigerators'], options['members'], self.stdout)
+
+            for label in ('first run', 're-run'):
+                started = time.perf_counter()
+                with CaptureQueriesContext(connection) as queries:
+                    created = generate_expiry_notifications(today)
+                elapsed = time.perf_counter() - started
+                self.stdout.write(self.style.SUCCESS(
+                    f"[{label}] created={created} wall_time={elapsed:.2f}s queries={len(queries)}"
+                ))
+
+            transaction.set_rollback(True)
@@ -0,0 +1,89 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.utils.timezone import localdate, now
+
+from notifications.counters import counter_window
+from notifications.models import Notification
+from notifications.services import generate_expiry_notifications
+from ._seed import seed_expiring_foods
+
+
+def access_paths(user_id, refrigerator_id, user_timezone=None):
+    """알림 API의 조회 경로별 쿼리셋과 사용해야 하는 인덱스 (오늘 범위는 사용자 시간대 기준)"""
+    start_of_today, end_of_today = counter_window('D-0', user_timezone)
+    base = Notification.objects.filter(refrigerator_id=refrigerator_id, user_id=user_id)
+    return [
+        (
+            'NotificationListView',
+            base.filter(created_at__gte=now() - timedelta(days=7), d_day='D-3').order_by('-created_at'),
+            'idx_noti_user_fridge_dday_ts',
+        ),
+        (
+            'PopupNotificationListView',
+            base.filter(
+                d_day='D-0', is_read=False,
+                created_at__gte=start_of_today, created_at__lt=end_of_today,
+            ),
+            'idx_noti_unread',
+        ),
+        ('NotificationMarkAsReadView', base.filter(is_read=False, d_day='D-3'), 'idx_noti_unread'),
+        ('PopupNotificationMarkAsReadView', base.filter(is_read=False, d_day='D-0'), 'idx_noti_unread'),
+    ]
+
+
+def index_names(index_name):
+    """인덱스와 파티션별 하위 인덱스 이름 (파티션 테이블의 실행 계획에는 하위 인덱스 이름이 표시됨)"""
+    if connection.vendor != 'postgresql':
+        return {index_name}
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT c.relname FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid "
+            "WHERE i.inhparent = %s::regclass",
+            [index_name],
+        )
+        return {index_name, *(row[0] for row in cursor.fetchall())}
+
+
+def uses_index(plan, index_name):
+    """실행 계획이 인덱스(또는 그 파티션 인덱스)를 사용하는지 여부"""
+    return any(name in plan for name in index_names(index_name))
+
+
+class Command(BaseCommand):
+    help = (
+        "시드 데이터에서 알림 API 조회 경로의 실행 계획(EXPLAIN)을 출력하고, "
+        "기대한 인덱스를 사용하지 않으면 실패합니다. 모든 데이터는 롤백됩니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--foods', type=int, default=50_000, help='생성할 냉장고 식품 수')
+        parser.add_argument('--refrigerators', type=int, default=5_000, help='생성할 냉장고 수')
+
+    def handle(self, *args, **options):
+        today = localdate()
+        failures = []
+
+        with transaction.atomic():
+            refrigerators = seed_expiring_foods(today, options['foods'], options['refrigerators'])
+            generate_expiry_notifications(today)
+            # 절반은 읽음 처리해 부분 인덱스의 선택도를 현실적으로 맞춤
+            Notification.objects.filter(refrigerator_id__in=[r.id for r in refrigerators[::2]]).update(is_read=True)
+            with connection.cursor() as cursor:
+                cursor.execute(f'ANALYZE {Notification._meta.db_table}')
+
+            sample = Notification.objects.select_related('user').filter(refrigerator=refrigerators[1]).first()
+            paths = access_paths(sample.user_id, sample.refrigerator_id, sample.user.timezone)
+            for label, queryset, expected_index in paths:
+                plan = queryset.explain()
+                used = uses_index(plan, expected_index)
+                self.stdout.write(f"[{label}] expected={expected_index} used={used}\n{plan}\n")
+                if not used:
+                    failures.append(label)
+
+            transaction.set_rollback(True)
+
+        if failures:
+            raise CommandError(f"Expected index not used by: {', '.join(failures)}")
+        self.stdout.write(self.style.SUCCESS("All notification access paths use their indexes."))
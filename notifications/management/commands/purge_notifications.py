@@ -0,0 +1,32 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils.timezone import localdate
+
+from notifications.partitions import PURGE_BATCH_SIZE, purge_notifications, table_size
+
+
+def _format_size(size):
+    if size is None:
+        return 'unknown'
+    return f"table={size['table'] / 1024 / 1024:.2f}MB indexes={size['indexes'] / 1024 / 1024:.2f}MB"
+
+
+class Command(BaseCommand):
+    help = (
+        "보존 기간이 지난 알림을 정리하고 정리 전후의 알림 테이블/인덱스 크기를 출력합니다. "
+        "PostgreSQL에서는 만료된 월 파티션을 삭제하고, 그 외에는 배치 단위로 행을 삭제합니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--retention-days', type=int, default=settings.NOTIFICATION_RETENTION_DAYS, help='보존 기간(일)')
+        parser.add_argument('--batch-size', type=int, default=PURGE_BATCH_SIZE, help='배치 삭제 크기')
+        parser.add_argument('--pause', type=float, default=0.0, help='배치 사이 대기 시간(초)')
+
+    def handle(self, *args, **options):
+        self.stdout.write(f"Before: {_format_size(table_size())}")
+        result = purge_notifications(localdate(), options['retention_days'], options['batch_size'], options['pause'])
+        self.stdout.write(
+            f"Cutoff {result['cutoff']}: dropped partitions={result['dropped_partitions']} "
+            f"deleted rows={result['deleted_rows']}"
+        )
+        self.stdout.write(self.style.SUCCESS(f"After: {_format_size(table_size())}"))
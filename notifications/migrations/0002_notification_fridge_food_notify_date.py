@@ -0,0 +1,41 @@
+# Generated by Django 5.0.3 on 2026-10-17 17:49
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models.functions import TruncDate
+
+
+def backfill_notify_date(apps, schema_editor):
+    # 기존 알림은 생성 시각(현지 시간)의 날짜를 알림 날짜로 사용
+    Notification = apps.get_model('notifications', 'Notification')
+    Notification.objects.update(notify_date=TruncDate('created_at'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('foods', '0005_foodhistory_idx_refrigerator_foodhistory_idx_user_and_more'),
+        ('notifications', '0001_initial'),
+        ('refriges', '0004_alter_refrigeratorinvitation_code'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='notification',
+            name='fridge_food',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='notifications', to='foods.fridgefood', verbose_name='냉장고 식품'),
+        ),
+        migrations.AddField(
+            model_name='notification',
+            name='notify_date',
+            field=models.DateField(default=django.utils.timezone.localdate, verbose_name='알림 날짜'),
+        ),
+        migrations.RunPython(backfill_notify_date, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='notification',
+            constraint=models.UniqueConstraint(fields=('user', 'fridge_food', 'd_day', 'notify_date'), name='unique_notification_per_day'),
+        ),
+    ]
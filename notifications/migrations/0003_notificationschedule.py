@@ -0,0 +1,63 @@
+# Generated by Django 5.0.3 on 2026-10-17 17:50
+
+from datetime import timedelta
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.utils.timezone import localdate
+
+D_DAY_OFFSETS = {'D-3': 3, 'D-0': 0}
+
+
+def backfill_schedules(apps, schema_editor):
+    # 소비기한이 남아 있는 기존 식품의 알림 예약 생성
+    FridgeFood = apps.get_model('foods', 'FridgeFood')
+    NotificationSchedule = apps.get_model('notifications', 'NotificationSchedule')
+    today = localdate()
+
+    schedules = []
+    foods = FridgeFood.objects.filter(expiration_date__gte=today).values_list('id', 'refrigerator_id', 'expiration_date')
+    for food_id, refrigerator_id, expiration_date in foods.iterator(chunk_size=5000):
+        for d_day, offset in D_DAY_OFFSETS.items():
+            due_date = expiration_date - timedelta(days=offset)
+            if due_date >= today:
+                schedules.append(NotificationSchedule(
+                    fridge_food_id=food_id, refrigerator_id=refrigerator_id, d_day=d_day, due_date=due_date
+                ))
+        if len(schedules) >= 5000:
+            NotificationSchedule.objects.bulk_create(schedules)
+            schedules = []
+    NotificationSchedule.objects.bulk_create(schedules)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('foods', '0005_foodhistory_idx_refrigerator_foodhistory_idx_user_and_more'),
+        ('notifications', '0002_notification_fridge_food_notify_date'),
+        ('refriges', '0004_alter_refrigeratorinvitation_code'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='NotificationSchedule',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('d_day', models.CharField(max_length=10, verbose_name='디데이 정보')),
+                ('due_date', models.DateField(verbose_name='알림 예정일')),
+                ('fridge_food', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='notification_schedules', to='foods.fridgefood', verbose_name='냉장고 식품')),
+                ('refrigerator', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='refriges.refrigerator', verbose_name='냉장고')),
+            ],
+            options={
+                'verbose_name': '알림 예약',
+                'verbose_name_plural': '알림 예약',
+                'db_table': 'notification_schedule',
+                'indexes': [models.Index(fields=['due_date', 'refrigerator'], name='idx_schedule_due_refrigerator')],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='notificationschedule',
+            constraint=models.UniqueConstraint(fields=('fridge_food', 'd_day'), name='unique_schedule_per_food'),
+        ),
+        migrations.RunPython(backfill_schedules, migrations.RunPython.noop),
+    ]
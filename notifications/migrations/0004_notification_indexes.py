@@ -0,0 +1,25 @@
+# Generated by Django 5.0.3 on 2026-10-17 17:53
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('foods', '0005_foodhistory_idx_refrigerator_foodhistory_idx_user_and_more'),
+        ('notifications', '0003_notificationschedule'),
+        ('refriges', '0004_alter_refrigeratorinvitation_code'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='notification',
+            index=models.Index(fields=['user', 'refrigerator', 'd_day', '-created_at'], name='idx_noti_user_fridge_dday_ts'),
+        ),
+        migrations.AddIndex(
+            model_name='notification',
+            index=models.Index(condition=models.Q(('is_read', False)), fields=['user', 'refrigerator', 'd_day', 'created_at'], name='idx_noti_unread'),
+        ),
+    ]
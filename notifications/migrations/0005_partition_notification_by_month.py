@@ -0,0 +1,83 @@
+# Generated by Django 5.0.3 on 2026-10-17 18:02
+
+from datetime import date
+
+from django.db import migrations
+from django.utils.timezone import localdate
+
+TABLE = 'notification'
+
+
+def month_start(day, months=0):
+    index = day.year * 12 + day.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_notification_table(apps, schema_editor):
+    """
+    PostgreSQL에서 notification 테이블을 notify_date 기준 월별 RANGE 파티션 테이블로 전환
+    파티션 키를 포함해야 하므로 기본 키는 (id, notify_date)가 되며,
+    기존 인덱스/제약 조건은 같은 이름으로 다시 생성합니다. 그 외 DB에서는 아무 작업도 하지 않습니다.
+    """
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+
+    with schema_editor.connection.cursor() as cursor:
+        # 기본 키와 제약 조건 소유 인덱스를 제외한 인덱스 정의
+        cursor.execute(
+            "SELECT pg_get_indexdef(i.indexrelid) FROM pg_index i "
+            "WHERE i.indrelid = %s::regclass AND NOT i.indisprimary "
+            "AND NOT EXISTS (SELECT 1 FROM pg_constraint c WHERE c.conindid = i.indexrelid)",
+            [TABLE],
+        )
+        index_definitions = [row[0] for row in cursor.fetchall()]
+        # 유니크/외래 키 제약 조건 정의
+        cursor.execute(
+            "SELECT conname, pg_get_constraintdef(oid) FROM pg_constraint "
+            "WHERE conrelid = %s::regclass AND contype IN ('u', 'f')",
+            [TABLE],
+        )
+        constraints = cursor.fetchall()
+        cursor.execute(f"SELECT MIN(notify_date) FROM {TABLE}")
+        first_day = cursor.fetchone()[0]
+
+    today = localdate()
+    start = month_start(first_day or today)
+    end = month_start(today, 3)
+
+    schema_editor.execute(f"ALTER TABLE {TABLE} RENAME TO {TABLE}_legacy")
+    schema_editor.execute(
+        f"CREATE TABLE {TABLE} (LIKE {TABLE}_legacy INCLUDING DEFAULTS) PARTITION BY RANGE (notify_date)"
+    )
+    while start < end:
+        schema_editor.execute(
+            f"CREATE TABLE {TABLE}_p{start.year:04d}{start.month:02d} PARTITION OF {TABLE} "
+            f"FOR VALUES FROM ('{start}') TO ('{month_start(start, 1)}')"
+        )
+        start = month_start(start, 1)
+    schema_editor.execute(f"CREATE TABLE {TABLE}_default PARTITION OF {TABLE} DEFAULT")
+
+    schema_editor.execute(f"INSERT INTO {TABLE} SELECT * FROM {TABLE}_legacy")
+    schema_editor.execute(f"DROP TABLE {TABLE}_legacy")
+
+    # 파티션 테이블은 IDENTITY 대신 소유 시퀀스로 ID 발급
+    schema_editor.execute(f"CREATE SEQUENCE {TABLE}_id_seq OWNED BY {TABLE}.id")
+    schema_editor.execute(f"SELECT setval('{TABLE}_id_seq', COALESCE((SELECT MAX(id) FROM {TABLE}), 0) + 1, false)")
+    schema_editor.execute(f"ALTER TABLE {TABLE} ALTER COLUMN id SET DEFAULT nextval('{TABLE}_id_seq')")
+    schema_editor.execute(f"ALTER TABLE {TABLE} ADD CONSTRAINT {TABLE}_pkey PRIMARY KEY (id, notify_date)")
+
+    for name, definition in constraints:
+        schema_editor.execute(f"ALTER TABLE {TABLE} ADD CONSTRAINT {name} {definition}")
+    for definition in index_definitions:
+        schema_editor.execute(definition)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notifications', '0004_notification_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(partition_notification_table, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 5.0.3 on 2026-10-17 18:02
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('foods', '0005_foodhistory_idx_refrigerator_foodhistory_idx_user_and_more'),
+        ('notifications', '0005_partition_notification_by_month'),
+        ('refriges', '0004_alter_refrigeratorinvitation_code'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='notification',
+            name='foods',
+            field=models.JSONField(blank=True, default=list, verbose_name='요약 식품 목록'),
+        ),
+        migrations.AddField(
+            model_name='notification',
+            name='is_digest',
+            field=models.BooleanField(default=False, verbose_name='요약 알림 여부'),
+        ),
+        migrations.AddConstraint(
+            model_name='notification',
+            constraint=models.UniqueConstraint(condition=models.Q(('is_digest', True)), fields=('user', 'refrigerator', 'd_day', 'notify_date'), name='unique_digest_per_day'),
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 5.0.3 on 2026-10-17 18:04
+
+from django.db import migrations
+
+
+def remove_daily_beat_entry(apps, schema_editor):
+    """
+    알림 작업이 매시 실행으로 바뀌면서 DB 스케줄러에 남은 기존 자정 실행 항목 삭제
+    (DatabaseScheduler는 설정에서 제거된 항목을 자동으로 지우지 않음)
+    """
+    PeriodicTask = apps.get_model('django_celery_beat', 'PeriodicTask')
+    PeriodicTask.objects.filter(name='send_notifications_daily').delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('django_celery_beat', '0019_alter_periodictasks_options'),
+        ('notifications', '0006_notification_digest'),
+    ]
+
+    operations = [
+        migrations.RunPython(remove_daily_beat_entry, migrations.RunPython.noop),
+    ]
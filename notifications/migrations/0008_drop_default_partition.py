@@ -0,0 +1,62 @@
+# Generated by Django 5.0.3 on 2026-10-17 20:40
+
+from django.db import migrations
+
+TABLE = 'notification'
+DEFAULT_PARTITION = f'{TABLE}_default'
+
+
+def month_start(day, months=0):
+    index = day.year * 12 + day.month - 1 + months
+    return day.replace(year=index // 12, month=index % 12 + 1, day=1)
+
+
+def drop_default_partition(apps, schema_editor):
+    """
+    DEFAULT 파티션의 행을 월 파티션으로 옮긴 뒤 DEFAULT 파티션 삭제
+    DEFAULT 파티션이 있으면 만료 파티션을 DETACH ... CONCURRENTLY로 분리할 수 없고,
+    DEFAULT 파티션에 들어간 달의 파티션을 새로 만들 수도 없습니다.
+    """
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute("SELECT to_regclass(%s)", [DEFAULT_PARTITION])
+        if cursor.fetchone()[0] is None:
+            return
+        cursor.execute(f"SELECT DISTINCT date_trunc('month', notify_date)::date FROM {DEFAULT_PARTITION}")
+        months = sorted(row[0] for row in cursor.fetchall())
+
+    for start in months:
+        end = month_start(start, 1)
+        name = f"{TABLE}_p{start.year:04d}{start.month:02d}"
+        schema_editor.execute(f"CREATE TABLE {name} (LIKE {TABLE} INCLUDING DEFAULTS)")
+        schema_editor.execute(
+            f"WITH moved AS (DELETE FROM {DEFAULT_PARTITION} WHERE notify_date >= %s AND notify_date < %s RETURNING *) "
+            f"INSERT INTO {name} SELECT * FROM moved",
+            [start, end],
+        )
+        schema_editor.execute(f"ALTER TABLE {TABLE} ATTACH PARTITION {name} FOR VALUES FROM ('{start}') TO ('{end}')")
+
+    schema_editor.execute(f"DROP TABLE {DEFAULT_PARTITION}")
+
+
+def restore_default_partition(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute("SELECT 1 FROM pg_partitioned_table WHERE partrelid = %s::regclass", [TABLE])
+        if cursor.fetchone() is None:
+            return
+    schema_editor.execute(f"CREATE TABLE {DEFAULT_PARTITION} PARTITION OF {TABLE} DEFAULT")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notifications', '0007_remove_daily_beat_entry'),
+    ]
+
+    operations = [
+        migrations.RunPython(drop_default_partition, restore_default_partition),
+    ]
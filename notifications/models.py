@@ -1,20 +1,76 @@
 from django.db import models
+from django.utils.timezone import localdate
 
 
 # Create your models here.
 class Notification(models.Model):
     user = models.ForeignKey('users.CustomUser', on_delete=models.CASCADE, related_name='notifications', verbose_name='사용자')
     refrigerator = models.ForeignKey('refriges.Refrigerator', on_delete=models.CASCADE, verbose_name='냉장고')
+    fridge_food = models.ForeignKey(
+        'foods.FridgeFood', on_delete=models.SET_NULL, null=True, blank=True, related_name='notifications', verbose_name='냉장고 식품'
+    )
     message = models.TextField(verbose_name='알림 메시지')
     d_day = models.CharField(max_length=10, verbose_name="디데이 정보")
     created_at = models.DateTimeField(auto_now_add=True, verbose_name='생성 날짜')
     is_read = models.BooleanField(default=False, verbose_name='읽음 여부')
+    notify_date = models.DateField(default=localdate, verbose_name='알림 날짜')
+    is_digest = models.BooleanField(default=False, verbose_name='요약 알림 여부')
+    foods = models.JSONField(default=list, blank=True, verbose_name='요약 식품 목록')  # [{"id": 1, "name": "우유"}, ...]
 
     class Meta:
         db_table = 'notification'
         verbose_name = '알림'
         verbose_name_plural = '알림'
         ordering = ['-created_at']  # 최신순 정렬
+        constraints = [
+            # 같은 날 같은 식품에 대한 중복 알림 방지 (재실행 시 멱등성 보장)
+            models.UniqueConstraint(
+                fields=['user', 'fridge_food', 'd_day', 'notify_date'], name='unique_notification_per_day'
+            ),
+            # 요약 알림은 (사용자, 냉장고, 디데이)마다 하루 1건
+            models.UniqueConstraint(
+                fields=['user', 'refrigerator', 'd_day', 'notify_date'],
+                condition=models.Q(is_digest=True),
+                name='unique_digest_per_day',
+            ),
+        ]
+        indexes = [
+            # 알림 목록 조회 (냉장고, 사용자, 디데이, 최근 7일, 최신순)
+            models.Index(fields=['user', 'refrigerator', 'd_day', '-created_at'], name='idx_noti_user_fridge_dday_ts'),
+            # 읽지 않은 알림 전용 부분 인덱스 (팝업 조회, 읽음 처리)
+            models.Index(
+                fields=['user', 'refrigerator', 'd_day', 'created_at'],
+                condition=models.Q(is_read=False),
+                name='idx_noti_unread',
+            ),
+        ]
 
     def __str__(self):
         return f"{self.user.name} - {self.message}"
+
+
+class NotificationSchedule(models.Model):
+    """
+    소비기한 알림 예약
+    식품 추가/수정 시 D-3, D-0 알림 예정일을 기록해 두고, 매일 알림 작업은 당일 예약만 조회합니다.
+    """
+    fridge_food = models.ForeignKey(
+        'foods.FridgeFood', on_delete=models.CASCADE, related_name='notification_schedules', verbose_name='냉장고 식품'
+    )
+    refrigerator = models.ForeignKey('refriges.Refrigerator', on_delete=models.CASCADE, verbose_name='냉장고')
+    d_day = models.CharField(max_length=10, verbose_name="디데이 정보")
+    due_date = models.DateField(verbose_name='알림 예정일')
+
+    class Meta:
+        db_table = 'notification_schedule'
+        verbose_name = '알림 예약'
+        verbose_name_plural = '알림 예약'
+        constraints = [
+            models.UniqueConstraint(fields=['fridge_food', 'd_day'], name='unique_schedule_per_food'),
+        ]
+        indexes = [
+            models.Index(fields=['due_date', 'refrigerator'], name='idx_schedule_due_refrigerator'),
+        ]
+
+    def __str__(self):
+        return f"{self.fridge_food_id} - {self.d_day} ({self.due_date})"
@@ -0,0 +1,188 @@
+"""
+알림 테이블 월별 파티션 관리 및 보존 기간 정리
+
+PostgreSQL에서는 notification 테이블이 notify_date 기준 월별 RANGE 파티션으로 구성되며,
+보존 기간이 지난 파티션은 통째로 분리(DETACH ... CONCURRENTLY) 후 삭제합니다.
+CONCURRENTLY 분리는 DEFAULT 파티션이 있으면 사용할 수 없으므로 DEFAULT 파티션을 두지 않고,
+매일 정리 작업에서 몇 달 앞의 파티션을 미리 만들어 둡니다.
+그 외 DB(SQLite 등)나 파티션 경계에 걸친 행은 작은 배치 단위 DELETE로 정리합니다.
+"""
+import logging
+import re
+import time
+from datetime import date, timedelta
+from functools import partial
+
+from django.db import OperationalError, connection, transaction
+
+from notifications.models import Notification
+
+logger = logging.getLogger(__name__)
+
+TABLE = Notification._meta.db_table
+PARTITION_NAME = TABLE + '_p{year:04d}{month:02d}'
+PARTITION_PATTERN = re.compile(rf'^{TABLE}_p(\d{{4}})(\d{{2}})$')
+# 이전 버전에서 만든 DEFAULT 파티션 (마이그레이션 0008에서 제거)
+DEFAULT_PARTITION = TABLE + '_default'
+
+# 파티션이 있는 것을 확인한 달 (프로세스별). 알림을 생성할 때마다 카탈로그를 조회하지 않도록 함
+_known_months = set()
+PURGE_BATCH_SIZE = 5000
+
+
+def month_start(day, months=0):
+    """day가 속한 달에서 months만큼 이동한 달의 1일"""
+    index = day.year * 12 + day.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def is_partitioned():
+    if connection.vendor != 'postgresql':
+        return False
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT 1 FROM pg_partitioned_table WHERE partrelid = %s::regclass", [TABLE])
+        return cursor.fetchone() is not None
+
+
+def _table_exists(cursor, name):
+    cursor.execute("SELECT to_regclass(%s)", [name])
+    return cursor.fetchone()[0] is not None
+
+
+def create_partition(start):
+    """
+    start가 속한 달의 파티션 생성
+    DEFAULT 파티션이 남아 있으면 이 달의 행을 먼저 새 테이블로 옮긴 뒤 붙입니다
+    (DEFAULT 파티션에 이 달의 행이 있으면 파티션을 생성할 수 없음).
+    ATTACH PARTITION은 부모 테이블에 SHARE UPDATE EXCLUSIVE 잠금만 잡으므로 알림 조회/생성을 막지 않습니다.
+    """
+    start = month_start(start)
+    end = month_start(start, 1)
+    name = PARTITION_NAME.format(year=start.year, month=start.month)
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(f"CREATE TABLE {name} (LIKE {TABLE} INCLUDING DEFAULTS)")
+        if _table_exists(cursor, DEFAULT_PARTITION):
+            cursor.execute(
+                f"WITH moved AS (DELETE FROM {DEFAULT_PARTITION} WHERE notify_date >= %s AND notify_date < %s RETURNING *) "
+                f"INSERT INTO {name} SELECT * FROM moved",
+                [start, end],
+            )
+        cursor.execute(f"ALTER TABLE {TABLE} ATTACH PARTITION {name} FOR VALUES FROM ('{start}') TO ('{end}')")
+    return name
+
+
+def ensure_partitions(today, months_ahead=2):
+    """
+    이번 달부터 months_ahead개월 뒤까지 없는 파티션을 미리 생성
+    DEFAULT 파티션이 없으므로 파티션이 없는 달의 알림은 저장할 수 없습니다. 매일 정리 작업 외에
+    알림 생성 전에도 호출하며, 이미 확인한 달은 다시 조회하지 않습니다.
+    """
+    months = [month_start(today, offset) for offset in range(months_ahead + 1)]
+    if _known_months.issuperset(months) or not is_partitioned():
+        return []
+
+    created = []
+    for start in months:
+        if start in _known_months:
+            continue
+        with connection.cursor() as cursor:
+            exists = _table_exists(cursor, PARTITION_NAME.format(year=start.year, month=start.month))
+        if not exists:
+            created.append(create_partition(start))
+        # 트랜잭션 안에서 만든 파티션은 롤백될 수 있으므로 커밋 후 기록
+        transaction.on_commit(partial(_known_months.add, start))
+    return created
+
+
+def drop_expired_partitions(cutoff):
+    """
+    상한(다음 달 1일)이 cutoff 이하인, 전체가 보존 기간을 지난 월 파티션 삭제
+    DETACH PARTITION ... CONCURRENTLY는 트랜잭션 안에서 실행할 수 없으므로 autocommit 상태에서 호출해야 합니다.
+    이전 실행이 분리 도중 중단된 파티션은 FINALIZE로 마저 분리하고, 분리 후 삭제되지 않은 테이블도 함께 삭제합니다.
+    """
+    if not is_partitioned():
+        return []
+    if connection.in_atomic_block:
+        raise RuntimeError("drop_expired_partitions() must run outside a transaction (DETACH ... CONCURRENTLY).")
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT c.relname, i.inhrelid IS NOT NULL, COALESCE(i.inhdetachpending, false) "
+            "FROM pg_class c LEFT JOIN pg_inherits i ON i.inhrelid = c.oid AND i.inhparent = %s::regclass "
+            "WHERE c.relkind = 'r' AND pg_table_is_visible(c.oid)",
+            [TABLE],
+        )
+        tables = cursor.fetchall()
+
+    dropped = []
+    for name, attached, detach_pending in sorted(tables):
+        match = PARTITION_PATTERN.match(name)
+        if not match:
+            continue
+        start = date(int(match.group(1)), int(match.group(2)), 1)
+        if month_start(start, 1) > cutoff:
+            continue
+        with connection.cursor() as cursor:
+            if detach_pending:
+                cursor.execute(f"ALTER TABLE {TABLE} DETACH PARTITION {name} FINALIZE")
+            elif attached:
+                # CONCURRENTLY: 부모 테이블에 ACCESS EXCLUSIVE 잠금을 잡지 않아 알림 조회/생성을 막지 않음
+                cursor.execute(f"ALTER TABLE {TABLE} DETACH PARTITION {name} CONCURRENTLY")
+            # 분리된 테이블은 부모와 무관하므로 삭제해도 부모 테이블을 잠그지 않음
+            cursor.execute(f"DROP TABLE {name}")
+        _known_months.discard(start)
+        dropped.append(name)
+    return dropped
+
+
+def purge_expired_rows(cutoff, batch_size=PURGE_BATCH_SIZE, pause=0.0):
+    """notify_date가 cutoff 이전인 알림을 batch_size개씩 나누어 삭제 (배치마다 별도 트랜잭션)"""
+    deleted = 0
+    while True:
+        ids = list(Notification.objects.filter(notify_date__lt=cutoff).values_list('id', flat=True)[:batch_size])
+        if not ids:
+            return deleted
+        batch_deleted, _ = Notification.objects.filter(id__in=ids).delete()
+        deleted += batch_deleted
+        if pause:
+            time.sleep(pause)
+
+
+def purge_notifications(today, retention_days, batch_size=PURGE_BATCH_SIZE, pause=0.0):
+    """보존 기간이 지난 알림 정리 (파티션 삭제 후 남은 행은 배치 삭제)"""
+    cutoff = today - timedelta(days=retention_days)
+    ensure_partitions(today)
+    dropped = drop_expired_partitions(cutoff)
+    deleted = purge_expired_rows(cutoff, batch_size, pause)
+    logger.info("Purged notifications before %s: partitions=%s rows=%d", cutoff, dropped, deleted)
+    return {'cutoff': cutoff.isoformat(), 'dropped_partitions': dropped, 'deleted_rows': deleted}
+
+
+def table_size():
+    """알림 테이블과 인덱스 크기(bytes). 크기를 알 수 없으면 None"""
+    with connection.cursor() as cursor:
+        if connection.vendor == 'postgresql':
+            # 파티션 테이블은 부모 크기가 0이므로 하위 파티션 크기를 합산
+            cursor.execute(
+                "SELECT COALESCE(SUM(pg_table_size(r)), 0), COALESCE(SUM(pg_indexes_size(r)), 0) FROM ("
+                "  SELECT inhrelid AS r FROM pg_inherits WHERE inhparent = %s::regclass"
+                "  UNION ALL SELECT %s::regclass"
+                ") t",
+                [TABLE, TABLE],
+            )
+            table, indexes = cursor.fetchone()
+            return {'table': table, 'indexes': indexes}
+
+        if connection.vendor == 'sqlite':
+            index_names = connection.introspection.get_constraints(cursor, TABLE).keys()
+            try:
+                cursor.execute("SELECT name, SUM(pgsize) FROM dbstat GROUP BY name")
+            except OperationalError:
+                # dbstat 가상 테이블이 없는 SQLite 빌드
+                return None
+            sizes = dict(cursor.fetchall())
+            return {
+                'table': sizes.get(TABLE, 0),
+                'indexes': sum(sizes.get(name, 0) for name in index_names),
+            }
+    return None
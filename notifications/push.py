@@ -0,0 +1,68 @@
+"""
+알림 실시간 전송 (WebSocket)
+
+사용자별 채널 그룹(notifications_user_{user_id})으로 새로 생성된 알림을 전송합니다.
+접속 시에는 알림 목록/팝업 API와 같은 범위의 스냅샷을 보내므로 클라이언트는 폴링할 필요가 없습니다.
+"""
+import logging
+from collections import defaultdict
+from datetime import timedelta
+
+from asgiref.sync import async_to_sync
+from channels.layers import get_channel_layer
+from django.db.models import Q, prefetch_related_objects
+from django.utils.timezone import now
+
+from notifications.counters import counter_window
+from notifications.models import Notification
+from notifications.serializers import NotificationPushSerializer
+
+logger = logging.getLogger(__name__)
+
+USER_GROUP = 'notifications_user_{user_id}'
+
+
+def user_group(user_id):
+    return USER_GROUP.format(user_id=user_id)
+
+
+def notification_snapshot(user_id, user_timezone=None):
+    """접속 시 전송할 알림: 최근 7일 D-3 알림과 오늘(사용자 현지 시간)의 읽지 않은 D-0 알림 (모든 냉장고)"""
+    start_of_today, end_of_today = counter_window('D-0', user_timezone)
+    notifications = Notification.objects.filter(user_id=user_id).filter(
+        Q(d_day='D-3', created_at__gte=now() - timedelta(days=7))
+        | Q(
+            d_day='D-0', is_read=False,
+            created_at__gte=start_of_today, created_at__lt=end_of_today,
+        )
+    ).order_by('-created_at')
+    return NotificationPushSerializer(notifications, many=True, context={'user_timezone': user_timezone}).data
+
+
+def publish_notifications(notifications):
+    """
+    새로 생성된 알림을 사용자별 그룹으로 전송
+    전송 실패(채널 레이어 장애 등)가 알림 생성을 실패시키지 않도록 로그만 남깁니다.
+    """
+    # 생성 시각을 받는 사용자의 시간대로 직렬화하므로 사용자를 한 번에 조회
+    prefetch_related_objects(notifications, 'user')
+    by_user = defaultdict(list)
+    for data in NotificationPushSerializer(notifications, many=True).data:
+        by_user[data.pop('user')].append(data)
+
+    try:
+        channel_layer = get_channel_layer()
+    except Exception:
+        # 채널 레이어 설정 오류, 백엔드 패키지 누락 등
+        logger.exception("Channel layer unavailable; skipping notification push")
+        return
+    if channel_layer is None:
+        return
+    for user_id, items in by_user.items():
+        try:
+            async_to_sync(channel_layer.group_send)(
+                user_group(user_id),
+                {'type': 'notification.created', 'notifications': items},
+            )
+        except Exception:
+            logger.exception("Failed to publish notifications to user %s", user_id)
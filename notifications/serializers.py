@@ -1,4 +1,4 @@
-from pytz import timezone
+from django.utils.timezone import localtime
 from rest_framework import serializers
 
 from notifications.models import Notification
@@ -9,9 +9,35 @@ class NotificationSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = Notification
-        fields = ['id', 'message', 'd_day', 'is_read', 'created_at']
+        fields = ['id', 'message', 'd_day', 'is_read', 'created_at', 'is_digest', 'foods']
 
     def get_created_at(self, obj):
-        # UTC 시간에서 한국 시간대로 변환
-        korea_time = obj.created_at.astimezone(timezone('Asia/Seoul'))
-        return korea_time.strftime('%Y-%m-%d %H:%M:%S')
\ No newline at end of file
+        # 받는 사용자의 시간대로 변환 (context에 user_timezone이 없으면 알림의 사용자에서 조회)
+        user_timezone = self.context.get('user_timezone') or obj.user.timezone
+        return localtime(obj.created_at, user_timezone).strftime('%Y-%m-%d %H:%M:%S')
+
+
+class NotificationPushSerializer(NotificationSerializer):
+    """WebSocket 전송용 (여러 냉장고의 알림을 함께 보내므로 냉장고 ID 포함)"""
+
+    class Meta(NotificationSerializer.Meta):
+        fields = NotificationSerializer.Meta.fields + ['refrigerator', 'user']
+
+
+class NotificationMarkAsReadSerializer(serializers.Serializer):
+    """알림 일괄 읽음 처리 요청 (ids, until, all 중 하나 필수)"""
+    ids = serializers.ListField(
+        child=serializers.IntegerField(), required=False, max_length=1000, help_text="읽음 처리할 알림 ID 목록"
+    )
+    until = serializers.DateTimeField(required=False, help_text="이 시각까지 생성된 알림을 읽음 처리")
+    all = serializers.BooleanField(required=False, help_text="모든 냉장고의 알림을 읽음 처리")
+    refrigerator_id = serializers.IntegerField(required=False, help_text="특정 냉장고로 제한")
+    d_day = serializers.ChoiceField(choices=['D-3', 'D-0'], required=False, help_text="특정 디데이로 제한")
+
+    def validate(self, attrs):
+        selectors = [key for key in ('ids', 'until') if key in attrs]
+        if attrs.get('all'):
+            selectors.append('all')
+        if len(selectors) != 1:
+            raise serializers.ValidationError("Exactly one of 'ids', 'until' or 'all' is required.")
+        return attrs
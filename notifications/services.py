@@ -0,0 +1,361 @@
+import logging
+from collections import Counter, defaultdict
+from datetime import timedelta
+from itertools import groupby
+from operator import itemgetter
+from zoneinfo import ZoneInfo
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import F, Max, Min
+from django.db.models.functions import Coalesce
+from django.utils.dateparse import parse_date
+from django.utils.timezone import localdate, now
+
+from notifications.counters import counter_window, decrement_unread, invalidate_unread
+from notifications.models import Notification, NotificationSchedule
+from notifications.partitions import ensure_partitions
+from notifications.push import publish_notifications
+from users.models import CustomUser
+
+logger = logging.getLogger(__name__)
+
+# 디데이별 소비기한까지 남은 일수
+D_DAY_OFFSETS = {
+    'D-3': 3,
+    'D-0': 0,
+}
+
+BATCH_SIZE = 5000
+
+# 가장 늦게 날짜가 바뀌는 시간대 (UTC-12). 이 시간대까지 처리가 끝나야 예약을 정리할 수 있음
+LATEST_TIMEZONE = ZoneInfo('Etc/GMT+12')
+
+# 요약 알림 메시지 (식품이 2개 이상일 때)
+DIGEST_MESSAGES = {
+    'D-3': '{name} 외 {count}개 식품의 소비기한이 3일 남았어요.',
+    'D-0': '{name} 외 {count}개',
+}
+
+
+def processed_schedule_date(current=None):
+    """모든 시간대에서 알림 처리가 끝난 가장 최근 예정일 (UTC-12 현지 날짜의 전날)"""
+    return (current or now()).astimezone(LATEST_TIMEZONE).date() - timedelta(days=1)
+
+
+def notification_cohorts(current=None, hour=None):
+    """
+    현재 시각에 현지 시각이 알림 시각(hour시)인 사용자 시간대를 현지 날짜별로 묶어 반환
+    {현지 날짜: [시간대 이름, ...]}
+    """
+    current = current or now()
+    hour = settings.NOTIFICATION_HOUR if hour is None else hour
+    cohorts = defaultdict(list)
+    for zone in CustomUser.objects.values_list('timezone', flat=True).distinct():
+        local = current.astimezone(zone)
+        if local.hour == hour:
+            cohorts[local.date()].append(str(zone))
+    return dict(cohorts)
+
+
+def schedule_expiry_notifications(foods, today=None):
+    """
+    식품 추가/수정 시 D-3, D-0 알림 예약을 다시 등록
+    모든 시간대에서 이미 처리가 끝난 예정일은 예약하지 않습니다.
+    """
+    today = today or processed_schedule_date() + timedelta(days=1)
+    foods = list(foods)
+
+    schedules = []
+    for food in foods:
+        expiration_date = food.expiration_date
+        if isinstance(expiration_date, str):
+            expiration_date = parse_date(expiration_date)
+        for d_day, offset in D_DAY_OFFSETS.items():
+            due_date = expiration_date - timedelta(days=offset)
+            if due_date >= today:
+                schedules.append(NotificationSchedule(
+                    fridge_food_id=food.id,
+                    refrigerator_id=food.refrigerator_id,
+                    d_day=d_day,
+                    due_date=due_date,
+                ))
+
+    NotificationSchedule.objects.filter(fridge_food_id__in=[food.id for food in foods]).delete()
+    NotificationSchedule.objects.bulk_create(schedules, batch_size=BATCH_SIZE)
+
+
+def purge_due_schedules(today=None):
+    """모든 시간대에서 처리가 끝난(예정일이 today 이전인) 알림 예약 삭제"""
+    today = today or processed_schedule_date()
+    deleted, _ = NotificationSchedule.objects.filter(due_date__lte=today).delete()
+    return deleted
+
+
+def split_refrigerator_ranges(today, shards):
+    """
+    오늘 예약이 있는 냉장고 ID 구간을 shards개의 [start, end) 구간으로 분할
+    예약이 없으면 빈 리스트를 반환합니다.
+    """
+    bounds = NotificationSchedule.objects.filter(due_date=today).aggregate(
+        start=Min('refrigerator_id'), end=Max('refrigerator_id')
+    )
+    if bounds['start'] is None:
+        return []
+
+    start, end = bounds['start'], bounds['end'] + 1
+    step = max(1, -(-(end - start) // shards))  # 올림 나눗셈
+    return [(lo, min(lo + step, end)) for lo in range(start, end, step)]
+
+
+def _due_rows(today, d_days, refrigerator_ids=None, refrigerator_range=None, timezones=None):
+    """
+    오늘 예정된 알림 예약 × 냉장고 구성원 조합을 한 번의 JOIN 쿼리로 조회
+    (NotificationSchedule → FridgeFood → RefrigeratorAccess → DefaultFood)
+    (식품 ID, 냉장고 ID, 사용자 ID, 디데이, 식품 이름, 알림멘트) 튜플을 냉장고 ID 순으로 반환합니다.
+    timezones를 지정하면 해당 시간대 사용자에 대한 알림만 조회합니다.
+    """
+    # 구성원 조건은 같은 JOIN을 사용하도록 한 번의 filter로 지정
+    conditions = {
+        'due_date': today,
+        'd_day__in': d_days,
+        'refrigerator__access_list__isnull': False,
+    }
+    if timezones is not None:
+        conditions['refrigerator__access_list__user__timezone__in'] = timezones
+    schedules = NotificationSchedule.objects.filter(**conditions)
+    if refrigerator_ids is not None:
+        schedules = schedules.filter(refrigerator_id__in=refrigerator_ids)
+    if refrigerator_range is not None:
+        schedules = schedules.filter(
+            refrigerator_id__gte=refrigerator_range[0], refrigerator_id__lt=refrigerator_range[1]
+        )
+
+    rows = (
+        schedules.annotate(
+            user_id=F('refrigerator__access_list__user_id'),
+            food_name=Coalesce('fridge_food__name', 'fridge_food__default_food__name'),
+            comment=F('fridge_food__default_food__comment'),
+        )
+        .values_list('fridge_food_id', 'refrigerator_id', 'user_id', 'd_day', 'food_name', 'comment')
+        .order_by('refrigerator_id', 'fridge_food_id')
+    )
+    return rows.iterator(chunk_size=BATCH_SIZE)
+
+
+def _food_message(d_day, food_name, comment):
+    # D-3은 기본 식품 알림멘트, D-0은 식품 이름을 메시지로 사용
+    message = (comment or food_name) if d_day == 'D-3' else food_name
+    return message or ''
+
+
+def _food_notifications(rows, today):
+    """식품마다 구성원별 알림 1건"""
+    for food_id, refrigerator_id, user_id, d_day, food_name, comment in rows:
+        yield Notification(
+            user_id=user_id,
+            refrigerator_id=refrigerator_id,
+            fridge_food_id=food_id,
+            message=_food_message(d_day, food_name, comment),
+            d_day=d_day,
+            notify_date=today,
+        )
+
+
+def _digest_notifications(rows, today):
+    """
+    (사용자, 냉장고, 디데이)마다 요약 알림 1건
+    조회 결과가 냉장고 ID 순으로 정렬되어 있으므로 냉장고 단위로만 묶어 메모리 사용량을 제한합니다.
+    """
+    for refrigerator_id, fridge_rows in groupby(rows, key=itemgetter(1)):
+        groups = defaultdict(list)
+        for food_id, _, user_id, d_day, food_name, comment in fridge_rows:
+            groups[(user_id, d_day)].append((food_id, food_name, comment))
+
+        for (user_id, d_day), foods in groups.items():
+            first_id, first_name, first_comment = foods[0]
+            if len(foods) == 1:
+                message = _food_message(d_day, first_name, first_comment)
+            else:
+                message = DIGEST_MESSAGES[d_day].format(name=first_name, count=len(foods) - 1)
+            yield Notification(
+                user_id=user_id,
+                refrigerator_id=refrigerator_id,
+                message=message,
+                d_day=d_day,
+                notify_date=today,
+                is_digest=True,
+                foods=[{'id': food_id, 'name': food_name} for food_id, food_name, _ in foods],
+            )
+
+
+def _insert_notifications(notifications, group_field, batch_size=BATCH_SIZE):
+    """
+    알림을 저장하고 이번에 실제로 저장된 알림만 (ID를 채워) 반환
+    INSERT ... ON CONFLICT DO NOTHING RETURNING으로 유니크 제약에 걸려 건너뛴 행
+    (동시에 실행된 샤드, 재시도, 겹치는 코호트 실행이 먼저 저장한 알림)을 제외합니다.
+    RETURNING을 지원하지 않는 DB에서는 저장 전후의 알림 ID를 비교합니다.
+    """
+    if not connection.features.can_return_rows_from_bulk_insert:
+        return _insert_notifications_by_diff(notifications, group_field, batch_size)
+
+    ops = connection.ops
+    fields = [field for field in Notification._meta.concrete_fields if not field.primary_key]
+    columns = ', '.join(ops.quote_name(field.column) for field in fields)
+    row = f"({', '.join(['%s'] * len(fields))})"
+    by_key = {
+        (notification.user_id, getattr(notification, group_field), notification.d_day): notification
+        for notification in notifications
+    }
+    size = max(1, min(batch_size, ops.bulk_batch_size(fields, notifications)))
+
+    saved = []
+    with connection.cursor() as cursor:
+        for start in range(0, len(notifications), size):
+            chunk = notifications[start:start + size]
+            params = [
+                field.get_db_prep_save(field.pre_save(notification, True), connection)
+                for notification in chunk
+                for field in fields
+            ]
+            cursor.execute(
+                f"INSERT INTO {ops.quote_name(Notification._meta.db_table)} ({columns}) "
+                f"VALUES {', '.join([row] * len(chunk))} "
+                f"ON CONFLICT DO NOTHING RETURNING id, user_id, {group_field}, d_day",
+                params,
+            )
+            for notification_id, *key in cursor.fetchall():
+                notification = by_key[tuple(key)]
+                notification.id = notification_id
+                notification._state.adding = False
+                saved.append(notification)
+    return saved
+
+
+def _insert_notifications_by_diff(notifications, group_field, batch_size):
+    """RETURNING을 지원하지 않는 DB용: 저장 전에 없던 알림만 반환"""
+    keys = {(notification.user_id, getattr(notification, group_field), notification.d_day) for notification in notifications}
+    first = notifications[0]
+
+    def stored():
+        candidates = Notification.objects.filter(
+            notify_date=first.notify_date, is_digest=first.is_digest,
+            **{f'{group_field}__in': {key[1] for key in keys}},
+        )
+        return [
+            notification for notification in candidates
+            if (notification.user_id, getattr(notification, group_field), notification.d_day) in keys
+        ]
+
+    before = {notification.id for notification in stored()}
+    Notification.objects.bulk_create(notifications, batch_size=batch_size, ignore_conflicts=True)
+    return [notification for notification in stored() if notification.id not in before]
+
+
+def generate_expiry_notifications(
+    today=None, d_days=None, refrigerator_ids=None, refrigerator_range=None, batch_size=BATCH_SIZE, digest=False,
+    timezones=None,
+):
+    """
+    오늘 예정된 D-3, D-0 소비기한 알림을 집합 단위로 생성
+
+    같은 날 다시 실행해도 유니크 제약으로 중복 알림이 생기지 않습니다. 디데이별 생성 건수를 반환합니다.
+    refrigerator_range([start, end))를 지정하면 해당 냉장고 ID 구간(샤드)만 처리합니다.
+    digest=True이면 식품별 알림 대신 (사용자, 냉장고, 디데이)마다 식품 목록을 담은 요약 알림 1건을 생성합니다.
+    timezones를 지정하면 해당 시간대 사용자(코호트)에게만 생성하며, today는 그 시간대의 현지 날짜입니다.
+    """
+    today = today or localdate()
+    d_days = d_days or list(D_DAY_OFFSETS)
+    # 정리 작업이 멈춰도 알림을 저장할 수 있도록 해당 월 파티션을 먼저 확인
+    ensure_partitions(today, months_ahead=0)
+    # 요약 알림은 냉장고 단위, 식품별 알림은 식품 단위로 중복 여부 판단
+    group_field = 'refrigerator_id' if digest else 'fridge_food_id'
+
+    def key(notification):
+        return notification.user_id, getattr(notification, group_field), notification.d_day
+
+    existing = Notification.objects.filter(notify_date=today, d_day__in=d_days, is_digest=digest)
+    if not digest:
+        existing = existing.filter(fridge_food__isnull=False)
+    if refrigerator_range is not None:
+        existing = existing.filter(
+            refrigerator_id__gte=refrigerator_range[0], refrigerator_id__lt=refrigerator_range[1]
+        )
+    existing = set(existing.values_list('user_id', group_field, 'd_day'))
+
+    created = {d_day: 0 for d_day in d_days}
+    batch = []
+
+    def flush():
+        # 이번 실행에서 실제로 저장된 알림만 집계/전송 (다른 실행이 먼저 저장한 알림 제외)
+        saved = _insert_notifications(batch, group_field, batch_size)
+        for notification in saved:
+            created[notification.d_day] += 1
+        # 커밋 전에 다시 계산하면 새 알림이 빠진 값이 저장되므로 커밋 후 삭제
+        groups = [(notification.user_id, notification.refrigerator_id, notification.d_day) for notification in saved]
+        transaction.on_commit(lambda: invalidate_unread(groups))
+        transaction.on_commit(lambda: publish_notifications(saved))
+        batch.clear()
+
+    rows = _due_rows(today, d_days, refrigerator_ids, refrigerator_range, timezones)
+    notifications = _digest_notifications(rows, today) if digest else _food_notifications(rows, today)
+    for notification in notifications:
+        if key(notification) in existing:
+            continue
+        batch.append(notification)
+        if len(batch) >= batch_size:
+            flush()
+    if batch:
+        flush()
+
+    logger.info(
+        "Expiry notifications generated for %s (range=%s, digest=%s, timezones=%s): %s",
+        today, refrigerator_range, digest, timezones, created,
+    )
+    return created
+
+
+def mark_notifications_read(user_id, ids=None, until=None, refrigerator_id=None, d_day=None, user_timezone=None):
+    """
+    사용자의 읽지 않은 알림을 UPDATE ... RETURNING 한 번으로 읽음 처리하고 캐시된 카운터를 함께 감소
+    ids(알림 ID 목록), until(이 시각까지 생성된 알림), refrigerator_id, d_day 조건을 조합할 수 있으며
+    조건이 없으면 모든 냉장고의 알림을 읽음 처리합니다. 읽음 처리된 알림 수를 반환합니다.
+    카운터의 오늘(D-0) 범위는 사용자 시간대(user_timezone) 기준입니다.
+    """
+    if ids is not None and not ids:
+        return 0
+
+    ops = connection.ops
+    conditions = ['user_id = %s', 'is_read = %s']
+    params = [user_id, False]
+    if ids is not None:
+        conditions.append(f"id IN ({', '.join(['%s'] * len(ids))})")
+        params.extend(ids)
+    if until is not None:
+        conditions.append('created_at <= %s')
+        params.append(ops.adapt_datetimefield_value(until))
+    if refrigerator_id is not None:
+        conditions.append('refrigerator_id = %s')
+        params.append(refrigerator_id)
+    if d_day is not None:
+        conditions.append('d_day = %s')
+        params.append(d_day)
+
+    # 카운터 집계 범위 안의 알림인지 함께 반환받아 카운터 감소량 계산
+    today_start, today_end = counter_window('D-0', user_timezone)
+    recent_start, _ = counter_window('D-3')
+    sql = (
+        f"UPDATE {Notification._meta.db_table} SET is_read = %s "
+        f"WHERE {' AND '.join(conditions)} "
+        "RETURNING refrigerator_id, d_day, "
+        "CASE WHEN d_day = 'D-0' THEN (created_at >= %s AND created_at < %s) ELSE created_at >= %s END"
+    )
+    params = [True, *params, *(ops.adapt_datetimefield_value(value) for value in (today_start, today_end, recent_start))]
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        rows = cursor.fetchall()
+
+    decrement_unread(Counter(
+        (user_id, row_refrigerator_id, row_d_day) for row_refrigerator_id, row_d_day, counted in rows if counted
+    ))
+    return len(rows)
@@ -1,52 +1,108 @@
-from apscheduler.schedulers.background import BackgroundScheduler
 import logging
+import time
+from collections import Counter
+from datetime import date
 
+from celery import chord, group
 from celery.app import shared_task
-from pytz import timezone
+from django.conf import settings
+from django.db import DatabaseError
+from django.utils.timezone import localdate
 
-from foods.models import FridgeFood
-from .models import Notification
-from refriges.models import RefrigeratorAccess
-from datetime import timedelta, date
+from .partitions import ensure_partitions, purge_notifications
+from .services import (
+    generate_expiry_notifications, notification_cohorts, purge_due_schedules, split_refrigerator_ranges,
+)
 
 logger = logging.getLogger(__name__)
 
-korea_tz = timezone('Asia/Seoul')
+
+@shared_task
+def send_notifications(shards=None, digest=None):
+    """
+    소비기한 알림 생성 코디네이터 (매시 정각 실행)
+    현지 시각이 알림 시각이 된 시간대의 사용자(코호트)만 처리해 하루의 생성 부하를 분산합니다.
+    shards가 2 이상이면 냉장고 ID 구간별로 샤드 작업을 병렬 실행(chord)하고 결과를 집계합니다.
+    digest가 참이면 (사용자, 냉장고, 디데이)마다 요약 알림 1건만 생성합니다.
+    """
+    shards = shards or settings.NOTIFICATION_SHARDS
+    digest = settings.NOTIFICATION_DIGEST_MODE if digest is None else digest
+
+    results = {}
+    for today, timezones in sorted(notification_cohorts().items()):
+        results[today.isoformat()] = _dispatch_cohort(today, timezones, shards, digest)
+    # 모든 시간대에서 처리가 끝난 예약 정리
+    purge_due_schedules()
+    return results
+
+
+def _dispatch_cohort(today, timezones, shards, digest):
+    """현지 날짜가 today인 시간대 코호트의 알림 생성"""
+    if shards <= 1:
+        created = generate_expiry_notifications(today, digest=digest, timezones=timezones)
+        logger.info("Notifications have been created for D-3 and D-0 foods (%s %s): %s", today, timezones, created)
+        return created
+
+    ranges = split_refrigerator_ranges(today, shards)
+    if not ranges:
+        logger.info("No notifications scheduled for %s (%s).", today, timezones)
+        return {}
+    # 샤드들이 동시에 같은 파티션을 만들지 않도록 먼저 생성
+    ensure_partitions(today, months_ahead=0)
+
+    chord(
+        group(
+            generate_notification_shard.s(today.isoformat(), start, end, digest, timezones)
+            for start, end in ranges
+        )
+    )(aggregate_notification_shards.s(today.isoformat()))
+    logger.info("Dispatched %d notification shards for %s (%s).", len(ranges), today, timezones)
+    return {'shards': len(ranges)}
+
+
+@shared_task(
+    bind=True,
+    autoretry_for=(DatabaseError,),
+    retry_backoff=True,
+    retry_jitter=True,
+    max_retries=5,
+)
+def generate_notification_shard(self, today, start, end, digest=False, timezones=None):
+    """
+    냉장고 ID 구간 [start, end)의 알림 생성
+    알림 생성은 멱등하므로 실패한 샤드만 그대로 재시도합니다.
+    """
+    started = time.perf_counter()
+    created = generate_expiry_notifications(
+        date.fromisoformat(today), refrigerator_range=(start, end), digest=digest, timezones=timezones
+    )
+    return {
+        'start': start,
+        'end': end,
+        'created': created,
+        'elapsed': round(time.perf_counter() - started, 3),
+        'retries': self.request.retries,
+    }
+
+
+@shared_task
+def aggregate_notification_shards(results, today):
+    """샤드별 생성 건수와 소요 시간을 집계"""
+    created = Counter()
+    for result in results:
+        created.update(result['created'])
+
+    summary = {
+        'shards': len(results),
+        'created': dict(created),
+        'slowest_shard': max((result['elapsed'] for result in results), default=0),
+        'retried_shards': sum(1 for result in results if result['retries']),
+    }
+    logger.info("Notifications have been created for D-3 and D-0 foods (%s): %s", today, summary)
+    return summary
+
+
 @shared_task
-def send_notifications():
-    # D-3 알림 생성
-    today = date.today()
-
-    d_3_date = today + timedelta(days=3)
-    foods_d_3 = FridgeFood.objects.filter(expiration_date=d_3_date)
-    for food in foods_d_3:
-        users = RefrigeratorAccess.objects.filter(refrigerator=food.refrigerator).values_list('user', flat=True)
-        for user_id in users:
-            Notification.objects.create(
-                user_id=user_id,
-                refrigerator=food.refrigerator,
-                message=food.default_food.comment,
-                d_day="D-3"
-            )
-
-    # D-0 알림 생성
-    foods_d_0 = FridgeFood.objects.filter(expiration_date=today)
-    for food in foods_d_0:
-        food_name = food.name
-        users = RefrigeratorAccess.objects.filter(refrigerator=food.refrigerator).values_list('user', flat=True)
-        for user_id in users:
-            Notification.objects.create(
-                user_id=user_id,
-                refrigerator=food.refrigerator,
-                message=food_name,
-                d_day="D-0"
-            )
-
-    logger.info("Notifications have been created for D-3 and D-0 foods.")
-
-
-# def start_scheduler():
-#     scheduler = BackgroundScheduler()
-#     scheduler.add_job(send_notifications, 'interval', minutes=1, id="daily_notifications", replace_existing=True)
-#     scheduler.start()
-#     print("Scheduler started.")
\ No newline at end of file
+def purge_expired_notifications():
+    """보존 기간이 지난 알림 정리 (월 파티션 삭제, 남은 행은 배치 삭제)"""
+    return purge_notifications(localdate(), settings.NOTIFICATION_RETENTION_DAYS)
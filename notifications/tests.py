@@ -1,3 +1,161 @@
+from datetime import datetime, timedelta, timezone
+from unittest import mock, skipUnless
+
+from channels.exceptions import InvalidChannelLayerError
+from django.db import connection
 from django.test import TestCase
+from django.utils.timezone import localdate
+
+from foods.models import FridgeFood
+from notifications.management.commands._seed import seed_expiring_foods
+from notifications.management.commands.explain_notification_queries import access_paths, uses_index
+from notifications.models import Notification
+from notifications.partitions import PARTITION_NAME, is_partitioned
+from notifications.push import publish_notifications
+from notifications.serializers import NotificationSerializer
+from notifications.services import _insert_notifications, generate_expiry_notifications, schedule_expiry_notifications
+from refriges.models import Refrigerator, RefrigeratorAccess
+from users.models import CustomUser
+
+
+class NotificationIndexUsageTests(TestCase):
+    """알림 API 조회 경로가 기대한 인덱스를 사용하는지 실행 계획(EXPLAIN)으로 확인"""
+
+    @classmethod
+    def setUpTestData(cls):
+        refrigerators = seed_expiring_foods(localdate(), food_count=300, refrigerator_count=30)
+        generate_expiry_notifications(localdate())
+        Notification.objects.filter(refrigerator_id__in=[r.id for r in refrigerators[::2]]).update(is_read=True)
+        cls.sample = Notification.objects.select_related('user').filter(refrigerator=refrigerators[1]).first()
+
+    def setUp(self):
+        with connection.cursor() as cursor:
+            cursor.execute('ANALYZE notification')
+            if connection.vendor == 'postgresql':
+                # 데이터가 적으면 순차 스캔이 더 싸므로, 인덱스를 쓸 수 있는 쿼리인지만 확인
+                cursor.execute('SET LOCAL enable_seqscan = off')
+
+    def access_paths(self):
+        return access_paths(self.sample.user_id, self.sample.refrigerator_id, self.sample.user.timezone)
+
+    def test_access_paths_use_indexes(self):
+        for label, queryset, expected_index in self.access_paths():
+            with self.subTest(label):
+                plan = queryset.explain()
+                self.assertTrue(uses_index(plan, expected_index), f"{expected_index} not used:\n{plan}")
+
+    @skipUnless(connection.vendor == 'postgresql', "실행 계획 형태 검사는 PostgreSQL 전용")
+    def test_access_paths_need_no_scan_or_sort(self):
+        # 파티션별 인덱스 스캔을 Merge Append로 합쳐 정렬 노드 없이 created_at 순서를 얻어야 함
+        for label, queryset, _ in self.access_paths():
+            with self.subTest(label):
+                plan = queryset.explain()
+                self.assertNotIn('Seq Scan', plan)
+                self.assertNotRegex(plan, r'(?m)^\s*(->\s+)?(Incremental )?Sort\s+\(cost', f"sort node in plan:\n{plan}")
+
+
+class ExpiryNotificationGenerationTests(TestCase):
+    """같은 날 알림 생성을 다시 실행해도 중복 집계/전송하지 않는지 확인"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.today = localdate()
+        cls.user = CustomUser.objects.create(email='notify@sigkihan.test', name='notify', image=None)
+        cls.refrigerator = Refrigerator.objects.create(name='notify')
+        RefrigeratorAccess.objects.create(user=cls.user, refrigerator=cls.refrigerator, role='owner')
+        cls.food = FridgeFood.objects.create(
+            refrigerator=cls.refrigerator,
+            name='우유',
+            storage_type='refrigerated',
+            purchase_date=cls.today,
+            expiration_date=cls.today,
+            quantity=1,
+        )
+        schedule_expiry_notifications([cls.food], today=cls.today)
+
+    @mock.patch('notifications.services.publish_notifications')
+    def test_second_run_creates_and_pushes_nothing(self, publish):
+        with self.captureOnCommitCallbacks(execute=True):
+            first = generate_expiry_notifications(self.today)
+        with self.captureOnCommitCallbacks(execute=True):
+            second = generate_expiry_notifications(self.today)
+
+        self.assertEqual(first, {'D-3': 0, 'D-0': 1})
+        self.assertEqual(second, {'D-3': 0, 'D-0': 0})
+        self.assertEqual(publish.call_count, 1)
+        self.assertEqual([notification.fridge_food_id for notification in publish.call_args.args[0]], [self.food.id])
+        self.assertEqual(Notification.objects.filter(user=self.user).count(), 1)
+
+    def test_generation_creates_missing_partition(self):
+        # 정리 작업이 파티션을 미리 만들어 두지 않은 먼 미래의 날짜
+        future = self.today + timedelta(days=400)
+        food = FridgeFood.objects.create(
+            refrigerator=self.refrigerator,
+            name='간장',
+            storage_type='room_temp',
+            purchase_date=self.today,
+            expiration_date=future,
+            quantity=1,
+        )
+        schedule_expiry_notifications([food], today=self.today)
+
+        created = generate_expiry_notifications(future)
+
+        self.assertEqual(created, {'D-3': 0, 'D-0': 1})
+        self.assertTrue(Notification.objects.filter(fridge_food=food, notify_date=future).exists())
+        if is_partitioned():
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT to_regclass(%s)", [PARTITION_NAME.format(year=future.year, month=future.month)])
+                self.assertIsNotNone(cursor.fetchone()[0])
+
+    def test_conflicting_rows_are_not_returned(self):
+        def notifications():
+            return [Notification(
+                user=self.user, refrigerator=self.refrigerator, fridge_food=self.food,
+                message='우유', d_day='D-0', notify_date=self.today,
+            )]
+
+        saved = _insert_notifications(notifications(), 'fridge_food_id')
+        self.assertEqual(len(saved), 1)
+        self.assertEqual(saved[0].pk, Notification.objects.get(user=self.user).pk)
+        # 다른 실행이 먼저 저장한 알림은 건너뛰고 반환하지 않음
+        self.assertEqual(_insert_notifications(notifications(), 'fridge_food_id'), [])
+
+
+class NotificationPushTests(TestCase):
+    """알림 전송 실패가 알림 생성에 영향을 주지 않는지 확인"""
+
+    def test_unavailable_channel_layer_is_ignored(self):
+        user = CustomUser.objects.create(email='push@sigkihan.test', name='push', image=None)
+        refrigerator = Refrigerator.objects.create(name='push')
+        notification = Notification.objects.create(user=user, refrigerator=refrigerator, message='우유', d_day='D-0')
+        with mock.patch('notifications.push.get_channel_layer', side_effect=InvalidChannelLayerError("missing")):
+            with self.assertLogs('notifications.push', level='ERROR'):
+                publish_notifications([notification])
+
+
+class NotificationSerializerTests(TestCase):
+    """알림 생성 시각을 받는 사용자의 시간대로 표시하는지 확인"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = CustomUser.objects.create(
+            email='tz@sigkihan.test', name='tz', image=None, timezone='America/New_York'
+        )
+        cls.refrigerator = Refrigerator.objects.create(name='tz')
+        cls.notification = Notification.objects.create(
+            user=cls.user, refrigerator=cls.refrigerator, message='우유', d_day='D-0'
+        )
+        Notification.objects.filter(id=cls.notification.id).update(
+            created_at=datetime(2026, 10, 17, 3, 30, tzinfo=timezone.utc)
+        )
+
+    def test_created_at_uses_recipient_timezone(self):
+        notification = Notification.objects.get(id=self.notification.id)
+        self.assertEqual(NotificationSerializer(notification).data['created_at'], '2026-10-16 23:30:00')
 
-# Create your tests here.
+    def test_context_timezone_skips_user_lookup(self):
+        notification = Notification.objects.get(id=self.notification.id)
+        with self.assertNumQueries(0):
+            data = NotificationSerializer(notification, context={'user_timezone': self.user.timezone}).data
+        self.assertEqual(data['created_at'], '2026-10-16 23:30:00')
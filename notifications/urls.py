@@ -1,10 +1,13 @@
 from django.urls import path
 from .views import NotificationListView, NotificationMarkAsReadView, CreateNotificationAPIView, \
-    CreatePopupNotificationAPIView, PopupNotificationListView, PopupNotificationMarkAsReadView
+    CreatePopupNotificationAPIView, PopupNotificationListView, PopupNotificationMarkAsReadView, UnreadNotificationCountView, \
+    BulkNotificationMarkAsReadView
 
 urlpatterns = [
+    path('notifications/mark-as-read', BulkNotificationMarkAsReadView.as_view(), name='notification-bulk-mark-as-read'),
     path('<int:refrigerator_id>/notifications', NotificationListView.as_view(), name='notification-list'),
     path('<int:refrigerator_id>/notifications/popup', PopupNotificationListView.as_view(), name='popup-notification-list'),
+    path('<int:refrigerator_id>/notifications/unread-count', UnreadNotificationCountView.as_view(), name='notification-unread-count'),
     path('<int:refrigerator_id>/notifications/mark-as-read', NotificationMarkAsReadView.as_view(), name='notification-mark-as-read'),
     path('<int:refrigerator_id>/notifications/popup/mark-as-read', PopupNotificationMarkAsReadView.as_view(), name='popup-notification-mark-as-read'),
     path('<int:refrigerator_id>/notifications/create', CreateNotificationAPIView.as_view(), name='create-notification'),
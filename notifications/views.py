@@ -1,5 +1,6 @@
-from datetime import timedelta, date
+from datetime import timedelta
 
+from django.conf import settings
 from django.shortcuts import render, get_object_or_404
 from django.utils.timezone import now
 from drf_spectacular.utils import extend_schema, OpenApiResponse
@@ -7,10 +8,10 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from foods.models import FridgeFood
+from notifications.counters import counter_window, get_unread_counts
 from notifications.models import Notification
-from notifications.serializers import NotificationSerializer
-from refriges.models import RefrigeratorAccess
+from notifications.serializers import NotificationMarkAsReadSerializer, NotificationSerializer
+from notifications.services import generate_expiry_notifications, mark_notifications_read
 
 
 class NotificationListView(APIView):
@@ -35,7 +36,7 @@ class NotificationListView(APIView):
             # is_read=False
         ).order_by('-created_at')
 
-        serializer = NotificationSerializer(notifications, many=True)
+        serializer = NotificationSerializer(notifications, many=True, context={'user_timezone': request.user.timezone})
         return Response(serializer.data, status=200)
 
 
@@ -51,20 +52,48 @@ class PopupNotificationListView(APIView):
         responses={200: NotificationSerializer(many=True)}
     )
     def get(self, request, refrigerator_id):
-        today = now().date()
+        # 오늘(사용자 현지 시간) 범위 조건으로 조회해야 created_at 인덱스를 사용할 수 있음
+        start_of_today, end_of_today = counter_window('D-0', request.user.timezone)
         # 특정 냉장고와 연결된 모든 사용자들의 알림 조회
         notifications = Notification.objects.filter(
             refrigerator_id=refrigerator_id,
             user=request.user,
             d_day='D-0',
             is_read=False,
-            created_at__date=today
+            created_at__gte=start_of_today,
+            created_at__lt=end_of_today,
         )
 
-        serializer = NotificationSerializer(notifications, many=True)
+        serializer = NotificationSerializer(notifications, many=True, context={'user_timezone': request.user.timezone})
         return Response(serializer.data, status=200)
 
 
+class UnreadNotificationCountView(APIView):
+    """
+    읽지 않은 알림 수 조회 (배지 표시용)
+    """
+    permission_classes = [IsAuthenticated]
+    @extend_schema(
+        summary="읽지 않은 알림 수 조회",
+        description="특정 냉장고의 디데이별 읽지 않은 알림 수를 반환합니다. 알림 목록을 조회하지 않고 배지 표시 여부만 확인할 때 사용합니다.",
+        tags=["Notifications"],
+        responses={
+            200: OpenApiResponse(
+                description="읽지 않은 알림 수",
+                examples={
+                    "application/json": {
+                        "unread": {"D-3": 2, "D-0": 1},
+                        "has_unread": True
+                    }
+                }
+            )
+        },
+    )
+    def get(self, request, refrigerator_id):
+        unread = get_unread_counts(request.user.id, refrigerator_id, request.user.timezone)
+        return Response({"unread": unread, "has_unread": any(unread.values())}, status=200)
+
+
 class NotificationMarkAsReadView(APIView):
     """
     알림 읽음 처리
@@ -80,18 +109,13 @@ class NotificationMarkAsReadView(APIView):
         },
     )
     def post(self, request, refrigerator_id):
-        notifications = Notification.objects.filter(
-            refrigerator_id=refrigerator_id,
-            user=request.user,  # 현재 사용자와 관련된 알림만 필터링
-            is_read=False,
-            d_day='D-3'
+        # 알림 읽음 상태로 변경 (존재 여부 확인 없이 UPDATE 결과 건수로 판단)
+        updated = mark_notifications_read(
+            request.user.id, refrigerator_id=refrigerator_id, d_day='D-3', user_timezone=request.user.timezone
         )
-
-        if not notifications.exists():
+        if not updated:
             return Response({"error": "No unread notifications found for this refrigerator."}, status=404)
 
-        # 알림 읽음 상태로 변경
-        notifications.update(is_read=True)
         return Response({"message": "All unread notifications marked as read."}, status=200)
 
 
@@ -110,21 +134,54 @@ class PopupNotificationMarkAsReadView(APIView):
         },
     )
     def post(self, request, refrigerator_id):
-        notifications = Notification.objects.filter(
-            refrigerator_id=refrigerator_id,
-            user=request.user,  # 현재 사용자와 관련된 알림만 필터링
-            is_read=False,
-            d_day='D-0'
+        # 알림 읽음 상태로 변경 (존재 여부 확인 없이 UPDATE 결과 건수로 판단)
+        updated = mark_notifications_read(
+            request.user.id, refrigerator_id=refrigerator_id, d_day='D-0', user_timezone=request.user.timezone
         )
-
-        if not notifications.exists():
+        if not updated:
             return Response({"error": "No unread notifications found for this refrigerator."}, status=404)
 
-        # 알림 읽음 상태로 변경
-        notifications.update(is_read=True)
         return Response({"message": "All unread notifications marked as read."}, status=200)
 
 
+class BulkNotificationMarkAsReadView(APIView):
+    """
+    알림 일괄/선택 읽음 처리
+    """
+    permission_classes = [IsAuthenticated]
+    @extend_schema(
+        summary="알림 일괄 읽음 처리",
+        description=(
+            "알림 ID 목록(ids), 생성 시각 기준(until), 또는 모든 냉장고(all) 중 하나로 읽음 처리할 알림을 지정합니다. "
+            "refrigerator_id, d_day로 범위를 좁힐 수 있습니다."
+        ),
+        tags=["Notifications"],
+        request=NotificationMarkAsReadSerializer,
+        responses={
+            200: OpenApiResponse(
+                response={"type": "object", "properties": {"updated": {"type": "integer", "example": 3}}},
+                description="읽음 처리된 알림 수",
+            ),
+            400: {"description": "잘못된 요청"},
+        },
+    )
+    def post(self, request):
+        serializer = NotificationMarkAsReadSerializer(data=request.data)
+        if not serializer.is_valid():
+            return Response({"error": serializer.errors}, status=400)
+
+        data = serializer.validated_data
+        updated = mark_notifications_read(
+            request.user.id,
+            ids=data.get('ids'),
+            until=data.get('until'),
+            refrigerator_id=data.get('refrigerator_id'),
+            d_day=data.get('d_day'),
+            user_timezone=request.user.timezone,
+        )
+        return Response({"updated": updated}, status=200)
+
+
 class CreateNotificationAPIView(APIView):
     """
     특정 냉장고와 연결된 모든 사용자에게 알림 생성
@@ -147,20 +204,10 @@ class CreateNotificationAPIView(APIView):
         responses={201: {"description": "알림 생성 성공"}},
     )
     def post(self, request, refrigerator_id):
-
-        today = date.today()
         # D-3 알림 생성
-        d_3_date = today + timedelta(days=3)
-        foods_d_3 = FridgeFood.objects.filter(expiration_date=d_3_date)
-        for food in foods_d_3:
-            users = RefrigeratorAccess.objects.filter(refrigerator=refrigerator_id).values_list('user', flat=True)
-            for user_id in users:
-                Notification.objects.create(
-                    user_id=user_id,
-                    refrigerator=food.refrigerator,
-                    message=food.default_food.comment,
-                    d_day="D-3"
-                )
+        generate_expiry_notifications(
+            d_days=['D-3'], refrigerator_ids=[refrigerator_id], digest=settings.NOTIFICATION_DIGEST_MODE
+        )
         return Response({"message": "Notifications created for all users."}, status=201)
 
 
@@ -186,19 +233,8 @@ class CreatePopupNotificationAPIView(APIView):
         responses={201: {"description": "알림 생성 성공"}},
     )
     def post(self, request, refrigerator_id):
-
-        today = date.today()
         # D-0 알림 생성
-        foods_d_0 = FridgeFood.objects.filter(expiration_date=today)
-        print(foods_d_0)
-        for food in foods_d_0:
-            food_name = food.name
-            users = RefrigeratorAccess.objects.filter(refrigerator=refrigerator_id).values_list('user', flat=True)
-            for user_id in users:
-                Notification.objects.create(
-                    user_id=user_id,
-                    refrigerator=food.refrigerator,
-                    message=food_name,
-                    d_day="D-0"
-                )
-        return Response({"message": "Notifications created for all users."}, status=201)
\ No newline at end of file
+        generate_expiry_notifications(
+            d_days=['D-0'], refrigerator_ids=[refrigerator_id], digest=settings.NOTIFICATION_DIGEST_MODE
+        )
+        return Response({"message": "Notifications created for all users."}, status=201)
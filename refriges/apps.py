@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class RefrigeratorsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'refriges'
+
+    def ready(self):
+        # 하위 데이터 변경 시 냉장고 updated_at 갱신 시그널 등록
+        from refriges import signals  # noqa: F401
@@ -1,6 +1,8 @@
 from django.urls import path
 from .consumers import InvitationConsumer
+from notifications.consumers import NotificationConsumer
 
 websocket_urlpatterns = [
     path('ws/invitations', InvitationConsumer.as_asgi()),
-]
\ No newline at end of file
+    path('ws/notifications', NotificationConsumer.as_asgi()),
+]
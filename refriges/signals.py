@@ -0,0 +1,26 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from django.utils.timezone import now
+
+from refriges.models import Refrigerator, RefrigeratorAccess, RefrigeratorMemo
+from users.models import CustomUser
+
+
+def touch_refrigerator(refrigerator_id):
+    """냉장고 하위 데이터 변경 시 updated_at 갱신 (ETag 버전으로 사용)"""
+    Refrigerator.objects.filter(id=refrigerator_id).update(updated_at=now())
+
+
+@receiver(post_save, sender=RefrigeratorAccess)
+@receiver(post_delete, sender=RefrigeratorAccess)
+@receiver(post_save, sender=RefrigeratorMemo)
+@receiver(post_delete, sender=RefrigeratorMemo)
+def touch_on_child_change(sender, instance, **kwargs):
+    touch_refrigerator(instance.refrigerator_id)
+
+
+@receiver(post_save, sender=CustomUser)
+def touch_on_profile_change(sender, instance, created, update_fields=None, **kwargs):
+    # 구성원 목록과 메모에 사용자 이름/프로필 이미지가 포함되므로 소속 냉장고 모두 갱신 (로그인 시각 갱신은 제외)
+    if not created and update_fields != frozenset({'last_login'}):
+        Refrigerator.objects.filter(access_list__user=instance).update(updated_at=now())
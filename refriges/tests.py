@@ -1,3 +1,34 @@
-from django.test import TestCase
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
 
-# Create your tests here.
+from refriges.models import Refrigerator, RefrigeratorAccess
+from users.models import CustomUser, ProfileImage
+
+
+@override_settings(ALLOWED_HOSTS=['testserver', 'cdn.sigkihan.test'])
+class RefrigeratorETagTests(TestCase):
+    """냉장고 상세/메모 목록 ETag가 요청 scheme과 호스트를 구분하는지 확인"""
+
+    @classmethod
+    def setUpTestData(cls):
+        image = ProfileImage.objects.create(image='profile_images/default.png')
+        cls.user = CustomUser.objects.create(email='etag@sigkihan.test', name='etag', image=image)
+        cls.refrigerator = Refrigerator.objects.create(name='etag')
+        RefrigeratorAccess.objects.create(user=cls.user, refrigerator=cls.refrigerator, role='owner')
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def test_etag_depends_on_host_and_scheme(self):
+        for url in (f'/api/refrigerators/{self.refrigerator.id}', f'/api/refrigerators/{self.refrigerator.id}/memos'):
+            with self.subTest(url):
+                etag = self.client.get(url)['ETag']
+
+                self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+                other_host = self.client.get(url, HTTP_IF_NONE_MATCH=etag, HTTP_HOST='cdn.sigkihan.test')
+                self.assertEqual(other_host.status_code, 200)
+                self.assertNotEqual(other_host['ETag'], etag)
+                other_scheme = self.client.get(url, HTTP_IF_NONE_MATCH=etag, secure=True)
+                self.assertEqual(other_scheme.status_code, 200)
+                self.assertNotEqual(other_scheme['ETag'], etag)
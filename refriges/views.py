@@ -9,6 +9,8 @@ from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
 from refriges.models import RefrigeratorAccess, Refrigerator, RefrigeratorInvitation, RefrigeratorMemo
 from refriges.serializers import RefrigeratorSerializer, RefrigeratorMemberSerializer, RefrigeratorMemoSerializer, RefrigeratorInvitationSerializer
+from sigkihan.conditional import make_etag, not_modified, with_etag
+from sigkihan.media_urls import absolute_url_prefix
 
 logger = logging.getLogger(__name__)
 
@@ -63,8 +65,17 @@ class RefrigeratorViewSet(viewsets.ViewSet):
         특정 냉장고 조회
         """
         refrigerator = get_object_or_404(Refrigerator, id=refrigerator_id, access_list__user=request.user)
+        # 구성원 변경/프로필 수정 시 updated_at이 갱신되므로 변경이 없으면 직렬화 없이 304 응답
+        # (프로필 이미지 URL의 요청 scheme/호스트도 함께 반영)
+        etag = make_etag(
+            'refrigerator', refrigerator.id, refrigerator.updated_at.isoformat(), absolute_url_prefix(request),
+        )
+        response = not_modified(request, etag)
+        if response:
+            return response
+
         serializer = RefrigeratorMemberSerializer(refrigerator)
-        return Response(serializer.data, status=200)
+        return with_etag(Response(serializer.data, status=200), etag)
 
     @extend_schema(
         summary="냉장고 생성",
@@ -534,9 +545,15 @@ class RefrigeratorMemoView(APIView):
         if not RefrigeratorAccess.objects.filter(user=request.user, refrigerator=refrigerator).exists():
             return Response({"error": "You do not have access to this refrigerator."}, status=403)
 
+        # 메모 변경 시 updated_at이 갱신되므로 변경이 없으면 메모 조회 없이 304 응답 (요청 scheme/호스트도 함께 반영)
+        etag = make_etag('memos', refrigerator.id, refrigerator.updated_at.isoformat(), absolute_url_prefix(request))
+        response = not_modified(request, etag)
+        if response:
+            return response
+
         memos = RefrigeratorMemo.objects.filter(refrigerator=refrigerator)
         serializer = RefrigeratorMemoSerializer(memos, many=True)
-        return Response(serializer.data, status=200)
+        return with_etag(Response(serializer.data, status=200), etag)
 
 
 class RefrigeratorMemoDetailView(APIView):
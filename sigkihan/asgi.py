@@ -9,19 +9,25 @@ https://docs.djangoproject.com/en/5.0/howto/deployment/asgi/
 
 import os
 
-from channels.auth import AuthMiddlewareStack
-from channels.routing import ProtocolTypeRouter, URLRouter
 from django.core.asgi import get_asgi_application
 
-from refriges.routing import websocket_urlpatterns
-
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'sigkihan.settings')
+# 컨슈머가 모델을 import하므로 라우팅보다 먼저 앱 레지스트리를 초기화
+django_asgi_app = get_asgi_application()
+
+from channels.auth import AuthMiddlewareStack  # noqa: E402
+from channels.routing import ProtocolTypeRouter, URLRouter  # noqa: E402
+
+from refriges.routing import websocket_urlpatterns  # noqa: E402
+from sigkihan.middleware import JWTAuthMiddleware  # noqa: E402
 
 application = ProtocolTypeRouter({
-    "http": get_asgi_application(),
+    "http": django_asgi_app,
     "websocket": AuthMiddlewareStack(
-        URLRouter(
-            websocket_urlpatterns
+        JWTAuthMiddleware(
+            URLRouter(
+                websocket_urlpatterns
+            )
         )
     )
 
@@ -0,0 +1,33 @@
+"""
+ETag 기반 조건부 GET 도우미
+
+리소스 버전(냉장고 수정 시각, 인벤토리 버전 등)으로 강한 ETag를 만들고,
+If-None-Match가 일치하면 목록 조회와 직렬화 없이 304 응답을 반환합니다.
+"""
+import hashlib
+
+from django.utils.http import parse_etags
+from rest_framework.response import Response
+
+
+def make_etag(*parts):
+    """리소스 식별자와 버전으로 강한 ETag 생성"""
+    digest = hashlib.sha1(':'.join(str(part) for part in parts).encode()).hexdigest()
+    return f'"{digest}"'
+
+
+def not_modified(request, etag):
+    """If-None-Match가 etag와 일치하면 304 응답, 아니면 None"""
+    header = request.headers.get('If-None-Match')
+    if not header:
+        return None
+    # If-None-Match는 약한 비교를 사용하므로 W/ 접두사를 무시
+    candidates = {candidate.removeprefix('W/') for candidate in parse_etags(header)}
+    if '*' in candidates or etag in candidates:
+        return Response(status=304, headers={'ETag': etag})
+    return None
+
+
+def with_etag(response, etag):
+    response['ETag'] = etag
+    return response
@@ -0,0 +1,26 @@
+"""
+미디어 파일 절대 URL 도우미
+
+request.build_absolute_uri()는 호출할 때마다 호스트 헤더 검증과 URL 조합을 반복하므로,
+요청마다 "scheme://host" 접두어를 한 번만 계산하고 미디어 경로를 이어 붙여 절대 URL을 만듭니다.
+"""
+
+PREFIX_ATTR = '_media_url_prefix'
+
+
+def absolute_url_prefix(request):
+    """요청의 "scheme://host" 접두어 (요청 객체에 저장해 재사용)"""
+    prefix = getattr(request, PREFIX_ATTR, None)
+    if prefix is None:
+        prefix = f"{request.scheme}://{request.get_host()}"
+        setattr(request, PREFIX_ATTR, prefix)
+    return prefix
+
+
+def absolute_media_url(request, url):
+    """스토리지 URL(/media/...)을 절대 URL로 변환. 이미 절대 URL이면 그대로 반환"""
+    if not url:
+        return None
+    if request is None or '://' in url:
+        return url
+    return absolute_url_prefix(request) + url
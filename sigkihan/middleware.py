@@ -0,0 +1,30 @@
+from urllib.parse import parse_qs
+
+from channels.db import database_sync_to_async
+from channels.middleware import BaseMiddleware
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+
+
+@database_sync_to_async
+def get_user_from_token(raw_token):
+    authentication = JWTAuthentication()
+    try:
+        return authentication.get_user(authentication.get_validated_token(raw_token))
+    except (InvalidToken, AuthenticationFailed):
+        return None
+
+
+class JWTAuthMiddleware(BaseMiddleware):
+    """
+    WebSocket 연결의 쿼리 문자열 토큰(?token=<access token>)으로 사용자 인증
+    브라우저 WebSocket은 Authorization 헤더를 보낼 수 없으므로 쿼리 문자열을 사용합니다.
+    토큰이 없거나 유효하지 않으면 기존 scope['user']를 그대로 둡니다.
+    """
+    async def __call__(self, scope, receive, send):
+        token = parse_qs(scope.get('query_string', b'').decode()).get('token')
+        if token:
+            user = await get_user_from_token(token[0])
+            if user is not None:
+                scope = dict(scope, user=user)
+        return await super().__call__(scope, receive, send)
@@ -37,6 +37,7 @@ INSTALLED_APPS = [
     'drf_spectacular',
     'rest_framework',
     'rest_framework_simplejwt',
+    'adrf',
     'corsheaders',
     'django.contrib.admin',
     'django.contrib.auth',
@@ -146,11 +147,24 @@ TEMPLATES = [
 
 
 ASGI_APPLICATION = 'sigkihan.asgi.application'
-CHANNEL_LAYERS = {
-    "default": {
-        "BACKEND": "channels.layers.InMemoryChannelLayer",
-    },
-}
+# Celery 워커에서 생성한 알림을 웹 서버의 WebSocket으로 전달하려면 프로세스 간 공유되는 Redis 채널 레이어 필요
+# CHANNEL_LAYER_URL을 비우면 단일 프로세스용 인메모리 레이어 사용 (로컬 개발용)
+CHANNEL_LAYER_URL = config('CHANNEL_LAYER_URL', default='redis://localhost:6379/2')
+if CHANNEL_LAYER_URL:
+    CHANNEL_LAYERS = {
+        "default": {
+            "BACKEND": "channels_redis.core.RedisChannelLayer",
+            "CONFIG": {
+                "hosts": [CHANNEL_LAYER_URL],
+            },
+        },
+    }
+else:
+    CHANNEL_LAYERS = {
+        "default": {
+            "BACKEND": "channels.layers.InMemoryChannelLayer",
+        },
+    }
 
 WSGI_APPLICATION = 'sigkihan.wsgi.application'
 
@@ -170,6 +184,16 @@ DATABASES = {
 }
 
 
+# Cache
+# 읽지 않은 알림 카운터 등 워커 간 공유가 필요한 값은 Redis에 저장
+CACHES = {
+    'default': {
+        'BACKEND': config('CACHE_BACKEND', default='django.core.cache.backends.redis.RedisCache'),
+        'LOCATION': config('CACHE_LOCATION', default='redis://localhost:6379/1'),
+    }
+}
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.0/ref/settings/#auth-password-validators
 
@@ -270,9 +294,38 @@ CELERY_TASK_SERIALIZER = 'json'  # JSON 형식 사용
 CELERY_TIMEZONE = 'Asia/Seoul'  # 시간대 설정
 CELERY_BEAT_SCHEDULER = 'django_celery_beat.schedulers.DatabaseScheduler'
 
+# 알림 생성 샤드 수 (2 이상이면 냉장고 ID 구간별로 병렬 생성)
+NOTIFICATION_SHARDS = config('NOTIFICATION_SHARDS', default=1, cast=int)
+
+# 요약 알림 모드 (식품별 알림 대신 사용자·냉장고·디데이마다 식품 목록을 담은 알림 1건 생성)
+NOTIFICATION_DIGEST_MODE = config('NOTIFICATION_DIGEST_MODE', default=False, cast=bool)
+
+# 알림 발송 현지 시각(시). 매시 정각 실행되는 알림 작업이 현지 시각이 이 시각인 사용자만 처리
+NOTIFICATION_HOUR = config('NOTIFICATION_HOUR', default=0, cast=int)
+
+# 알림 보존 기간(일). 지난 알림은 매일 새벽 월 파티션 삭제 또는 배치 삭제로 정리
+NOTIFICATION_RETENTION_DAYS = config('NOTIFICATION_RETENTION_DAYS', default=90, cast=int)
+
+# 보관 기간 통계 집계 기간(일). 최근 기록만 사용해 포장/유통 변화가 반영되도록 함
+SHELF_LIFE_STATS_WINDOW_DAYS = config('SHELF_LIFE_STATS_WINDOW_DAYS', default=365, cast=int)
+
+# OpenAI 비동기 호출 설정 (워커당 동시 호출 수/연결 풀 크기, 응답·연결 제한 시간(초), 한도 초과 시 대기 시간(초))
+OPENAI_MAX_CONCURRENCY = config('OPENAI_MAX_CONCURRENCY', default=200, cast=int)
+OPENAI_TIMEOUT = config('OPENAI_TIMEOUT', default=30.0, cast=float)
+OPENAI_CONNECT_TIMEOUT = config('OPENAI_CONNECT_TIMEOUT', default=5.0, cast=float)
+OPENAI_QUEUE_TIMEOUT = config('OPENAI_QUEUE_TIMEOUT', default=10.0, cast=float)
+
 CELERY_BEAT_SCHEDULE = {
-    'send_notifications_daily': {
+    'send_notifications_hourly': {
         'task': 'notifications.tasks.send_notifications',
-        'schedule': crontab(minute=0, hour=0),
+        'schedule': crontab(minute=0),
+    },
+    'purge_expired_notifications_daily': {
+        'task': 'notifications.tasks.purge_expired_notifications',
+        'schedule': crontab(minute=0, hour=4),
+    },
+    'refresh_shelf_life_stats_daily': {
+        'task': 'foods.tasks.refresh_shelf_life_stats',
+        'schedule': crontab(minute=30, hour=3),
     },
 }
\ No newline at end of file
@@ -14,3 +14,8 @@ from django.core.wsgi import get_wsgi_application
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'sigkihan.settings')
 
 application = get_wsgi_application()
+
+# 워커 시작 시 디폴트 음식 검색 인덱스를 미리 생성
+from foods.catalog import warm_catalog  # noqa: E402
+
+warm_catalog()
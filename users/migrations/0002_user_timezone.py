@@ -0,0 +1,19 @@
+# Generated by Django 5.0.3 on 2026-10-17 18:04
+
+import timezone_field.fields
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='customuser',
+            name='timezone',
+            field=timezone_field.fields.TimeZoneField(db_index=True, default='Asia/Seoul', verbose_name='시간대'),
+        ),
+    ]
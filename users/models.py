@@ -1,6 +1,7 @@
 from django.contrib.auth.base_user import BaseUserManager
 from django.contrib.auth.models import AbstractBaseUser, UserManager
 from django.db import models
+from timezone_field import TimeZoneField
 
 from refriges.models import Refrigerator, RefrigeratorAccess
 
@@ -52,6 +53,7 @@ class CustomUser(AbstractBaseUser):
     is_active = models.BooleanField(default=True, verbose_name="활성 사용자 여부")
     is_staff = models.BooleanField(default=False, verbose_name="스태프 권한")  # 관리자 여부
     is_superuser = models.BooleanField(default=False, verbose_name="슈퍼유저 권한")  # 슈퍼유저 여부
+    timezone = TimeZoneField(default='Asia/Seoul', db_index=True, verbose_name="시간대")  # 알림 발송 기준 시간대
     updated_at = models.DateTimeField(auto_now=True, verbose_name="정보 수정 날짜")
     created_at = models.DateTimeField(auto_now_add=True, verbose_name="가입 날짜")
 
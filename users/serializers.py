@@ -1,13 +1,21 @@
 from rest_framework import serializers
+from timezone_field.rest_framework import TimeZoneSerializerField
 
+from sigkihan.media_urls import absolute_media_url
 from .models import ProfileImage, CustomUser
 
 
 class ProfileImageSerializer(serializers.ModelSerializer):
+    image = serializers.SerializerMethodField()
+
     class Meta:
         model = ProfileImage
         fields = ['id', 'name', 'image']
 
+    def get_image(self, obj) -> str:
+        # 행마다 build_absolute_uri를 호출하지 않고 요청별 호스트 접두어를 재사용
+        return absolute_media_url(self.context.get('request'), obj.image.url if obj.image else None)
+
 
 class UserSerializer(serializers.ModelSerializer):
     image = ProfileImageSerializer()
@@ -19,19 +27,21 @@ class UserSerializer(serializers.ModelSerializer):
 
 class UserDetailSerializer(serializers.ModelSerializer):
     image = ProfileImageSerializer()
+    timezone = TimeZoneSerializerField(use_pytz=False)
 
     class Meta:
         model = CustomUser
-        fields = ['id', 'name', 'email', 'image']
+        fields = ['id', 'name', 'email', 'image', 'timezone']
 
 
 class UserUpdateSerializer(serializers.ModelSerializer):
     image_id = serializers.IntegerField(write_only=True, required=False, help_text="ProfileImage ID")
     profile_image = serializers.SerializerMethodField()
+    timezone = TimeZoneSerializerField(use_pytz=False, required=False, help_text="IANA 시간대 (예: Asia/Seoul)")
 
     class Meta:
         model = CustomUser
-        fields = ['name', 'image_id', 'profile_image']
+        fields = ['name', 'image_id', 'profile_image', 'timezone']
 
     def get_profile_image(self, obj) -> str:
         """
@@ -64,6 +74,7 @@ class UserUpdateSerializer(serializers.ModelSerializer):
             instance.image = ProfileImage.objects.get(id=image_id)
 
         instance.name = validated_data.get('name', instance.name)
+        instance.timezone = validated_data.get('timezone', instance.timezone)
         instance.save()
         return instance
 